@@ -1,48 +1,59 @@
 from fastapi import Depends, HTTPException, status
 from app.auth.jwt_utils import get_current_user
-from app.services.event_service import get_event_by_id
+from app.auth.roles import RoleName
+from app.services.event_service import get_event_by_id, get_event_creator
 
-# ✅ Only creator or super_admin can pass
-async def require_event_creator(event_id: str, current_user: dict = Depends(get_current_user)):
+# ✅ Load the event once per request — FastAPI caches this dependency, so every
+# role check (and the route itself) shares a single database read
+async def get_event_dep(event_id: str):
     event = await get_event_by_id(event_id)
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
-    if current_user.get("role") == "super_admin":
-        return current_user
-    if current_user["email"] != event.get("createdByEmail"):
-        raise HTTPException(status_code=403, detail="Creator access required")
-    return current_user
+    return event
 
-# ✅ Only organizer or super_admin can pass
-async def require_event_organizer(event_id: str, current_user: dict = Depends(get_current_user)):
-    event = await get_event_by_id(event_id)
+# ✅ Just the creator email, for write routes whose only check is creator access.
+# The UPDATE/DELETE itself reports a missing row, so there is no need to load
+# the full event (organizers, moderators, RSVPs) first
+async def get_event_creator_dep(event_id: str):
+    event = await get_event_creator(event_id)
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
-    if current_user.get("role") == "super_admin":
+    return event
+
+# ✅ Organizer/moderator emails as frozensets for O(1) membership, built once per
+# request and shared by every role check on the route
+async def get_event_role_sets(event: dict = Depends(get_event_dep)):
+    organizers = frozenset(event.get("organizers") or ())
+    moderators = frozenset(event.get("moderators") or ())
+    # (organizers, organizers ∪ moderators) — each role check is one hash lookup
+    return organizers, organizers | moderators
+
+# ✅ Only creator or super_admin can pass
+async def require_event_creator(event: dict = Depends(get_event_dep), current_user: dict = Depends(get_current_user)):
+    if current_user.get("role") == RoleName.SUPER_ADMIN or current_user["email"] == event.get("createdByEmail"):
+        return current_user
+    raise HTTPException(status_code=403, detail="Creator access required")
+
+# ✅ require_event_creator on the primary-key creator lookup alone
+async def require_event_creator_for_write(event: dict = Depends(get_event_creator_dep), current_user: dict = Depends(get_current_user)):
+    if current_user.get("role") == RoleName.SUPER_ADMIN or current_user["email"] == event.get("createdByEmail"):
         return current_user
-    if current_user["email"] not in event.get("organizers", []):
-        raise HTTPException(status_code=403, detail="Organizer access required")
-    return current_user
+    raise HTTPException(status_code=403, detail="Creator access required")
+
+# ✅ Only organizer or super_admin can pass
+async def require_event_organizer(role_sets: tuple = Depends(get_event_role_sets), current_user: dict = Depends(get_current_user)):
+    if current_user.get("role") == RoleName.SUPER_ADMIN or current_user["email"] in role_sets[0]:
+        return current_user
+    raise HTTPException(status_code=403, detail="Organizer access required")
 
 # ✅ Moderator, organizer, or super_admin can pass
-async def require_event_moderator(event_id: str, current_user: dict = Depends(get_current_user)):
-    event = await get_event_by_id(event_id)
-    if not event:
-        raise HTTPException(status_code=404, detail="Event not found")
-    if current_user.get("role") == "super_admin":
+async def require_event_moderator(role_sets: tuple = Depends(get_event_role_sets), current_user: dict = Depends(get_current_user)):
+    if current_user.get("role") == RoleName.SUPER_ADMIN or current_user["email"] in role_sets[1]:
         return current_user
-    email = current_user["email"]
-    if email not in event.get("moderators", []) and email not in event.get("organizers", []):
-        raise HTTPException(status_code=403, detail="Moderator or Organizer access required")
-    return current_user
+    raise HTTPException(status_code=403, detail="Moderator or Organizer access required")
 
 # ✅ Return the event if current user is the creator or super_admin
-async def get_event_if_creator(event_id: str, current_user: dict = Depends(get_current_user)):
-    event = await get_event_by_id(event_id)
-    if not event:
-        raise HTTPException(status_code=404, detail="Event not found")
-    if current_user.get("role") == "super_admin":
+async def get_event_if_creator(event: dict = Depends(get_event_dep), current_user: dict = Depends(get_current_user)):
+    if current_user.get("role") == RoleName.SUPER_ADMIN or current_user["email"] == event.get("createdByEmail"):
         return event
-    if current_user["email"] != event.get("createdByEmail"):
-        raise HTTPException(status_code=403, detail="Only creator can access this")
-    return event
\ No newline at end of file
+    raise HTTPException(status_code=403, detail="Only creator can access this")
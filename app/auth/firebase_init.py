@@ -1,15 +1,22 @@
-import os
-
 import firebase_admin
-from dotenv import load_dotenv
-from firebase_admin import credentials
+from firebase_admin import credentials, firestore
 
 from app import config
 
-load_dotenv()
+# Module-level Firestore handle, created on first use and reused afterwards
+_db = None
 
 
 def initialize_firebase():
     if not firebase_admin._apps:
-        cred = credentials.Certificate(config.firebase_cred_path)
+        cred = credentials.Certificate(config.get_firebase_credentials())
         firebase_admin.initialize_app(cred)
+
+
+def get_firestore_client():
+    """Return the shared Firestore client, initializing Firebase on first call."""
+    global _db
+    if _db is None:
+        initialize_firebase()
+        _db = firestore.client()
+    return _db
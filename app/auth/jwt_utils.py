@@ -1,30 +1,79 @@
 import jwt
-import os
-from dotenv import load_dotenv
-from datetime import datetime, timedelta
+import orjson
+import time
+from jwt.algorithms import HMACAlgorithm
 from fastapi import HTTPException, Depends
 from fastapi.security import OAuth2PasswordBearer
+from app import config
 from app.utils.logger import get_logger, log_jwt_payload
 
 # Get logger for this module
 logger = get_logger(__name__)
 
-# Load environment variables
-load_dotenv()
-
-# Get secret keys from environment
-SECRET_KEY = str(os.getenv("JWT_SECRET_KEY", "").strip())
-REFRESH_SECRET_KEY = str(os.getenv("JWT_REFRESH_SECRET_KEY", "").strip())
+# Secret keys come from app.config, which loads the environment once. They are
+# encoded to bytes here so PyJWT doesn't re-encode a str on every token.
+SECRET_KEY = config.JWT_SECRET_KEY.encode("utf-8")
+REFRESH_SECRET_KEY = config.JWT_REFRESH_SECRET_KEY.encode("utf-8")
 
 ALGORITHM = "HS256"
+_ALGORITHMS = [ALGORITHM]
+
+
+class _PreparedKeyHMAC(HMACAlgorithm):
+    """HS256 that validates each secret once instead of on every token.
+
+    PyJWT's prepare_key re-encodes the key and runs PEM/SSH/DER/JWK sniffing on
+    every encode and decode. Our secrets never change, so keep the result.
+    Keys only ever come from this module, never from a token, so the cache
+    stays tiny.
+    """
+
+    def __init__(self):
+        super().__init__(HMACAlgorithm.SHA256)
+        self._prepared = {}
+
+    def prepare_key(self, key):
+        prepared = self._prepared.get(key)
+        if prepared is None:
+            prepared = self._prepared[key] = super().prepare_key(key)
+        return prepared
+
+
+class _SahanaJWT(jwt.PyJWT):
+    """PyJWT instance with the HS256 signer bound once at import and orjson
+    for the claims (PyJWT's documented payload encode/decode override points).
+
+    The per-instance ``_jws`` only exists from PyJWT 2.11, hence the bound in
+    requirements.txt.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._jws.unregister_algorithm(ALGORITHM)
+        self._jws.register_algorithm(ALGORITHM, _PreparedKeyHMAC())
+
+    def _encode_payload(self, payload, headers=None, json_encoder=None):
+        return orjson.dumps(payload)
+
+    def _decode_payload(self, decoded):
+        try:
+            payload = orjson.loads(decoded["payload"])
+        except orjson.JSONDecodeError as e:
+            raise jwt.DecodeError(f"Invalid payload string: {e}") from e
+        if not isinstance(payload, dict):
+            raise jwt.DecodeError("Invalid payload string: must be a json object")
+        return payload
+
+
+_jwt = _SahanaJWT()
 
 # OAuth2PasswordBearer to extract token from Authorization header
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="login")
 
 # Function to generate Access Token
 def create_access_token(data: dict, expires_in_minutes: int = 60) -> str:
-    expiration_time = datetime.utcnow() + timedelta(minutes=expires_in_minutes)
-    token = jwt.encode(
+    expiration_time = int(time.time()) + expires_in_minutes * 60
+    token = _jwt.encode(
         {"data": data, "exp": expiration_time},
         SECRET_KEY,
         algorithm=ALGORITHM
@@ -33,8 +82,8 @@ def create_access_token(data: dict, expires_in_minutes: int = 60) -> str:
 
 # Function to generate Refresh Token
 def create_refresh_token(data: dict, expires_in_days: int = 7) -> str:
-    expiration_time = datetime.utcnow() + timedelta(days=expires_in_days)
-    token = jwt.encode(
+    expiration_time = int(time.time()) + expires_in_days * 86400
+    token = _jwt.encode(
         {"data": data, "exp": expiration_time},
         REFRESH_SECRET_KEY,
         algorithm=ALGORITHM
@@ -43,12 +92,11 @@ def create_refresh_token(data: dict, expires_in_days: int = 7) -> str:
     return token
 
 # Function to validate Access Token
+# jwt.decode already rejects expired tokens (ExpiredSignatureError)
 def verify_access_token(token: str):
     try:
-        decoded_token = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        decoded_token = _jwt.decode(token, SECRET_KEY, algorithms=_ALGORITHMS)
         log_jwt_payload(logger, decoded_token, "ACCESS_TOKEN_VERIFIED")
-        if datetime.utcfromtimestamp(decoded_token["exp"]) < datetime.utcnow():
-            return None
         return decoded_token
     except jwt.ExpiredSignatureError:
         logger.warning("Access token has expired")
@@ -60,10 +108,8 @@ def verify_access_token(token: str):
 # Function to validate Refresh Token
 def verify_refresh_token(token: str):
     try:
-        decoded_token = jwt.decode(token, REFRESH_SECRET_KEY, algorithms=[ALGORITHM])
+        decoded_token = _jwt.decode(token, REFRESH_SECRET_KEY, algorithms=_ALGORITHMS)
         log_jwt_payload(logger, decoded_token, "REFRESH_TOKEN_VERIFIED")
-        if datetime.utcfromtimestamp(decoded_token["exp"]) < datetime.utcnow():
-            return None
         return decoded_token
     except jwt.ExpiredSignatureError:
         logger.warning("Refresh token has expired")
@@ -72,20 +118,24 @@ def verify_refresh_token(token: str):
         logger.warning("Invalid refresh token provided")
         return None
 
+# Decoded access-token payload (None when invalid). FastAPI caches dependency
+# results per request, so routes that combine validate_token, get_current_user
+# and the role checks still verify the signature only once.
+def get_token_payload(token: str = Depends(oauth2_scheme)):
+    return verify_access_token(token)
+
 # Token Required Dependency
-def validate_token(token: str = Depends(oauth2_scheme)):
-    payload = verify_access_token(token)
+def validate_token(payload: dict = Depends(get_token_payload)):
     if payload is None:
         raise HTTPException(status_code=401, detail="Invalid or expired token")
     return payload
 
 # Get Current User from Token
-def get_current_user(token: str = Depends(oauth2_scheme)):
-    payload = verify_access_token(token)
+def get_current_user(payload: dict = Depends(get_token_payload)):
     if payload is None:
         raise HTTPException(
             status_code=401,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    return payload.get("data")
\ No newline at end of file
+    return payload.get("data")
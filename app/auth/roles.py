@@ -23,13 +23,16 @@ ROLE_HIERARCHY = {
 }
 
 def require_min_role(min_role: str):
+    # Resolve the threshold and error message once when the dependency is built,
+    # so each request is a single dict lookup and int compare
+    threshold = ROLE_HIERARCHY[min_role]
+    hierarchy_get = ROLE_HIERARCHY.get
+    anonymous_level = RoleLevel.ANONYMOUS
+    detail = f"{min_role.replace('_', ' ').title()} access required"
+
     def dependency(current_user: dict = Depends(get_current_user)):
-        role = current_user.get("role", RoleName.ANONYMOUS)
-        if ROLE_HIERARCHY.get(role, RoleLevel.ANONYMOUS) < ROLE_HIERARCHY[min_role]:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"{min_role.replace('_', ' ').title()} access required"
-            )
+        if hierarchy_get(current_user.get("role", RoleName.ANONYMOUS), anonymous_level) < threshold:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=detail)
         return current_user
     return dependency
 
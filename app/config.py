@@ -1,21 +1,65 @@
 import os
 import json
 import logging
-from google.cloud import secretmanager
+from functools import lru_cache
 from dotenv import load_dotenv
 
-# Load environment variables from .env file (for local development)
+# Load environment variables from .env file (for local development). This is the
+# only place .env is parsed — everything else reads settings from this module.
 BASEDIR = os.path.abspath(os.path.dirname(__file__))
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
-def get_secret():
-    """Fetch secret from Google Secret Manager when running in Cloud Run"""
-    if os.getenv("GOOGLE_APPLICATION_CREDENTIALS"):
-        # If GOOGLE_APPLICATION_CREDENTIALS is already set, we are running locally
-        logger.info("Running locally, using existing credentials.")
-        return None
+# ─── Settings ─────────────────────────────────────────────────────────────────
+
+DATABASE_URL = os.getenv("DATABASE_URL", "")
+
+JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "").strip()
+JWT_REFRESH_SECRET_KEY = os.getenv("JWT_REFRESH_SECRET_KEY", "").strip()
+
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "10"))
+
+_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
+
+def _parse_log_level(value: str) -> str:
+    """Normalize LOG_LEVEL, refusing a name logging doesn't know."""
+    level = value.strip().upper()
+    if level not in _LOG_LEVELS:
+        raise RuntimeError(
+            f"Invalid LOG_LEVEL {value!r}; expected one of {', '.join(_LOG_LEVELS)}"
+        )
+    return level
+
+
+LOG_LEVEL = _parse_log_level(os.getenv("LOG_LEVEL", "INFO"))
+
+GOOGLE_CLIENT_ID = os.getenv("GOOGLE_CLIENT_ID")
+
+
+def require_jwt_secrets():
+    """Refuse to serve with an empty JWT secret rather than issue forgeable tokens."""
+    missing = [
+        name for name, value in (
+            ("JWT_SECRET_KEY", JWT_SECRET_KEY),
+            ("JWT_REFRESH_SECRET_KEY", JWT_REFRESH_SECRET_KEY),
+        ) if not value
+    ]
+    if missing:
+        raise RuntimeError(f"Missing required environment variables: {', '.join(missing)}")
+
+# ─── Firebase credentials ─────────────────────────────────────────────────────
+
+
+@lru_cache(maxsize=1)
+def _fetch_firebase_creds():
+    """Read the Firebase service-account JSON from Secret Manager (once per process).
+
+    The client is imported and created here, so processes that never touch
+    Firebase never open the Secret Manager gRPC channel.
+    """
+    from google.cloud import secretmanager
 
     logger.info("Running on Cloud Run, fetching secret from Secret Manager.")
     client = secretmanager.SecretManagerServiceClient()
@@ -24,20 +68,22 @@ def get_secret():
     secret_value = response.payload.data.decode("UTF-8")
     return json.loads(secret_value)
 
-# Determine the credential path
-firebase_cred_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")  # Local path
-if firebase_cred_path is None:  
-    # Running in Cloud Run, fetch secret and write to file
-    firebase_cred_path = os.getenv("FIREBASE_CRED_PATH")
-    firebase_creds = get_secret()
-    
-    if firebase_creds and firebase_cred_path is not None:  # Only write if we fetched from Secret Manager and path is valid
-        with open(firebase_cred_path, "w") as f:
-            json.dump(firebase_creds, f)
-
-# Set the environment variable for Firebase SDK
-if firebase_cred_path is not None:
-    os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = firebase_cred_path
-    logger.info(f"Using Firebase credentials from: {firebase_cred_path}")
-else:
-    logger.warning("Firebase credentials path is not set.")
\ No newline at end of file
+
+def get_secret():
+    """Fetch secret from Google Secret Manager when running in Cloud Run"""
+    if os.getenv("GOOGLE_APPLICATION_CREDENTIALS"):
+        # If GOOGLE_APPLICATION_CREDENTIALS is already set, we are running locally
+        logger.info("Running locally, using existing credentials.")
+        return None
+    return _fetch_firebase_creds()
+
+
+def get_firebase_credentials():
+    """Return what firebase_admin's credentials.Certificate needs.
+
+    Locally that is the key file named by GOOGLE_APPLICATION_CREDENTIALS. On
+    Cloud Run it is the service-account dict from Secret Manager, used
+    directly from memory — nothing is written to disk, so concurrently
+    starting workers can't race on a shared credential file.
+    """
+    return get_secret() or os.environ["GOOGLE_APPLICATION_CREDENTIALS"]
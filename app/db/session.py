@@ -1,14 +1,12 @@
-import os
 import ssl
 from urllib.parse import urlparse, urlencode, parse_qs, urlunparse
 
-from dotenv import load_dotenv
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import DeclarativeBase
 
-load_dotenv()
+from app import config
 
-DATABASE_URL = os.environ.get("DATABASE_URL", "")
+DATABASE_URL = config.DATABASE_URL
 
 # asyncpg requires postgresql+asyncpg:// scheme
 if DATABASE_URL.startswith("postgresql://"):
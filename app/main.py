@@ -1,6 +1,6 @@
+import os
 from contextlib import asynccontextmanager
-from dotenv import load_dotenv
-load_dotenv()
+from app import config  # loads .env before anything reads the environment
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -10,11 +10,13 @@ from app.routes.admin_routes import admin_router  # Import the admin router
 from app.routes.ingestion_routes import ingestion_router
 from app.routes.friend_routes import friend_router  # Import the friend router
 from app.utils.redis_client import init_redis, close_redis
+from app.utils.asgi_middleware import ResponseTimeMiddleware
 import uvicorn
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    config.require_jwt_secrets()
     await init_redis()
     yield
     await close_redis()
@@ -22,11 +24,21 @@ async def lifespan(app: FastAPI):
 
 app = FastAPI(lifespan=lifespan)
 
-origins = [
+# Ingestion is called server-to-server (Cloud Scheduler / Cloud Run Job), so it
+# lives in its own small sub-app: matched by a single Mount ahead of the main
+# route table, with its own OpenAPI schema at /api/ingest/docs. It needs no
+# CORS of its own — the parent's ASGI middleware already wraps mounted apps.
+ingest_app = FastAPI(title="Sahana ingestion")
+ingest_app.include_router(ingestion_router, tags=["Ingestion"])
+app.mount("/api/ingest", ingest_app)
+
+# A frozenset: Starlette keeps the collection as given and checks
+# `origin in allow_origins` on every CORS request
+origins = frozenset({
     "https://sahana-drab.vercel.app",  # Deployed frontend
     "http://localhost:3000", # Local React frontend
     "http://localhost:5173",       # Vite local dev
-]
+})
 # Add CORS middleware to handle cross-origin requests
 app.add_middleware(
     CORSMiddleware,
@@ -35,13 +47,25 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Pure ASGI (no BaseHTTPMiddleware) — see app/utils/asgi_middleware.py
+app.add_middleware(ResponseTimeMiddleware)
 
 # Register the auth router with a prefix for API routes
 app.include_router(auth_router, prefix="/api/auth", tags=["Authentication"])
 app.include_router(event_router, prefix="/api/events", tags=["Events"])
 app.include_router(admin_router, prefix="/api/admin", tags=["Admin"])
-app.include_router(ingestion_router, prefix="/api/ingest", tags=["Ingestion"])
 app.include_router(friend_router, prefix="/api/friends", tags=["Friends"])
 
 if __name__ == "__main__":
-     uvicorn.run("app.main:app", host="0.0.0.0", port=8080, reload=True)
\ No newline at end of file
+    # Auto-reload is for local development only (set UVICORN_RELOAD=1); it
+    # forces a single worker.
+    reload = os.getenv("UVICORN_RELOAD") == "1"
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", "8080")),
+        loop="uvloop",
+        http="httptools",
+        workers=None if reload else int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+        reload=reload,
+    )
@@ -10,6 +10,7 @@ from .user import (
     UserLoginRequest, 
     UserLoginResponse,
     PaginatedUsersResponse,
+    CursorPaginatedUsersResponse,
     UserStatsResponse,
     Location,
     UserRole
@@ -43,6 +44,7 @@ __all__ = [
     "UserLoginRequest", 
     "UserLoginResponse", 
     "PaginatedUsersResponse", 
+    "CursorPaginatedUsersResponse",
     "UserStatsResponse",
     "Location",
     "UserRole",
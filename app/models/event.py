@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional
 from datetime import datetime
 from app.models.user import Location
@@ -6,6 +6,8 @@ from app.models.user import Location
 
 # RSVP object for event participants
 class EventRsvp(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     email: str
     status: str  # "interested", "joined", "attended", "no_show"
     rating: Optional[int] = None  # Only if status == "attended"
@@ -15,7 +17,7 @@ class EventRsvp(BaseModel):
 class Event(BaseModel):
     eventName: str
     location: Optional[Location] = None
-    startTime: str  # ISO format (e.g., "2025-02-01T15:30:00Z")
+    startTime: datetime  # ISO input (e.g., "2025-02-01T15:30:00Z") parsed once here
     duration: int = Field(..., gt=0)
     categories: List[str]
     isOnline: Optional[bool] = False
@@ -23,11 +25,11 @@ class Event(BaseModel):
     imageUrl: Optional[str] = None
     createdBy: str  # email of the event creator
     createdByEmail: str
-    createdAt: Optional[str] = None
+    createdAt: Optional[datetime] = None
     description: Optional[str] = None
     # Archive/soft delete fields
     isArchived: Optional[bool] = False
-    archivedAt: Optional[str] = None
+    archivedAt: Optional[datetime] = None
     archivedBy: Optional[str] = None
     archiveReason: Optional[str] = None
     # RSVP list as array of objects
@@ -1,9 +1,10 @@
 from pydantic import BaseModel, Field
-from typing import List, TypeVar, Generic, Optional, Dict, Any
+from pydantic.dataclasses import dataclass
+from typing import List, Optional, Dict, Any
 import base64
-import json
+import binascii
 
-T = TypeVar('T')
+import orjson
 
 class PaginationParams(BaseModel):
     """Pagination parameters for API requests"""
@@ -15,9 +16,13 @@ class PaginationParams(BaseModel):
         """Calculate offset for database queries"""
         return (self.page - 1) * self.page_size
 
-class PaginatedResponse(BaseModel, Generic[T]):
-    """Generic paginated response model"""
-    items: List[T]
+class PaginatedResponse(BaseModel):
+    """Paginated response model.
+
+    Every list endpoint returns plain dicts, so items is typed concretely
+    rather than via Generic[T] — no parametrized model classes to build.
+    """
+    items: List[dict]
     total_count: int
     page: int
     page_size: int
@@ -26,11 +31,15 @@ class PaginatedResponse(BaseModel, Generic[T]):
     has_previous: bool
     
     @classmethod
-    def create(cls, items: List[T], total_count: int, page: int, page_size: int):
-        """Create a paginated response"""
-        total_pages = (total_count + page_size - 1) // page_size  # Ceiling division
+    def create(cls, items: List[dict], total_count: int, page: int, page_size: int):
+        """Create a paginated response.
+
+        Inputs come from our own services, so skip field validation with
+        model_construct — this runs once per list request.
+        """
+        total_pages = -(-total_count // page_size)  # Ceiling division
         
-        return cls(
+        return cls.model_construct(
             items=items,
             total_count=total_count,
             page=page,
@@ -40,11 +49,11 @@ class PaginatedResponse(BaseModel, Generic[T]):
             has_previous=page > 1
         )
 
-class EventPaginatedResponse(PaginatedResponse[dict]):
+class EventPaginatedResponse(PaginatedResponse):
     """Specific paginated response for events"""
     pass
 
-class UserPaginatedResponse(PaginatedResponse[dict]):
+class UserPaginatedResponse(PaginatedResponse):
     """Specific paginated response for users"""
     pass
 
@@ -72,35 +81,63 @@ class CursorPaginationParams(BaseModel):
     page_size: int = Field(default=12, ge=1, le=100, description="Number of items per page (max 100)")
     direction: str = Field(default="next", pattern="^(next|prev)$", description="Pagination direction")
 
-class CursorInfo(BaseModel):
-    """Cursor position information"""
-    start_time: Optional[str] = None  # ISO datetime string, can be None
+def encode_cursor(data: Dict[str, Any]) -> str:
+    """Opaque cursor token: orjson → URL-safe base64 without padding.
+
+    URL-safe and unpadded so clients can drop it into a query string as-is.
+    """
+    return base64.urlsafe_b64encode(orjson.dumps(data)).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Optional[Dict[str, Any]]:
+    """Inverse of encode_cursor. Returns None for anything that isn't a valid cursor.
+
+    Also accepts the older padded standard-alphabet cursors, since
+    urlsafe_b64decode still understands '+' and '/'.
+    """
+    try:
+        raw = cursor.encode("ascii")
+        data = orjson.loads(base64.urlsafe_b64decode(raw + b"=" * (-len(raw) % 4)))
+    except (UnicodeEncodeError, binascii.Error, orjson.JSONDecodeError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+@dataclass(slots=True, frozen=True)
+class CursorInfo:
+    """Cursor position information.
+
+    A slotted pydantic dataclass: built once or twice per paginated query and
+    never part of a request/response schema, so it needs no BaseModel machinery.
+    """
     event_id: str    # Document ID for tie-breaking
+    start_time: Optional[str] = None  # ISO datetime string, can be None
     
     def encode(self) -> str:
         """Encode cursor info to base64 string"""
-        cursor_dict = {"startTime": self.start_time, "eventId": self.event_id}
-        return base64.b64encode(json.dumps(cursor_dict).encode()).decode()
+        return encode_cursor({"startTime": self.start_time, "eventId": self.event_id})
     
     @classmethod
     def decode(cls, cursor: str) -> Optional["CursorInfo"]:
         """Decode base64 cursor string to CursorInfo"""
+        data = decode_cursor(cursor)
+        if data is None or "eventId" not in data:
+            return None
         try:
-            decoded = base64.b64decode(cursor.encode()).decode()
-            data = json.loads(decoded)
-            return cls(start_time=data["startTime"], event_id=data["eventId"])
-        except Exception:
+            return cls(start_time=data.get("startTime"), event_id=data["eventId"])
+        except ValueError:
             return None
 
-class CursorPaginatedResponse(BaseModel, Generic[T]):
+class CursorPaginatedResponse(BaseModel):
     """Cursor-based paginated response"""
-    items: List[T]
+    items: List[dict]
     pagination: Dict[str, Any]
 
     @classmethod
-    def create(cls, items: List[T], next_cursor: Optional[str], prev_cursor: Optional[str],
+    def create(cls, items: List[dict], next_cursor: Optional[str], prev_cursor: Optional[str],
                has_next: bool, has_previous: bool, page_size: int):
-        return cls(
+        """Create a cursor page from trusted service output (no field validation)."""
+        return cls.model_construct(
             items=items,
             pagination={
                 "next_cursor": next_cursor,
@@ -111,6 +148,6 @@ class CursorPaginatedResponse(BaseModel, Generic[T]):
             },
         )
 
-class EventCursorPaginatedResponse(CursorPaginatedResponse[dict]):
+class EventCursorPaginatedResponse(CursorPaginatedResponse):
     """Specific cursor-based paginated response for events"""
     pass
@@ -1,7 +1,8 @@
 from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
-from typing import Optional, List
-from datetime import datetime
+from typing import Any, ClassVar, Dict, Optional, List
+from datetime import date, datetime
 from enum import Enum
+import re
 
 
 def _validate_interests(v, *, allow_none: bool = False):
@@ -9,16 +10,26 @@ def _validate_interests(v, *, allow_none: bool = False):
         return None if allow_none else []
     if not isinstance(v, list):
         raise ValueError("Interests must be a list")
+    # Single pass: strip, validate and dedupe; dict keys keep first-seen order
+    cleaned = {}
     for interest in v:
-        if not isinstance(interest, str) or not interest.strip():
+        if not isinstance(interest, str) or not (interest := interest.strip()):
             raise ValueError("Each interest must be a non-empty string")
-    return list(set(interest.strip() for interest in v))
+        cleaned[interest] = None
+    return list(cleaned)
+
+
+_BIRTHDATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 
 
 def _validate_birthdate(v):
-    if v and v != "":
+    # Regex pins the shape; date.fromisoformat (C) then rejects impossible
+    # dates like 2023-02-30 — much cheaper than strptime re-parsing its format.
+    if v:
         try:
-            datetime.strptime(v, "%Y-%m-%d")
+            if not _BIRTHDATE_RE.match(v):
+                raise ValueError
+            date.fromisoformat(v)
         except ValueError:
             raise ValueError("Birthdate must be in YYYY-MM-DD format")
     return v
@@ -28,6 +39,9 @@ class UserRole(str, Enum):
     ADMIN = "admin"
 
 class Location(BaseModel):
+    # Immutable value object — nested in every user/event payload
+    model_config = ConfigDict(frozen=True)
+
     longitude: Optional[float] = None
     latitude: Optional[float] = None
     country: Optional[str] = None
@@ -36,7 +50,25 @@ class Location(BaseModel):
     formattedAddress: Optional[str] = None
     name: Optional[str] = None
 
-class User(BaseModel):
+class _ProfileValidators(BaseModel):
+    """Interests/birthdate validators shared by the writable user models.
+
+    Defined once here instead of as a copy per model; subclasses that leave
+    interests unset on partial updates set _interests_allow_none.
+    """
+    _interests_allow_none: ClassVar[bool] = False
+
+    @field_validator('interests', mode='before', check_fields=False)
+    @classmethod
+    def validate_interests(cls, v):
+        return _validate_interests(v, allow_none=cls._interests_allow_none)
+
+    @field_validator('birthdate', check_fields=False)
+    @classmethod
+    def validate_birthdate(cls, v):
+        return _validate_birthdate(v)
+
+class User(_ProfileValidators):
     """Base User model"""
     model_config = ConfigDict(from_attributes=True)
 
@@ -55,17 +87,7 @@ class User(BaseModel):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-    @field_validator('interests', mode='before')
-    @classmethod
-    def validate_interests(cls, v):
-        return _validate_interests(v)
-
-    @field_validator('birthdate')
-    @classmethod
-    def validate_birthdate(cls, v):
-        return _validate_birthdate(v)
-
-class UserCreate(BaseModel):
+class UserCreate(_ProfileValidators):
     """Model for creating new users"""
     name: str = Field(..., min_length=1, max_length=100)
     email: EmailStr
@@ -79,17 +101,7 @@ class UserCreate(BaseModel):
     location: Optional[Location] = None
     role: Optional[UserRole] = Field(default=UserRole.USER)
 
-    @field_validator('interests', mode='before')
-    @classmethod
-    def validate_interests(cls, v):
-        return _validate_interests(v)
-
-    @field_validator('birthdate')
-    @classmethod
-    def validate_birthdate(cls, v):
-        return _validate_birthdate(v)
-
-class UserUpdate(BaseModel):
+class UserUpdate(_ProfileValidators):
     """Model for updating user profiles"""
     name: Optional[str] = Field(None, min_length=1, max_length=100)
     phoneNumber: Optional[str] = Field(None, max_length=20)
@@ -101,22 +113,18 @@ class UserUpdate(BaseModel):
     location: Optional[Location] = None
     vibe_description: Optional[str] = Field(None, max_length=500)
 
-    @field_validator('interests', mode='before')
-    @classmethod
-    def validate_interests(cls, v):
-        return _validate_interests(v, allow_none=True)
-
-    @field_validator('birthdate')
-    @classmethod
-    def validate_birthdate(cls, v):
-        return _validate_birthdate(v)
+    _interests_allow_none: ClassVar[bool] = True
 
 class UserResponse(BaseModel):
-    """Model for API responses (excludes password)"""
+    """Model for API responses (excludes password).
+
+    Output models type email as plain str: the value already passed EmailStr on
+    the way in, and FastAPI re-validates response_model output per item.
+    """
     model_config = ConfigDict(from_attributes=True)
 
     name: str
-    email: EmailStr
+    email: str
     phoneNumber: Optional[str] = ""
     bio: Optional[str] = ""
     birthdate: Optional[str] = ""
@@ -133,7 +141,7 @@ class UserResponse(BaseModel):
 class UserProfile(BaseModel):
     """Public user profile for search results and friend lists"""
     name: str
-    email: EmailStr
+    email: str
     bio: Optional[str] = ""
     profession: Optional[str] = ""
     profile_picture: Optional[str] = ""
@@ -143,7 +151,7 @@ class UserProfile(BaseModel):
 class UserSearchResult(BaseModel):
     """User search result with friendship status"""
     name: str
-    email: EmailStr
+    email: str
     bio: Optional[str] = ""
     profession: Optional[str] = ""
     profile_picture: Optional[str] = ""
@@ -169,7 +177,7 @@ class UserLoginResponse(BaseModel):
     access_token: str
     refresh_token: str
     token_type: str = "bearer"
-    email: EmailStr
+    email: str
 
 class PaginatedUsersResponse(BaseModel):
     """Model for paginated user responses"""
@@ -181,6 +189,11 @@ class PaginatedUsersResponse(BaseModel):
     has_next: bool
     has_previous: bool
 
+class CursorPaginatedUsersResponse(BaseModel):
+    """Model for cursor-paginated user responses"""
+    items: List[UserResponse]
+    pagination: Dict[str, Any]
+
 class UserStatsResponse(BaseModel):
     """User statistics for dashboard"""
     events_created: int = 0
@@ -1,21 +1,100 @@
-from datetime import datetime, timezone
+import asyncio
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 from sqlalchemy import text
 
 from app.db.session import AsyncSessionLocal
 from app.models.pagination import CursorInfo, CursorPaginationParams
-from app.repositories.events.event_mapper import parse_datetime, row_to_event_dict
+from app.repositories.events.event_mapper import EVENT_SELECT_COLUMNS, parse_datetime, row_to_event_dict
 from app.utils.logger import get_repository_logger
 
+logger = get_repository_logger(__name__)
+
+# Past events are archived in chunks of this many rows, one short transaction
+# each, like the archived-event purge in event_query_repository
+_ARCHIVE_BATCH = 5000
+# Sweeps running side by side, each on its own connection; SKIP LOCKED keeps
+# them (and any concurrent admin sweep) off each other's chunks
+_ARCHIVE_WORKERS = 2
+
+_ARCHIVE_PAST_EVENTS_SQL = text("""
+    UPDATE events SET
+        is_archived    = TRUE,
+        archived_at    = NOW(),
+        archived_by    = :archived_by,
+        archive_reason = :reason,
+        updated_at     = NOW()
+    WHERE event_id IN (
+        SELECT event_id FROM events
+        WHERE is_archived = FALSE
+          AND end_time < NOW()
+        LIMIT :batch
+        FOR UPDATE SKIP LOCKED
+    )
+""")
+
+# Monthly archive counts plus the overall total from one pass over the
+# archived rows: the window sum runs over every month group before LIMIT, and
+# only archived_at is read, which idx_events_archived_at_event (009) covers.
+# Rows without archived_at fall in the NULL month, counted in the total only.
+_ARCHIVE_STATISTICS_SQL = text("""
+    SELECT TO_CHAR(archived_at, 'YYYY-MM') AS month,
+           COUNT(*) AS cnt,
+           SUM(COUNT(*)) OVER () AS total
+    FROM events
+    WHERE is_archived = TRUE
+    GROUP BY month
+    ORDER BY month DESC NULLS LAST
+    LIMIT 12
+""")
+
+
+@lru_cache(maxsize=8)
+def _archived_events_sql(by_creator: bool, with_cursor: bool, paged: bool):
+    """Archived-events listing, filtered and ordered entirely in SQL.
+
+    Every shape walks idx_events_archived_at_event or, per creator,
+    idx_events_creator_archived_at_event (migrations/009) in index order, so
+    only the rows returned are read. Built and parsed once per shape.
+    """
+    creator_clause = "AND created_by_email = :email" if by_creator else ""
+    # Paginating DESC: events with archived_at < cursor (older)
+    cursor_clause = """
+        AND (archived_at < :cursor_time
+             OR (archived_at = :cursor_time AND event_id > :cursor_id))
+    """ if with_cursor else ""
+    return text(f"""
+        SELECT {EVENT_SELECT_COLUMNS} FROM events e
+        WHERE is_archived = TRUE
+          {creator_clause}
+          {cursor_clause}
+        ORDER BY archived_at DESC NULLS LAST, event_id ASC
+        {"LIMIT :limit" if paged else ""}
+    """)
+
 
 class EventArchiveRepository:
     """Repository for event archiving and archive management operations."""
 
     def __init__(self):
-        self.logger = get_repository_logger(__name__)
+        self.logger = logger
 
     async def archive_event(self, event_id: str, archived_by: str, reason: str = "Event archived") -> bool:
+        try:
+            return await self.archive_event_returning(event_id, archived_by, reason) is not None
+        except Exception:
+            return False
+
+    async def archive_event_returning(
+        self, event_id: str, archived_by: str, reason: str = "Event archived"
+    ) -> Optional[Dict[str, Any]]:
+        """Archive one event; the same UPDATE reports whether it had already ended.
+
+        The check reads the stored end_time (migrations/010), so no ISO
+        string is parsed in Python. None means the event doesn't exist, so
+        callers need no existence read beforehand.
+        """
         try:
             async with AsyncSessionLocal() as session:
                 result = await session.execute(text("""
@@ -26,15 +105,17 @@ class EventArchiveRepository:
                         archive_reason = :reason,
                         updated_at     = NOW()
                     WHERE event_id = :eid
+                    RETURNING COALESCE(end_time < NOW(), FALSE) AS was_past
                 """), {"eid": event_id, "archived_by": archived_by, "reason": reason})
+                row = result.fetchone()
                 await session.commit()
-                ok = result.rowcount > 0
-            if ok:
-                self.logger.info(f"Event {event_id} archived by {archived_by}")
-            return ok
+            if row is None:
+                return None
+            self.logger.info("Event %s archived by %s", event_id, archived_by)
+            return {"wasPast": row.was_past}
         except Exception as e:
             self.logger.error(f"Error archiving event {event_id}: {e}", exc_info=True)
-            return False
+            raise
 
     async def unarchive_event(self, event_id: str) -> bool:
         try:
@@ -52,7 +133,7 @@ class EventArchiveRepository:
                 await session.commit()
                 ok = result.rowcount > 0
             if ok:
-                self.logger.info(f"Event {event_id} unarchived")
+                self.logger.info("Event %s unarchived", event_id)
             return ok
         except Exception as e:
             self.logger.error(f"Error unarchiving event {event_id}: {e}", exc_info=True)
@@ -62,26 +143,39 @@ class EventArchiveRepository:
         self, archived_by: str = "system",
         reason: str = "Automatically archived - event ended"
     ) -> int:
-        """Archive all past events in a single UPDATE — no row limit."""
+        """Archive every past event, _ARCHIVE_BATCH rows per transaction.
+
+        Each chunk commits on its own so a large backlog never holds row locks
+        on all of it at once. _ARCHIVE_WORKERS sweeps run concurrently so one
+        chunk's commit overlaps the next chunk's UPDATE; each chunk is a range
+        scan of idx_events_active_end_time, so only ended events are read.
+        """
+        params = {"archived_by": archived_by, "reason": reason, "batch": _ARCHIVE_BATCH}
+        counts = await asyncio.gather(
+            *(self._archive_past_events_sweep(params) for _ in range(_ARCHIVE_WORKERS))
+        )
+        count = sum(counts)
+        self.logger.info(f"Archived {count} past events (direct)")
+        return count
+
+    async def _archive_past_events_sweep(self, params: Dict[str, Any]) -> int:
+        """Archive chunks on one connection until a chunk comes back short.
+
+        A short chunk means every remaining past event is archived or locked
+        by another sweep, which will finish it.
+        """
+        count = 0
         try:
             async with AsyncSessionLocal() as session:
-                result = await session.execute(text("""
-                    UPDATE events SET
-                        is_archived    = TRUE,
-                        archived_at    = NOW(),
-                        archived_by    = :archived_by,
-                        archive_reason = :reason,
-                        updated_at     = NOW()
-                    WHERE is_archived = FALSE
-                      AND start_time + (duration * interval '1 second') < NOW()
-                """), {"archived_by": archived_by, "reason": reason})
-                await session.commit()
-                count = result.rowcount
-            self.logger.info(f"Archived {count} past events (direct)")
-            return count
+                while True:
+                    result = await session.execute(_ARCHIVE_PAST_EVENTS_SQL, params)
+                    await session.commit()
+                    count += result.rowcount
+                    if result.rowcount < _ARCHIVE_BATCH:
+                        break
         except Exception as e:
-            self.logger.error(f"Error in archive_past_events_direct: {e}", exc_info=True)
-            return 0
+            self.logger.error(f"Error in archive_past_events_direct after {count} rows: {e}", exc_info=True)
+        return count
 
     async def archive_events_by_ids(
         self, event_ids: List[str], archived_by: str,
@@ -116,14 +210,9 @@ class EventArchiveRepository:
     async def get_archived_events(self, user_email: Optional[str] = None) -> List[Dict[str, Any]]:
         """Archived events sorted by archived_at DESC. Replaces Python sort after Firestore query."""
         try:
-            where = "AND created_by_email = :email" if user_email else ""
             params = {"email": user_email} if user_email else {}
             async with AsyncSessionLocal() as session:
-                result = await session.execute(text(f"""
-                    SELECT * FROM events
-                    WHERE is_archived = TRUE {where}
-                    ORDER BY archived_at DESC NULLS LAST
-                """), params)
+                result = await session.execute(_archived_events_sql(bool(user_email), False, False), params)
                 return [row_to_event_dict(row) for row in result.fetchall()]
         except Exception as e:
             self.logger.error(f"Error getting archived events: {e}", exc_info=True)
@@ -138,31 +227,21 @@ class EventArchiveRepository:
         try:
             page_size = cursor_params.page_size if cursor_params else 20
             params: Dict[str, Any] = {"limit": page_size + 1}
-            user_clause = "AND created_by_email = :email" if user_email else ""
             if user_email:
                 params["email"] = user_email
 
-            cursor_clause = ""
+            with_cursor = False
             if cursor_params and cursor_params.cursor:
                 cursor_info = CursorInfo.decode(cursor_params.cursor)
                 if cursor_info and cursor_info.start_time:
-                    # Paginating DESC: events with archived_at < cursor (older)
-                    cursor_clause = """
-                        AND (archived_at < :cursor_time
-                             OR (archived_at = :cursor_time AND event_id > :cursor_id))
-                    """
+                    with_cursor = True
                     params["cursor_time"] = parse_datetime(cursor_info.start_time)
                     params["cursor_id"] = cursor_info.event_id
 
             async with AsyncSessionLocal() as session:
-                result = await session.execute(text(f"""
-                    SELECT * FROM events
-                    WHERE is_archived = TRUE
-                      {user_clause}
-                      {cursor_clause}
-                    ORDER BY archived_at DESC NULLS LAST, event_id ASC
-                    LIMIT :limit
-                """), params)
+                result = await session.execute(
+                    _archived_events_sql(bool(user_email), with_cursor, True), params
+                )
                 rows = result.fetchall()
 
             events = [row_to_event_dict(row) for row in rows]
@@ -172,13 +251,14 @@ class EventArchiveRepository:
 
             next_cursor = None
             if has_next and events:
+                # The keyset is (archived_at, event_id), so that's what the cursor carries
                 last = events[-1]
                 next_cursor = CursorInfo(
-                    start_time=last.get("startTime"),
+                    start_time=last.get("archivedAt"),
                     event_id=last.get("eventId")
                 ).encode()
 
-            self.logger.info(f"Retrieved {len(events)} archived events (has_next: {has_next})")
+            self.logger.debug("Retrieved %d archived events (has_next: %s)", len(events), has_next)
             return events, next_cursor
         except Exception as e:
             self.logger.error(f"Error getting paginated archived events: {e}")
@@ -186,24 +266,15 @@ class EventArchiveRepository:
 
     async def get_archive_statistics(self) -> Dict[str, Any]:
         """
-        Archive stats via SQL aggregation.
+        Archive stats via SQL aggregation, in one statement.
         Replaces loading all archived docs into Python for counting.
         """
         try:
             async with AsyncSessionLocal() as session:
-                total = await session.scalar(
-                    text("SELECT COUNT(*) FROM events WHERE is_archived = TRUE")
-                )
-                result = await session.execute(text("""
-                    SELECT TO_CHAR(archived_at, 'YYYY-MM') AS month, COUNT(*) AS cnt
-                    FROM events
-                    WHERE is_archived = TRUE AND archived_at IS NOT NULL
-                    GROUP BY month
-                    ORDER BY month DESC
-                    LIMIT 12
-                """))
-                monthly = {row.month: row.cnt for row in result.fetchall()}
-
+                result = await session.execute(_ARCHIVE_STATISTICS_SQL)
+                rows = result.fetchall()
+            total = int(rows[0].total) if rows else 0
+            monthly = {row.month: row.cnt for row in rows if row.month is not None}
             return {"total_archived": total, "monthly_archived": monthly}
         except Exception as e:
             self.logger.error(f"Error getting archive statistics: {e}", exc_info=True)
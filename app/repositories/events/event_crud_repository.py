@@ -5,9 +5,15 @@ import uuid
 from sqlalchemy import text
 
 from app.db.session import AsyncSessionLocal
-from app.repositories.events.event_mapper import build_update_params, parse_datetime, row_to_event_dict
+from app.repositories.events.event_mapper import EVENT_SELECT_COLUMNS, build_update_params, parse_datetime, row_to_event_dict
 from app.utils.logger import get_repository_logger
 
+logger = get_repository_logger(__name__)
+
+
+# Columns whose change means the event's embedding must be regenerated
+_EMBEDDING_FIELDS = frozenset({"event_name", "description", "categories", "city", "state"})
+
 
 async def _embed_event(event_dict: Dict[str, Any]) -> None:
     """Background task: generate and store embedding for an event."""
@@ -18,11 +24,75 @@ async def _embed_event(event_dict: Dict[str, Any]) -> None:
         pass  # non-critical — search falls back to SQL filters
 
 
+# One row per event with its organizers, moderators and RSVPs aggregated in.
+# Built once at import: GET /events/{id} is the hottest single-event read.
+_EVENT_DETAIL_SQL = text(f"""
+    SELECT
+        {EVENT_SELECT_COLUMNS},
+        COALESCE(
+            ARRAY_AGG(DISTINCT o.user_email) FILTER (WHERE o.user_email IS NOT NULL),
+            '{{}}'
+        ) AS organizers,
+        COALESCE(
+            ARRAY_AGG(DISTINCT m.user_email) FILTER (WHERE m.user_email IS NOT NULL),
+            '{{}}'
+        ) AS moderators,
+        COALESCE(
+            JSON_AGG(JSON_BUILD_OBJECT(
+                'email',  r.user_email,
+                'status', r.status,
+                'rating', r.rating,
+                'review', r.review
+            )) FILTER (WHERE r.user_email IS NOT NULL),
+            '[]'
+        ) AS rsvp_json
+    FROM events e
+    LEFT JOIN event_organizers o ON o.event_id = e.event_id
+    LEFT JOIN event_moderators m ON m.event_id = e.event_id
+    LEFT JOIN rsvps r ON r.event_id = e.event_id
+    WHERE e.event_id = :eid
+    GROUP BY e.event_id
+""")
+
+# A new event with its organizers and moderators, written in one statement
+# rather than an INSERT per table. created_at and is_archived are left to their
+# column defaults (the database clock, FALSE); the archive columns stay NULL.
+_CREATE_EVENT_SQL = text("""
+    WITH ev AS (
+        INSERT INTO events (
+            event_id, event_name, description,
+            latitude, longitude, city, state, country, formatted_address, location_name,
+            start_time, duration, categories, is_online, join_link, image_url,
+            created_by, created_by_email,
+            origin, source
+        ) VALUES (
+            :event_id, :event_name, :description,
+            :latitude, :longitude, :city, :state, :country, :formatted_address, :location_name,
+            :start_time, :duration, :categories, :is_online, :join_link, :image_url,
+            :created_by, :created_by_email,
+            'community', 'user'
+        )
+        RETURNING event_id
+    ), organizers AS (
+        INSERT INTO event_organizers (event_id, user_email)
+        SELECT ev.event_id, UNNEST(CAST(:organizers AS TEXT[])) FROM ev
+        ON CONFLICT DO NOTHING
+    )
+    INSERT INTO event_moderators (event_id, user_email)
+    SELECT ev.event_id, UNNEST(CAST(:moderators AS TEXT[])) FROM ev
+    ON CONFLICT DO NOTHING
+""")
+
+# Creator-only checks on writes need just this one column — a primary-key
+# lookup, without the organizer/moderator/RSVP joins of _EVENT_DETAIL_SQL
+_EVENT_CREATOR_SQL = text("SELECT created_by_email FROM events WHERE event_id = :eid")
+
+
 class EventCrudRepository:
     """Repository for basic CRUD operations on events."""
 
     def __init__(self):
-        self.logger = get_repository_logger(__name__)
+        self.logger = logger
 
     # ─── Helpers ──────────────────────────────────────────────────────────────
 
@@ -63,23 +133,7 @@ class EventCrudRepository:
         loc = data.get("location") or {}
         try:
             async with AsyncSessionLocal() as session:
-                await session.execute(text("""
-                    INSERT INTO events (
-                        event_id, event_name, description,
-                        latitude, longitude, city, state, country, formatted_address, location_name,
-                        start_time, duration, categories, is_online, join_link, image_url,
-                        created_by, created_by_email,
-                        origin, source,
-                        is_archived
-                    ) VALUES (
-                        :event_id, :event_name, :description,
-                        :latitude, :longitude, :city, :state, :country, :formatted_address, :location_name,
-                        :start_time, :duration, :categories, :is_online, :join_link, :image_url,
-                        :created_by, :created_by_email,
-                        'community', 'user',
-                        FALSE
-                    )
-                """), {
+                await session.execute(_CREATE_EVENT_SQL, {
                     "event_id":         event_id,
                     "event_name":       data["eventName"],
                     "description":      data.get("description", "No description available"),
@@ -98,24 +152,9 @@ class EventCrudRepository:
                     "image_url":        data.get("imageUrl") or None,
                     "created_by":       data.get("createdBy"),
                     "created_by_email": data.get("createdByEmail"),
+                    "organizers":       list(data.get("organizers") or []),
+                    "moderators":       list(data.get("moderators") or []),
                 })
-
-                # Organizers — batch insert
-                organizers = data.get("organizers") or []
-                if organizers:
-                    await session.execute(text("""
-                        INSERT INTO event_organizers (event_id, user_email)
-                        VALUES (:eid, :email) ON CONFLICT DO NOTHING
-                    """), [{"eid": event_id, "email": e} for e in organizers])
-
-                # Moderators — batch insert
-                moderators = data.get("moderators") or []
-                if moderators:
-                    await session.execute(text("""
-                        INSERT INTO event_moderators (event_id, user_email)
-                        VALUES (:eid, :email) ON CONFLICT DO NOTHING
-                    """), [{"eid": event_id, "email": e} for e in moderators])
-
                 await session.commit()
 
             # Fire-and-forget: generate embedding in background
@@ -137,33 +176,7 @@ class EventCrudRepository:
     async def get_event_by_id(self, event_id: str) -> Optional[Dict[str, Any]]:
         try:
             async with AsyncSessionLocal() as session:
-                result = await session.execute(text("""
-                    SELECT
-                        e.*,
-                        COALESCE(
-                            ARRAY_AGG(DISTINCT o.user_email) FILTER (WHERE o.user_email IS NOT NULL),
-                            '{}'
-                        ) AS organizers,
-                        COALESCE(
-                            ARRAY_AGG(DISTINCT m.user_email) FILTER (WHERE m.user_email IS NOT NULL),
-                            '{}'
-                        ) AS moderators,
-                        COALESCE(
-                            JSON_AGG(JSON_BUILD_OBJECT(
-                                'email',  r.user_email,
-                                'status', r.status,
-                                'rating', r.rating,
-                                'review', r.review
-                            )) FILTER (WHERE r.user_email IS NOT NULL),
-                            '[]'
-                        ) AS rsvp_json
-                    FROM events e
-                    LEFT JOIN event_organizers o ON o.event_id = e.event_id
-                    LEFT JOIN event_moderators m ON m.event_id = e.event_id
-                    LEFT JOIN rsvps r ON r.event_id = e.event_id
-                    WHERE e.event_id = :eid
-                    GROUP BY e.event_id
-                """), {"eid": event_id})
+                result = await session.execute(_EVENT_DETAIL_SQL, {"eid": event_id})
                 row = result.fetchone()
                 if not row:
                     return None
@@ -176,6 +189,17 @@ class EventCrudRepository:
             self.logger.error(f"Error getting event {event_id}: {e}")
             return None
 
+    async def get_event_creator(self, event_id: str) -> Optional[Dict[str, Any]]:
+        """Return {"createdByEmail": ...} for the event, or None if it doesn't exist."""
+        try:
+            async with AsyncSessionLocal() as session:
+                result = await session.execute(_EVENT_CREATOR_SQL, {"eid": event_id})
+                row = result.fetchone()
+            return {"createdByEmail": row.created_by_email} if row else None
+        except Exception as e:
+            self.logger.error(f"Error getting creator of event {event_id}: {e}")
+            return None
+
     async def update_event(self, event_id: str, update_data: Dict[str, Any]) -> bool:
         params = build_update_params(update_data)
         if not params:
@@ -185,29 +209,34 @@ class EventCrudRepository:
         params["event_id"] = event_id
         try:
             async with AsyncSessionLocal() as session:
+                # RETURNING hands back the embedding inputs with the update
+                # itself — no follow-up read of the event
                 result = await session.execute(
-                    text(f"UPDATE events SET {set_clause}, updated_at = NOW() WHERE event_id = :event_id"),
+                    text(f"""
+                        UPDATE events SET {set_clause}, updated_at = NOW()
+                        WHERE event_id = :event_id
+                        RETURNING event_name, description, categories, city, state
+                    """),
                     params
                 )
+                row = result.fetchone()
                 await session.commit()
-                updated = result.rowcount > 0
+
+            if row is None:
+                return False
 
             # Refresh embedding if any embedding-relevant field changed
-            _EMBEDDING_FIELDS = {"event_name", "description", "categories", "city", "state"}
-            if updated and _EMBEDDING_FIELDS.intersection(params):
-                # Fetch the updated event to build embedding text
-                event = await self.get_event_by_id(event_id)
-                if event:
-                    asyncio.create_task(_embed_event({
-                        "event_id":    event_id,
-                        "event_name":  event.get("eventName"),
-                        "description": event.get("description"),
-                        "categories":  event.get("categories", []),
-                        "city":        event.get("location", {}).get("city"),
-                        "state":       event.get("location", {}).get("state"),
-                    }))
-
-            return updated
+            if _EMBEDDING_FIELDS.intersection(params):
+                asyncio.create_task(_embed_event({
+                    "event_id":    event_id,
+                    "event_name":  row.event_name,
+                    "description": row.description,
+                    "categories":  row.categories or [],
+                    "city":        row.city,
+                    "state":       row.state,
+                }))
+
+            return True
         except Exception as e:
             self.logger.error(f"Error updating event {event_id}: {e}")
             return False
@@ -234,11 +263,13 @@ class EventCrudRepository:
                     text(f"DELETE FROM {table} WHERE event_id = :eid"),
                     {"eid": event_id}
                 )
-                for email in emails:
+                if emails:
+                    # One multi-row INSERT rather than a statement per email
                     await session.execute(text(f"""
                         INSERT INTO {table} (event_id, user_email)
-                        VALUES (:eid, :email) ON CONFLICT DO NOTHING
-                    """), {"eid": event_id, "email": email})
+                        SELECT :eid, UNNEST(CAST(:emails AS TEXT[]))
+                        ON CONFLICT DO NOTHING
+                    """), {"eid": event_id, "emails": list(emails)})
                 await session.commit()
             return True
         except Exception as e:
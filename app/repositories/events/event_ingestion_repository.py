@@ -1,4 +1,5 @@
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional, Set
 
 from sqlalchemy import text
 
@@ -6,12 +7,90 @@ from app.db.session import AsyncSessionLocal
 from app.repositories.events.event_mapper import parse_datetime
 from app.utils.logger import get_repository_logger
 
+logger = get_repository_logger(__name__)
+
+
+# Column → bind-parameter names shared by the single and bulk inserts.
+# created_at and is_archived are left out on purpose: their column defaults
+# (NOW() server-side, FALSE) fill them in.
+_INSERT_COLUMNS = (
+    "event_id", "event_name", "description",
+    "latitude", "longitude", "city", "state", "country",
+    "formatted_address", "location_name",
+    "start_time", "duration", "categories",
+    "is_online", "join_link", "image_url",
+    "created_by", "created_by_email",
+    "origin", "source", "original_id",
+    "tags", "price", "format", "sub_category",
+)
+_INSERT_COLUMN_LIST = ", ".join(_INSERT_COLUMNS)
+
+# Statements are built once at import rather than per call, so text() doesn't
+# re-scan the SQL for bind parameters on every insert/lookup
+_INSERT_ONE_SQL = text(f"""
+    INSERT INTO events ({_INSERT_COLUMN_LIST})
+    VALUES ({", ".join(f":{c}" for c in _INSERT_COLUMNS)})
+    ON CONFLICT (event_id) DO NOTHING
+""")
+_SELECT_BY_ORIGINAL_ID_SQL = text("SELECT event_id FROM events WHERE original_id = :oid LIMIT 1")
+_SELECT_EXISTING_ORIGINAL_IDS_SQL = text("SELECT original_id FROM events WHERE original_id = ANY(:oids)")
+
+
+@lru_cache(maxsize=8)
+def _bulk_insert_sql(row_count: int):
+    """Multi-row INSERT for row_count events (bind names suffixed _0.._n-1).
+
+    Ingestion chunks are nearly always the same size, so the (large) statement
+    is built and parsed once per size instead of once per batch.
+    """
+    values = ", ".join(
+        "(" + ", ".join(f":{c}_{i}" for c in _INSERT_COLUMNS) + ")"
+        for i in range(row_count)
+    )
+    return text(f"""
+        INSERT INTO events ({_INSERT_COLUMN_LIST})
+        VALUES {values}
+        ON CONFLICT DO NOTHING
+        RETURNING event_id
+    """)
+
+
+def _event_to_row(event: dict) -> Dict[str, Any]:
+    loc = event.get("location") or {}
+    return {
+        "event_id":         event.get("eventId"),
+        "event_name":       event.get("eventName", "Untitled Event"),
+        "description":      event.get("description", "No description available"),
+        "latitude":         loc.get("latitude"),
+        "longitude":        loc.get("longitude"),
+        "city":             loc.get("city"),
+        "state":            loc.get("state"),
+        "country":          loc.get("country"),
+        "formatted_address": loc.get("formattedAddress"),
+        "location_name":    loc.get("name"),
+        "start_time":       parse_datetime(event.get("startTime")),
+        "duration":         event.get("duration"),
+        "categories":       event.get("categories") or [],
+        "is_online":        event.get("isOnline", False),
+        "join_link":        event.get("joinLink") or None,
+        "image_url":        event.get("imageUrl") or None,
+        "created_by":       event.get("createdBy"),
+        "created_by_email": event.get("createdByEmail"),
+        "origin":           event.get("origin", "external"),
+        "source":           event.get("source"),
+        "original_id":      event.get("originalId") or None,
+        "tags":             event.get("tags") or [],
+        "price":            event.get("price") or None,
+        "format":           event.get("format") or None,
+        "sub_category":     event.get("subCategory") or None,
+    }
+
 
 class EventIngestionRepository:
     """Repository for external event ingestion (Ticketmaster, Eventbrite)."""
 
     def __init__(self):
-        self.logger = get_repository_logger(__name__)
+        self.logger = logger
 
     async def save_event(self, event: dict) -> bool:
         """
@@ -19,59 +98,9 @@ class EventIngestionRepository:
         Uses ON CONFLICT (event_id) DO NOTHING — idempotent, replaces Firestore .set(merge=True).
         original_id UNIQUE constraint provides a second dedup guard for the ingestion service.
         """
-        loc = event.get("location") or {}
         try:
             async with AsyncSessionLocal() as session:
-                await session.execute(text("""
-                    INSERT INTO events (
-                        event_id, event_name, description,
-                        latitude, longitude, city, state, country,
-                        formatted_address, location_name,
-                        start_time, duration, categories,
-                        is_online, join_link, image_url,
-                        created_by, created_by_email,
-                        origin, source, original_id,
-                        tags, price, format, sub_category,
-                        is_archived
-                    ) VALUES (
-                        :event_id, :event_name, :description,
-                        :latitude, :longitude, :city, :state, :country,
-                        :formatted_address, :location_name,
-                        :start_time, :duration, :categories,
-                        :is_online, :join_link, :image_url,
-                        :created_by, :created_by_email,
-                        :origin, :source, :original_id,
-                        :tags, :price, :format, :sub_category,
-                        FALSE
-                    )
-                    ON CONFLICT (event_id) DO NOTHING
-                """), {
-                    "event_id":         event.get("eventId"),
-                    "event_name":       event.get("eventName", "Untitled Event"),
-                    "description":      event.get("description", "No description available"),
-                    "latitude":         loc.get("latitude"),
-                    "longitude":        loc.get("longitude"),
-                    "city":             loc.get("city"),
-                    "state":            loc.get("state"),
-                    "country":          loc.get("country"),
-                    "formatted_address": loc.get("formattedAddress"),
-                    "location_name":    loc.get("name"),
-                    "start_time":       parse_datetime(event.get("startTime")),
-                    "duration":         event.get("duration"),
-                    "categories":       event.get("categories") or [],
-                    "is_online":        event.get("isOnline", False),
-                    "join_link":        event.get("joinLink") or None,
-                    "image_url":        event.get("imageUrl") or None,
-                    "created_by":       event.get("createdBy"),
-                    "created_by_email": event.get("createdByEmail"),
-                    "origin":           event.get("origin", "external"),
-                    "source":           event.get("source"),
-                    "original_id":      event.get("originalId") or None,
-                    "tags":             event.get("tags") or [],
-                    "price":            event.get("price") or None,
-                    "format":           event.get("format") or None,
-                    "sub_category":     event.get("subCategory") or None,
-                })
+                await session.execute(_INSERT_ONE_SQL, _event_to_row(event))
                 await session.commit()
             return True
         except Exception as e:
@@ -79,69 +108,26 @@ class EventIngestionRepository:
             return False
 
     async def save_bulk_events(self, events: list[dict]) -> int:
-        """Batch INSERT all events in a single query. Returns count of newly inserted rows."""
+        """
+        Insert all events with one multi-row INSERT (a single round trip).
+        Returns count of newly inserted rows. Rows clashing on event_id or
+        original_id are skipped by ON CONFLICT DO NOTHING.
+        Keep batches ≤ ~1000 rows to stay under Postgres' 32767 bind-parameter cap.
+        """
         if not events:
             return 0
 
-        rows = []
-        for event in events:
-            loc = event.get("location") or {}
-            rows.append({
-                "event_id":         event.get("eventId"),
-                "event_name":       event.get("eventName", "Untitled Event"),
-                "description":      event.get("description", "No description available"),
-                "latitude":         loc.get("latitude"),
-                "longitude":        loc.get("longitude"),
-                "city":             loc.get("city"),
-                "state":            loc.get("state"),
-                "country":          loc.get("country"),
-                "formatted_address": loc.get("formattedAddress"),
-                "location_name":    loc.get("name"),
-                "start_time":       parse_datetime(event.get("startTime")),
-                "duration":         event.get("duration"),
-                "categories":       event.get("categories") or [],
-                "is_online":        event.get("isOnline", False),
-                "join_link":        event.get("joinLink") or None,
-                "image_url":        event.get("imageUrl") or None,
-                "created_by":       event.get("createdBy"),
-                "created_by_email": event.get("createdByEmail"),
-                "origin":           event.get("origin", "external"),
-                "source":           event.get("source"),
-                "original_id":      event.get("originalId") or None,
-                "tags":             event.get("tags") or [],
-                "price":            event.get("price") or None,
-                "format":           event.get("format") or None,
-                "sub_category":     event.get("subCategory") or None,
-            })
+        params: Dict[str, Any] = {}
+        for i, event in enumerate(events):
+            for column, value in _event_to_row(event).items():
+                params[f"{column}_{i}"] = value
 
         try:
             async with AsyncSessionLocal() as session:
-                result = await session.execute(text("""
-                    INSERT INTO events (
-                        event_id, event_name, description,
-                        latitude, longitude, city, state, country,
-                        formatted_address, location_name,
-                        start_time, duration, categories,
-                        is_online, join_link, image_url,
-                        created_by, created_by_email,
-                        origin, source, original_id,
-                        tags, price, format, sub_category,
-                        is_archived
-                    ) VALUES (
-                        :event_id, :event_name, :description,
-                        :latitude, :longitude, :city, :state, :country,
-                        :formatted_address, :location_name,
-                        :start_time, :duration, :categories,
-                        :is_online, :join_link, :image_url,
-                        :created_by, :created_by_email,
-                        :origin, :source, :original_id,
-                        :tags, :price, :format, :sub_category,
-                        FALSE
-                    )
-                    ON CONFLICT (event_id) DO NOTHING
-                """), rows)
+                result = await session.execute(_bulk_insert_sql(len(events)), params)
+                inserted = len(result.fetchall())
                 await session.commit()
-                return result.rowcount
+                return inserted
         except Exception as e:
             self.logger.error(f"Bulk insert failed ({len(events)} events): {e}")
             # Fall back to row-by-row so a single bad event doesn't drop the whole batch
@@ -158,12 +144,23 @@ class EventIngestionRepository:
         """
         try:
             async with AsyncSessionLocal() as session:
-                result = await session.execute(
-                    text("SELECT event_id FROM events WHERE original_id = :oid LIMIT 1"),
-                    {"oid": original_id}
-                )
-                row = result.fetchone()
-                return {"event_id": row.event_id} if row else None
+                # scalar() reads the one row and closes the cursor right away
+                result = await session.execute(_SELECT_BY_ORIGINAL_ID_SQL, {"oid": original_id})
+                event_id = result.scalar()
+                return {"event_id": event_id} if event_id is not None else None
         except Exception as e:
             self.logger.error(f"Lookup by original_id failed: {e}")
             return None
+
+    async def get_existing_original_ids(self, original_ids: Iterable[str]) -> Set[str]:
+        """Bulk dedup check — which of these original_ids are already stored (one query)."""
+        ids = list(original_ids)
+        if not ids:
+            return set()
+        try:
+            async with AsyncSessionLocal() as session:
+                result = await session.execute(_SELECT_EXISTING_ORIGINAL_IDS_SQL, {"oids": ids})
+                return {row.original_id for row in result.fetchall()}
+        except Exception as e:
+            self.logger.error(f"Bulk lookup by original_id failed: {e}")
+            return set()
@@ -6,6 +6,30 @@ import datetime
 from typing import Any, Dict, List, Optional
 
 
+# The strptime formats parse_datetime accepted before it moved to
+# fromisoformat. Python 3.10's fromisoformat rejects offsets without a colon
+# ("+0000") and fractions that aren't 3 or 6 digits (".5"), so these stay as
+# the fallback for whatever it refuses.
+_FALLBACK_DATETIME_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S%z",
+    "%Y-%m-%dT%H:%M:%S.%f%z",
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%dT%H:%M",
+    "%Y-%m-%d %H:%M:%S%z",
+    "%Y-%m-%d %H:%M:%S.%f%z",
+)
+
+
+def _strptime_fallback(value: str) -> datetime.datetime | None:
+    for fmt in _FALLBACK_DATETIME_FORMATS:
+        try:
+            return datetime.datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
+
+
 def parse_datetime(value) -> datetime.datetime | None:
     """Parse an ISO datetime string or passthrough a datetime object."""
     if value is None:
@@ -14,25 +38,22 @@ def parse_datetime(value) -> datetime.datetime | None:
         if value.tzinfo is None:
             return value.replace(tzinfo=datetime.timezone.utc)
         return value
-    if isinstance(value, str):
-        for fmt in (
-            "%Y-%m-%dT%H:%M:%S%z",
-            "%Y-%m-%dT%H:%M:%S.%f%z",
-            "%Y-%m-%dT%H:%M:%SZ",
-            "%Y-%m-%dT%H:%M:%S.%fZ",
-            "%Y-%m-%dT%H:%M:%S.%f",
-            "%Y-%m-%dT%H:%M:%S",
-            "%Y-%m-%dT%H:%M",
-            "%Y-%m-%d %H:%M:%S%z",
-            "%Y-%m-%d %H:%M:%S.%f%z",
-        ):
-            try:
-                dt = datetime.datetime.strptime(value, fmt)
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=datetime.timezone.utc)
-                return dt
-            except ValueError:
-                continue
+    # One fromisoformat C call for the common shapes, with the old strptime
+    # formats behind it. A bare date still returns None, as before. The image
+    # runs Python 3.10, whose fromisoformat doesn't accept a "Z" suffix, so
+    # map it to +00:00 first.
+    if isinstance(value, str) and len(value) > 10 and value[10] in "T ":
+        if value[-1] == "Z":
+            value = value[:-1] + "+00:00"
+        try:
+            dt = datetime.datetime.fromisoformat(value)
+        except ValueError:
+            dt = _strptime_fallback(value)
+            if dt is None:
+                return None
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=datetime.timezone.utc)
+        return dt
     return None
 
 # Flat snake_case column → camelCase key used by service layer
@@ -80,6 +101,36 @@ _CAMEL_TO_COLUMN.update({
     "subCategory":  "sub_category",
 })
 
+# Timestamp keys rendered as ISO strings in event dicts
+_DATETIME_KEYS = ("startTime", "archivedAt", "unarchivedAt", "createdAt", "updatedAt")
+
+# Columns event dicts are built from, for list/detail SELECTs. Deliberately not
+# e.*: that also ships embedding (vector(1536)) and search_vector on every row,
+# neither of which the service layer or the API responses use.
+EVENT_COLUMNS = (
+    "event_id", "event_name", "description",
+    "latitude", "longitude", "city", "state", "country", "formatted_address", "location_name",
+    "start_time", "duration",
+    "categories", "tags", "category", "format", "sub_category",
+    "price", "ticket_name", "ticket_remaining", "ticket_currency", "ticket_price",
+    "is_online", "join_link", "image_url",
+    "origin", "source", "original_id",
+    "created_by", "created_by_email",
+    "is_archived", "archived_at", "archived_by", "archive_reason", "unarchived_at",
+    "created_at", "updated_at",
+)
+# Select list for queries that alias events as e
+EVENT_SELECT_COLUMNS = ", ".join(f"e.{c}" for c in EVENT_COLUMNS)
+
+# What an event card in a listing shows. Listings asked for compact=true select
+# only these, leaving out description, ticket, audit and archive columns.
+EVENT_CARD_COLUMNS = (
+    "event_id", "event_name",
+    "latitude", "longitude", "city", "state", "country", "formatted_address", "location_name",
+    "start_time", "duration", "categories", "image_url", "is_online",
+)
+EVENT_CARD_SELECT_COLUMNS = ", ".join(f"e.{c}" for c in EVENT_CARD_COLUMNS)
+
 # Columns that live as flat fields in Postgres but are nested in location
 _LOCATION_COLS = {"latitude", "longitude", "city", "state", "country",
                   "formatted_address", "location_name"}
@@ -128,9 +179,10 @@ def row_to_event_dict(
         }
 
     # Convert datetime objects to ISO strings (match Firestore behaviour)
-    for key in ("startTime", "archivedAt", "unarchivedAt", "createdAt", "updatedAt"):
-        if d.get(key) is not None and hasattr(d[key], "isoformat"):
-            d[key] = d[key].isoformat()
+    for key in _DATETIME_KEYS:
+        value = d.get(key)
+        if isinstance(value, datetime.datetime):
+            d[key] = value.isoformat()
 
     # Inject related-table data
     d["organizers"] = organizers if organizers is not None else []
@@ -162,6 +214,16 @@ def build_update_params(update_data: Dict[str, Any]) -> Dict[str, Any]:
             # Parse datetime strings for TIMESTAMPTZ columns
             if col in ("start_time", "archived_at", "unarchived_at") and isinstance(value, str):
                 value = parse_datetime(value)
+            # The archived flag is NOT NULL: every listing filters on
+            # is_archived = FALSE (the partial indexes' predicate), never on
+            # IS NOT TRUE, so a null must never reach it. Anything else that
+            # isn't a real bool (e.g. the string "false") is rejected rather
+            # than coerced by truthiness.
+            elif col == "is_archived":
+                if value is None:
+                    value = False
+                elif not isinstance(value, bool):
+                    raise ValueError("isArchived must be a boolean")
             params[col] = value
         elif key in ("duration", "categories", "tags", "price",
                      "description", "origin", "source", "format"):
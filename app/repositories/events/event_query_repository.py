@@ -1,13 +1,15 @@
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
 
 from sqlalchemy import text
 
 from app.db.session import AsyncSessionLocal
 from app.models.pagination import CursorInfo, CursorPaginationParams, EventFilters
-from app.repositories.events.event_mapper import parse_datetime, row_to_event_dict
+from app.repositories.events.event_mapper import EVENT_CARD_SELECT_COLUMNS, EVENT_SELECT_COLUMNS, parse_datetime, row_to_event_dict
 from app.utils.logger import get_repository_logger
 
+logger = get_repository_logger(__name__)
+
 
 _STATE_FULL_NAMES = {
     "AL": "Alabama", "AK": "Alaska", "AZ": "Arizona", "AR": "Arkansas",
@@ -26,11 +28,123 @@ _STATE_FULL_NAMES = {
 }
 
 
+# Keyset predicates for _paginate_events, keyed by direction
+_CURSOR_CLAUSES = {
+    "next": """
+        AND (e.start_time > :cursor_time
+             OR (e.start_time = :cursor_time AND e.event_id > :cursor_id))
+    """,
+    "prev": """
+        AND (e.start_time < :cursor_time
+             OR (e.start_time = :cursor_time AND e.event_id < :cursor_id))
+    """,
+}
+
+
+@lru_cache(maxsize=256)
+def _events_page_sql(extra_where: str, direction: str, with_cursor: bool, compact: bool = False):
+    """Keyset page statement for one WHERE shape.
+
+    extra_where only varies with which filters are active (values are bind
+    params), so the handful of shapes seen in practice are assembled and
+    parsed by text() once instead of on every page request. compact selects
+    just the event card columns.
+    """
+    cursor_clause = _CURSOR_CLAUSES[direction] if with_cursor else ""
+    order = "ASC" if direction == "next" else "DESC"
+    return text(f"""
+        SELECT {EVENT_CARD_SELECT_COLUMNS if compact else EVENT_SELECT_COLUMNS}
+        FROM events e
+        WHERE e.is_archived = FALSE
+          {extra_where}
+          {cursor_clause}
+        ORDER BY e.start_time {order} NULLS LAST, e.event_id {order}
+        LIMIT :limit
+    """)
+
+
+# EventFilters field → (SQL condition, value → bind params). Unset fields
+# (None or "") are skipped; is_online=False is a real filter.
+_EVENT_FILTER_SPEC = (
+    ("city",
+     "(LOWER(e.city) = LOWER(:city)"
+     " OR LOWER(COALESCE(e.formatted_address, '')) LIKE '%' || LOWER(:city) || '%')",
+     lambda v: {"city": v}),
+    ("state",
+     "(LOWER(e.state) = LOWER(:state)"
+     " OR LOWER(e.state) = LOWER(:state_full)"
+     " OR LOWER(COALESCE(e.formatted_address, '')) LIKE '%' || LOWER(:state_full) || '%')",
+     lambda v: {"state": v, "state_full": _STATE_FULL_NAMES.get(v.upper(), v)}),
+    # Use array overlap operator so PostgreSQL can use the GIN index on categories.
+    # Normalise to lowercase on both sides since categories are mixed-case in DB.
+    ("category",
+     "array(SELECT LOWER(x) FROM unnest(e.categories) x) @> ARRAY[LOWER(:category)]",
+     lambda v: {"category": v}),
+    ("is_online", "e.is_online = :is_online", lambda v: {"is_online": v}),
+    ("creator_email", "LOWER(e.created_by_email) = LOWER(:creator_email)", lambda v: {"creator_email": v}),
+    # Use OR between terms so any matching word is sufficient.
+    # "baseball games Sports" → "baseball OR games OR Sports"
+    # → websearch_to_tsquery produces 'baseball' | 'game' | 'sport'
+    ("keywords",
+     "e.search_vector @@ websearch_to_tsquery('english', :keywords)",
+     lambda v: {"keywords": " OR ".join(v.split())}),
+    ("start_date", "e.start_time >= :start_date", lambda v: {"start_date": parse_datetime(v)}),
+    ("end_date", "e.start_time <= :end_date", lambda v: {"end_date": parse_datetime(v)}),
+)
+
+_ALL_EVENTS_SQL = text(f"""
+    SELECT {EVENT_SELECT_COLUMNS} FROM events e
+    WHERE is_archived = FALSE
+    ORDER BY start_time ASC NULLS LAST, event_id ASC
+    LIMIT 5000
+""")
+
+# The external events shown for a city/state: the first 200 by start time.
+# get_external_events returns them; get_attended_categories_by_user reads only
+# their RSVP emails and categories. Values are bind params, so each statement
+# is built once here rather than per request.
+_EXTERNAL_EVENTS_FROM = """
+    FROM events e
+    WHERE is_archived = FALSE
+      AND LOWER(city) = LOWER(:city) AND LOWER(state) = LOWER(:state)
+      AND origin = 'external'
+    ORDER BY start_time ASC NULLS LAST, event_id ASC
+    LIMIT 200
+"""
+
+_EXTERNAL_EVENTS_SQL = text(f"SELECT {EVENT_SELECT_COLUMNS} {_EXTERNAL_EVENTS_FROM}")
+
+_ATTENDED_CATEGORIES_SQL = text(f"""
+    SELECT r.user_email, ARRAY_AGG(DISTINCT c.category) AS categories
+    FROM (SELECT e.event_id, e.categories {_EXTERNAL_EVENTS_FROM}) e
+    JOIN rsvps r ON r.event_id = e.event_id AND r.status = 'attended'
+    CROSS JOIN LATERAL unnest(e.categories) AS c(category)
+    GROUP BY r.user_email
+""")
+
+_EVENTS_FOR_ARCHIVING_SQL = text(f"""
+    SELECT {EVENT_SELECT_COLUMNS} FROM events e
+    WHERE is_archived = FALSE
+      AND end_time < NOW()  -- idx_events_active_end_time
+    LIMIT 1000
+""")
+
+# Rows fetched per round trip when streaming
+_STREAM_BATCH = 500
+
+# An admin-triggered purge deletes old archived events in chunks of this many
+# rows, one short transaction each, so it never holds locks on the whole backlog
+_PURGE_BATCH = 5000
+
+# The expiry rule lives in the database (migrations/008), which also runs it nightly
+_PURGE_ARCHIVED_EVENTS_SQL = text("SELECT purge_archived_events(:batch)")
+
+
 class EventQueryRepository:
     """Repository for complex event queries and filtering operations."""
 
     def __init__(self):
-        self.logger = get_repository_logger(__name__)
+        self.logger = logger
 
     # ─── Shared cursor pagination helper ──────────────────────────────────────
 
@@ -39,12 +153,14 @@ class EventQueryRepository:
         cursor_params: CursorPaginationParams,
         extra_where: str = "",
         extra_params: Optional[Dict[str, Any]] = None,
+        compact: bool = False,
     ) -> Tuple[List[Dict[str, Any]], Optional[str], Optional[str], bool, bool]:
         """
         Generic keyset cursor pagination over events.
 
         extra_where: additional AND conditions (not including is_archived)
         extra_params: bind params for extra_where
+        compact: select only EVENT_CARD_COLUMNS
         """
         cursor_info = None
         if cursor_params.cursor:
@@ -58,36 +174,15 @@ class EventQueryRepository:
         if extra_params:
             params.update(extra_params)
 
-        cursor_clause = ""
-        if cursor_info and cursor_info.start_time:
-            cursor_dt = parse_datetime(cursor_info.start_time)
-            if cursor_params.direction == "next":
-                cursor_clause = """
-                    AND (e.start_time > :cursor_time
-                         OR (e.start_time = :cursor_time AND e.event_id > :cursor_id))
-                """
-            else:
-                cursor_clause = """
-                    AND (e.start_time < :cursor_time
-                         OR (e.start_time = :cursor_time AND e.event_id < :cursor_id))
-                """
-            params["cursor_time"] = cursor_dt
+        with_cursor = bool(cursor_info and cursor_info.start_time)
+        if with_cursor:
+            params["cursor_time"] = parse_datetime(cursor_info.start_time)
             params["cursor_id"] = cursor_info.event_id
 
-        order = "ASC" if cursor_params.direction == "next" else "DESC"
-
-        sql = f"""
-            SELECT e.*
-            FROM events e
-            WHERE e.is_archived = FALSE
-              {extra_where}
-              {cursor_clause}
-            ORDER BY e.start_time {order} NULLS LAST, e.event_id {order}
-            LIMIT :limit
-        """
+        sql = _events_page_sql(extra_where, cursor_params.direction, with_cursor, compact)
 
         async with AsyncSessionLocal() as session:
-            result = await session.execute(text(sql), params)
+            result = await session.execute(sql, params)
             rows = result.fetchall()
 
         events = [row_to_event_dict(row) for row in rows]
@@ -126,51 +221,16 @@ class EventQueryRepository:
         self, filters: Optional[EventFilters]
     ) -> Tuple[str, Dict[str, Any]]:
         """Convert EventFilters → (WHERE clause fragment, params dict)."""
-        conditions, params = [], {}
         if not filters:
             return "", {}
 
-        if filters.city:
-            conditions.append(
-                "(LOWER(e.city) = LOWER(:city)"
-                " OR LOWER(COALESCE(e.formatted_address, '')) LIKE '%' || LOWER(:city) || '%')"
-            )
-            params["city"] = filters.city
-        if filters.state:
-            state_full = _STATE_FULL_NAMES.get(filters.state.upper(), filters.state)
-            conditions.append(
-                "(LOWER(e.state) = LOWER(:state)"
-                " OR LOWER(e.state) = LOWER(:state_full)"
-                " OR LOWER(COALESCE(e.formatted_address, '')) LIKE '%' || LOWER(:state_full) || '%')"
-            )
-            params["state"] = filters.state
-            params["state_full"] = state_full
-        if filters.category:
-            # Use array overlap operator so PostgreSQL can use the GIN index on categories.
-            # Normalise to lowercase on both sides since categories are mixed-case in DB.
-            conditions.append(
-                "array(SELECT LOWER(x) FROM unnest(e.categories) x) @> ARRAY[LOWER(:category)]"
-            )
-            params["category"] = filters.category
-        if filters.is_online is not None:
-            conditions.append("e.is_online = :is_online")
-            params["is_online"] = filters.is_online
-        if filters.creator_email:
-            conditions.append("LOWER(e.created_by_email) = LOWER(:creator_email)")
-            params["creator_email"] = filters.creator_email
-        if filters.keywords:
-            # Use OR between terms so any matching word is sufficient.
-            # "baseball games Sports" → "baseball OR games OR Sports"
-            # → websearch_to_tsquery produces 'baseball' | 'game' | 'sport'
-            kw_or = " OR ".join(filters.keywords.split())
-            conditions.append("e.search_vector @@ websearch_to_tsquery('english', :keywords)")
-            params["keywords"] = kw_or
-        if filters.start_date:
-            conditions.append("e.start_time >= :start_date")
-            params["start_date"] = parse_datetime(filters.start_date)
-        if filters.end_date:
-            conditions.append("e.start_time <= :end_date")
-            params["end_date"] = parse_datetime(filters.end_date)
+        conditions, params = [], {}
+        for field, condition, to_params in _EVENT_FILTER_SPEC:
+            value = getattr(filters, field)
+            if value is None or value == "":
+                continue
+            conditions.append(condition)
+            params.update(to_params(value))
 
         clause = (" AND " + " AND ".join(conditions)) if conditions else ""
         return clause, params
@@ -181,37 +241,45 @@ class EventQueryRepository:
         """Get all non-archived events (hard-capped at 5000 for admin use)."""
         try:
             async with AsyncSessionLocal() as session:
-                result = await session.execute(text("""
-                    SELECT * FROM events
-                    WHERE is_archived = FALSE
-                    ORDER BY start_time ASC NULLS LAST, event_id ASC
-                    LIMIT 5000
-                """))
+                result = await session.execute(_ALL_EVENTS_SQL)
                 return [row_to_event_dict(row) for row in result.fetchall()]
         except Exception as e:
             self.logger.error(f"Error getting all events: {e}", exc_info=True)
             return []
 
+    async def iter_all_events(self) -> AsyncIterator[Dict[str, Any]]:
+        """Same rows as get_all_events, streamed from a server-side cursor.
+
+        Rows arrive in batches of _STREAM_BATCH and are mapped one at a time,
+        so the caller never holds the whole result set. Errors propagate —
+        the caller decides how to end a partially sent stream.
+        """
+        async with AsyncSessionLocal() as session:
+            result = await session.stream(_ALL_EVENTS_SQL.execution_options(yield_per=_STREAM_BATCH))
+            async for row in result:
+                yield row_to_event_dict(row)
+
     async def get_all_events_paginated(
         self,
         cursor_params: CursorPaginationParams,
         filters: Optional[EventFilters] = None,
+        compact: bool = False,
     ) -> Tuple[List[Dict[str, Any]], Optional[str], Optional[str], bool, bool]:
         try:
             extra_where, params = self._build_filter_clause(filters)
-            return await self._paginate_events(cursor_params, extra_where, params)
+            return await self._paginate_events(cursor_params, extra_where, params, compact)
         except Exception as e:
             self.logger.error(f"Error in cursor pagination: {e}", exc_info=True)
             return [], None, None, False, False
 
     async def get_nearby_events_paginated(
-        self, city: str, state: str, cursor_params: CursorPaginationParams
+        self, city: str, state: str, cursor_params: CursorPaginationParams, compact: bool = False
     ) -> Tuple[List[Dict[str, Any]], Optional[str], Optional[str], bool, bool]:
         """Non-archived community + external events in a city/state."""
         try:
             extra_where = "AND LOWER(e.city) = LOWER(:city) AND LOWER(e.state) = LOWER(:state) AND e.origin IN ('manual', 'external', 'community')"
             params = {"city": city, "state": state}
-            return await self._paginate_events(cursor_params, extra_where, params)
+            return await self._paginate_events(cursor_params, extra_where, params, compact)
         except Exception as e:
             self.logger.error(f"Error in nearby events pagination: {e}", exc_info=True)
             return [], None, None, False, False
@@ -220,19 +288,26 @@ class EventQueryRepository:
         """Non-paginated external events for a city/state (capped at 200)."""
         try:
             async with AsyncSessionLocal() as session:
-                result = await session.execute(text("""
-                    SELECT * FROM events
-                    WHERE is_archived = FALSE
-                      AND LOWER(city) = LOWER(:city) AND LOWER(state) = LOWER(:state)
-                      AND origin = 'external'
-                    ORDER BY start_time ASC NULLS LAST, event_id ASC
-                    LIMIT 200
-                """), {"city": city, "state": state})
+                result = await session.execute(_EXTERNAL_EVENTS_SQL, {"city": city, "state": state})
                 return [row_to_event_dict(row) for row in result.fetchall()]
         except Exception as e:
             self.logger.error(f"Error getting external events: {e}", exc_info=True)
             return []
 
+    async def get_attended_categories_by_user(self, city: str, state: str) -> Dict[str, Set[str]]:
+        """Categories of the external events each user attended in a city/state.
+
+        Reads only the RSVP emails and category arrays for the same 200 events
+        get_external_events would return — not whole event rows.
+        """
+        try:
+            async with AsyncSessionLocal() as session:
+                result = await session.execute(_ATTENDED_CATEGORIES_SQL, {"city": city, "state": state})
+                return {row.user_email: set(row.categories) for row in result.fetchall()}
+        except Exception as e:
+            self.logger.error(f"Error getting attended categories: {e}", exc_info=True)
+            return {}
+
     async def get_external_events_paginated(
         self, city: str, state: str, cursor_params: CursorPaginationParams
     ) -> Tuple[List[Dict[str, Any]], Optional[str], Optional[str], bool, bool]:
@@ -248,37 +323,35 @@ class EventQueryRepository:
         """Events whose end time has passed and are not yet archived."""
         try:
             async with AsyncSessionLocal() as session:
-                result = await session.execute(text("""
-                    SELECT * FROM events
-                    WHERE is_archived = FALSE
-                      AND start_time + (duration * interval '1 second') < NOW()
-                    LIMIT 1000
-                """))
+                result = await session.execute(_EVENTS_FOR_ARCHIVING_SQL)
                 return [row_to_event_dict(row) for row in result.fetchall()]
         except Exception as e:
             self.logger.error(f"Error getting events for archiving: {e}", exc_info=True)
             return []
 
-    async def delete_events_before_today(self) -> int:
-        """Delete archived events whose start_time is before today."""
+    async def purge_archived_events(self) -> int:
+        """Delete archived events that started before today, on demand.
+
+        The database already purges these nightly; this drains whatever is
+        left in _PURGE_BATCH chunks, committing after each, until a chunk
+        comes back short.
+        """
+        params = {"batch": _PURGE_BATCH}
+        deleted = 0
         try:
-            today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
             async with AsyncSessionLocal() as session:
-                result = await session.execute(text("""
-                    DELETE FROM events
-                    WHERE event_id IN (
-                        SELECT event_id FROM events
-                        WHERE is_archived = TRUE AND start_time < :today
-                        LIMIT 5000
-                    )
-                """), {"today": today})
-                await session.commit()
-                count = result.rowcount
-            self.logger.info(f"Deleted {count} old events")
-            return count
+                while True:
+                    result = await session.execute(_PURGE_ARCHIVED_EVENTS_SQL, params)
+                    await session.commit()
+                    batch_deleted = result.scalar()
+                    deleted += batch_deleted
+                    if batch_deleted < _PURGE_BATCH:
+                        break
         except Exception as e:
-            self.logger.error(f"Error deleting old events: {e}", exc_info=True)
-            return 0
+            self.logger.error(f"Error purging archived events after {deleted} rows: {e}", exc_info=True)
+            return deleted
+        self.logger.info(f"Purged {deleted} archived events")
+        return deleted
 
     async def search_events_by_embedding(
         self,
@@ -325,7 +398,7 @@ class EventQueryRepository:
             where_clause = " AND ".join(conditions)
             async with AsyncSessionLocal() as session:
                 result = await session.execute(text(f"""
-                    SELECT e.*,
+                    SELECT {EVENT_SELECT_COLUMNS},
                            1 - (e.embedding <=> CAST(:query_vec AS vector)) AS similarity_score
                     FROM events e
                     WHERE {where_clause}
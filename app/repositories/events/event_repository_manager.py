@@ -1,12 +1,13 @@
 from .event_crud_repository import EventCrudRepository
 from .event_query_repository import EventQueryRepository
 from .event_archive_repository import EventArchiveRepository
-from .event_rsvp_repository import EventRsvpRepository
 from app.services.event_rsvp_service import EventRsvpService
 from .event_user_repository import EventUserRepository
-from app.models.pagination import PaginationParams, EventFilters, CursorPaginationParams
+from app.models.pagination import EventFilters, CursorPaginationParams
 from app.utils.logger import get_repository_logger
-from typing import Tuple, List, Optional, Dict, Any
+from typing import AsyncIterator, Tuple, List, Optional, Dict, Any
+
+logger = get_repository_logger(__name__)
 
 class EventRepositoryManager:
     """
@@ -14,14 +15,13 @@ class EventRepositoryManager:
     This class delegates operations to the appropriate specialized repository.
     """
     
-    def __init__(self):
+    def __init__(self, rsvp_service: Optional[EventRsvpService] = None):
         self.crud_repo = EventCrudRepository()
         self.query_repo = EventQueryRepository()
         self.archive_repo = EventArchiveRepository()
-        self.rsvp_repo = EventRsvpRepository()
-        self.rsvp_service = EventRsvpService()
+        self.rsvp_service = rsvp_service or EventRsvpService()
         self.user_repo = EventUserRepository()
-        self.logger = get_repository_logger(__name__)
+        self.logger = logger
 
     # CRUD Operations (delegated to EventCrudRepository)
     async def create_event(self, data: dict) -> dict:
@@ -32,6 +32,10 @@ class EventRepositoryManager:
         """Get event by ID"""
         return await self.crud_repo.get_event_by_id(event_id)
 
+    async def get_event_creator(self, event_id: str) -> dict | None:
+        """Get just the event's creator email"""
+        return await self.crud_repo.get_event_creator(event_id)
+
     async def update_event(self, event_id: str, update_data: dict) -> bool:
         """Update an event"""
         return await self.crud_repo.update_event(event_id, update_data)
@@ -45,27 +49,35 @@ class EventRepositoryManager:
         """Get all events (non-paginated)"""
         return await self.query_repo.get_all_events()
 
-    async def get_all_events_paginated(self, cursor_params: CursorPaginationParams, filters: Optional[EventFilters] = None) -> Tuple[List[Dict[str, Any]], Optional[str], Optional[str], bool, bool]:
+    def iter_all_events(self) -> AsyncIterator[Dict[str, Any]]:
+        """Stream all non-archived events without materializing the list"""
+        return self.query_repo.iter_all_events()
+
+    async def get_all_events_paginated(self, cursor_params: CursorPaginationParams, filters: Optional[EventFilters] = None, compact: bool = False) -> Tuple[List[Dict[str, Any]], Optional[str], Optional[str], bool, bool]:
         """Get cursor-paginated events with optional filters"""
-        return await self.query_repo.get_all_events_paginated(cursor_params, filters)
+        return await self.query_repo.get_all_events_paginated(cursor_params, filters, compact)
 
-    async def get_nearby_events_paginated(self, city: str, state: str, cursor_params: CursorPaginationParams) -> Tuple[List[Dict[str, Any]], Optional[str], Optional[str], bool, bool]:
+    async def get_nearby_events_paginated(self, city: str, state: str, cursor_params: CursorPaginationParams, compact: bool = False) -> Tuple[List[Dict[str, Any]], Optional[str], Optional[str], bool, bool]:
         """Get cursor-paginated events in a specific city and state"""
-        return await self.query_repo.get_nearby_events_paginated(city, state, cursor_params)
+        return await self.query_repo.get_nearby_events_paginated(city, state, cursor_params, compact)
 
     async def get_events_for_archiving(self) -> List[Dict[str, Any]]:
         """Get events that should be archived"""
         return await self.query_repo.get_events_for_archiving()
 
-    async def delete_events_before_today(self) -> int:
-        """Delete events that ended before today"""
-        return await self.query_repo.delete_events_before_today()
+    async def purge_archived_events(self) -> int:
+        """Delete archived events that started before today"""
+        return await self.query_repo.purge_archived_events()
 
     # Archive Operations (delegated to EventArchiveRepository)
     async def archive_event(self, event_id: str, archived_by: str, reason: str = "Event archived") -> bool:
         """Archive a single event"""
         return await self.archive_repo.archive_event(event_id, archived_by, reason)
 
+    async def archive_event_returning(self, event_id: str, archived_by: str, reason: str = "Event archived") -> Optional[Dict[str, Any]]:
+        """Archive a single event, returning {"wasPast": bool} (None if missing)"""
+        return await self.archive_repo.archive_event_returning(event_id, archived_by, reason)
+
     async def unarchive_event(self, event_id: str) -> bool:
         """Unarchive a single event"""
         return await self.archive_repo.unarchive_event(event_id)
@@ -4,15 +4,39 @@ from sqlalchemy import text
 
 from app.db.session import AsyncSessionLocal
 from app.models.pagination import CursorInfo, CursorPaginationParams
-from app.repositories.events.event_mapper import parse_datetime, row_to_event_dict
+from app.repositories.events.event_mapper import EVENT_SELECT_COLUMNS, parse_datetime, row_to_event_dict
 from app.utils.logger import get_repository_logger
 
+logger = get_repository_logger(__name__)
+
+# Set a user's RSVP status in one statement, like an array union: insert the
+# row, or update it only when the status actually changes, so a repeated RSVP
+# writes nothing. Rating/review are cleared when moving to a non-attended
+# status. Selects whether the event exists and is open, since rowcount can't
+# tell a no-op repeat from a missing event.
+_UPSERT_RSVP_SQL = text("""
+    WITH target AS (
+        SELECT 1 FROM events WHERE event_id = :eid AND is_archived = FALSE
+    ), upsert AS (
+        INSERT INTO rsvps (event_id, user_email, status)
+        SELECT :eid, :email, :status
+        WHERE EXISTS (SELECT 1 FROM target)
+        ON CONFLICT (event_id, user_email) DO UPDATE SET
+            status     = EXCLUDED.status,
+            rating     = CASE WHEN EXCLUDED.status = 'attended' THEN rsvps.rating  ELSE NULL END,
+            review     = CASE WHEN EXCLUDED.status = 'attended' THEN rsvps.review ELSE NULL END,
+            updated_at = NOW()
+        WHERE rsvps.status IS DISTINCT FROM EXCLUDED.status
+    )
+    SELECT EXISTS (SELECT 1 FROM target)
+""")
+
 
 class EventRsvpRepository:
     """Repository for RSVP-related operations."""
 
     def __init__(self):
-        self.logger = get_repository_logger(__name__)
+        self.logger = logger
 
     # ─── Helpers ──────────────────────────────────────────────────────────────
 
@@ -39,31 +63,23 @@ class EventRsvpRepository:
     async def _set_rsvp_status(self, event_id: str, user_email: str, status: str) -> bool:
         """
         Upsert RSVP row — replaces the Firestore read-modify-write of the entire
-        rsvpList array. Clears rating/review when moving to non-attended status.
+        rsvpList array. The event guard (exists and not archived) is part of the
+        same statement, so this is one atomic round trip; False means the event
+        is missing or archived.
         """
         try:
             async with AsyncSessionLocal() as session:
-                # Verify event exists
-                exists = await session.scalar(
-                    text("SELECT 1 FROM events WHERE event_id = :eid"),
-                    {"eid": event_id}
+                result = await session.execute(
+                    _UPSERT_RSVP_SQL, {"eid": event_id, "email": user_email, "status": status}
                 )
-                if not exists:
-                    self.logger.warning(f"Event {event_id} not found for RSVP")
-                    return False
-
-                await session.execute(text("""
-                    INSERT INTO rsvps (event_id, user_email, status)
-                    VALUES (:eid, :email, :status)
-                    ON CONFLICT (event_id, user_email) DO UPDATE SET
-                        status     = EXCLUDED.status,
-                        rating     = CASE WHEN EXCLUDED.status = 'attended' THEN rsvps.rating  ELSE NULL END,
-                        review     = CASE WHEN EXCLUDED.status = 'attended' THEN rsvps.review ELSE NULL END,
-                        updated_at = NOW()
-                """), {"eid": event_id, "email": user_email, "status": status})
+                available = bool(result.scalar())
                 await session.commit()
 
-            self.logger.info(f"User {user_email} RSVP'd to event {event_id} as {status}")
+            if not available:
+                self.logger.warning(f"Event {event_id} not found or archived for RSVP")
+                return False
+
+            self.logger.debug("User %s RSVP'd to event %s as %s", user_email, event_id, status)
             return True
         except Exception as e:
             self.logger.error(f"Error setting RSVP status for {user_email} → {event_id}: {e}", exc_info=True)
@@ -83,6 +99,9 @@ class EventRsvpRepository:
                 result = await session.execute(text("""
                     DELETE FROM rsvps
                     WHERE event_id = :eid AND user_email = :email AND status = :status
+                      AND EXISTS (
+                          SELECT 1 FROM events WHERE event_id = :eid AND is_archived = FALSE
+                      )
                 """), {"eid": event_id, "email": user_email, "status": status})
                 await session.commit()
                 removed = result.rowcount > 0
@@ -131,7 +150,7 @@ class EventRsvpRepository:
                 })
                 await session.commit()
                 updated = result.rowcount > 0
-            self.logger.info(f"RSVP status updated: {user_email} → {event_id} = {status}")
+            self.logger.debug("RSVP status updated: %s → %s = %s", user_email, event_id, status)
             return updated
         except Exception as e:
             self.logger.error(f"Error updating RSVP status for {user_email}: {e}", exc_info=True)
@@ -139,6 +158,16 @@ class EventRsvpRepository:
 
     # ─── Getters ──────────────────────────────────────────────────────────────
 
+    async def get_event_archived_flag(self, event_id: str) -> Optional[bool]:
+        """is_archived for an event, or None when the event doesn't exist."""
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                text("SELECT is_archived FROM events WHERE event_id = :eid"),
+                {"eid": event_id}
+            )
+            row = result.fetchone()
+        return None if row is None else bool(row.is_archived)
+
     async def get_rsvp_count(self, event_id: str) -> int:
         try:
             async with AsyncSessionLocal() as session:
@@ -151,6 +180,24 @@ class EventRsvpRepository:
             self.logger.error(f"Error getting RSVP count for event {event_id}: {e}", exc_info=True)
             return 0
 
+    async def get_rsvp_summary(self, event_id: str) -> Tuple[str, int]:
+        """(event_name, RSVP count) in one statement, for the RSVP action responses."""
+        try:
+            async with AsyncSessionLocal() as session:
+                result = await session.execute(text("""
+                    SELECT e.event_name,
+                           (SELECT COUNT(*) FROM rsvps r WHERE r.event_id = e.event_id) AS rsvp_count
+                    FROM events e
+                    WHERE e.event_id = :eid
+                """), {"eid": event_id})
+                row = result.fetchone()
+        except Exception as e:
+            self.logger.error(f"Error getting RSVP summary for event {event_id}: {e}", exc_info=True)
+            return "", 0
+        if row is None:
+            return "", 0
+        return row.event_name or "", int(row.rsvp_count)
+
     async def get_rsvp_list(self, event_id: str) -> List[Dict[str, Any]]:
         try:
             async with AsyncSessionLocal() as session:
@@ -163,6 +210,54 @@ class EventRsvpRepository:
             self.logger.error(f"Error getting RSVP list for event {event_id}: {e}", exc_info=True)
             return []
 
+    async def get_rsvp_list_paginated(
+        self, event_id: str, cursor_params: CursorPaginationParams
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Keyset-paginated RSVP list for an event, most recently updated first.
+
+        The cursor carries (updated_at, user_email) of the last row, so each page
+        is an index range scan however deep it is — no OFFSET rows to skip.
+        A cursor that doesn't decode raises ValueError, which is the client's
+        error rather than ours, so it is raised before the logging handler.
+        """
+        page_size = cursor_params.page_size
+        params: Dict[str, Any] = {"eid": event_id, "limit": page_size + 1}
+        cursor_clause = ""
+
+        if cursor_params.cursor:
+            cursor_info = CursorInfo.decode(cursor_params.cursor)
+            if not cursor_info or not cursor_info.start_time:
+                raise ValueError("Invalid cursor format")
+            cursor_clause = "AND (updated_at, user_email) < (:cursor_time, :cursor_email)"
+            params["cursor_time"] = parse_datetime(cursor_info.start_time)
+            params["cursor_email"] = cursor_info.event_id
+
+        try:
+            async with AsyncSessionLocal() as session:
+                result = await session.execute(text(f"""
+                    SELECT user_email, status, rating, review, updated_at
+                    FROM rsvps
+                    WHERE event_id = :eid
+                      {cursor_clause}
+                    ORDER BY updated_at DESC, user_email DESC
+                    LIMIT :limit
+                """), params)
+                rows = result.fetchall()
+
+            next_cursor = None
+            if len(rows) > page_size:
+                rows = rows[:page_size]
+                last = rows[-1]
+                next_cursor = CursorInfo(
+                    start_time=last.updated_at.isoformat(),
+                    event_id=last.user_email
+                ).encode()
+
+            return [self._rsvp_row_to_dict(r) for r in rows], next_cursor
+        except Exception as e:
+            self.logger.error(f"Error getting paginated RSVP list for event {event_id}: {e}", exc_info=True)
+            raise
+
     async def get_rsvp_statistics(self, event_id: str) -> Dict[str, Any]:
         try:
             async with AsyncSessionLocal() as session:
@@ -196,8 +291,8 @@ class EventRsvpRepository:
         """
         try:
             async with AsyncSessionLocal() as session:
-                result = await session.execute(text("""
-                    SELECT e.*
+                result = await session.execute(text(f"""
+                    SELECT {EVENT_SELECT_COLUMNS}
                     FROM events e
                     JOIN rsvps r ON r.event_id = e.event_id
                     WHERE r.user_email = :email
@@ -213,30 +308,32 @@ class EventRsvpRepository:
         self, user_email: str, cursor_params: Optional[CursorPaginationParams] = None,
         status: Optional[str] = None
     ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
-        """Cursor-paginated RSVPs for a user, optionally filtered by status."""
-        try:
-            page_size = cursor_params.page_size if cursor_params else 20
-            params: Dict[str, Any] = {"email": user_email, "limit": page_size + 1}
-            cursor_clause = ""
-            status_clause = ""
-
-            if status:
-                status_clause = "AND r.status = :status"
-                params["status"] = status
-
-            if cursor_params and cursor_params.cursor:
-                cursor_info = CursorInfo.decode(cursor_params.cursor)
-                if cursor_info and cursor_info.start_time:
-                    cursor_clause = """
-                        AND (e.start_time > :cursor_time
-                             OR (e.start_time = :cursor_time AND e.event_id > :cursor_id))
-                    """
-                    params["cursor_time"] = parse_datetime(cursor_info.start_time)
-                    params["cursor_id"] = cursor_info.event_id
+        """Cursor-paginated RSVPs for a user, optionally filtered by status.
 
+        Like get_rsvp_list_paginated, an undecodable cursor raises ValueError
+        before the logging handler.
+        """
+        page_size = cursor_params.page_size if cursor_params else 20
+        params: Dict[str, Any] = {"email": user_email, "limit": page_size + 1}
+        cursor_clause = ""
+        status_clause = ""
+
+        if status:
+            status_clause = "AND r.status = :status"
+            params["status"] = status
+
+        if cursor_params and cursor_params.cursor:
+            cursor_info = CursorInfo.decode(cursor_params.cursor)
+            if not cursor_info or not cursor_info.start_time:
+                raise ValueError("Invalid cursor format")
+            cursor_clause = "AND (e.start_time, e.event_id) > (:cursor_time, :cursor_id)"
+            params["cursor_time"] = parse_datetime(cursor_info.start_time)
+            params["cursor_id"] = cursor_info.event_id
+
+        try:
             async with AsyncSessionLocal() as session:
                 result = await session.execute(text(f"""
-                    SELECT e.*
+                    SELECT {EVENT_SELECT_COLUMNS}
                     FROM events e
                     JOIN rsvps r ON r.event_id = e.event_id
                     WHERE r.user_email = :email
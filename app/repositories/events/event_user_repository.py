@@ -4,15 +4,17 @@ from sqlalchemy import text
 
 from app.db.session import AsyncSessionLocal
 from app.models.pagination import CursorInfo, CursorPaginationParams
-from app.repositories.events.event_mapper import parse_datetime, row_to_event_dict
+from app.repositories.events.event_mapper import EVENT_SELECT_COLUMNS, parse_datetime, row_to_event_dict
 from app.utils.logger import get_repository_logger
 
+logger = get_repository_logger(__name__)
+
 
 class EventUserRepository:
     """Repository for user-specific event queries."""
 
     def __init__(self):
-        self.logger = get_repository_logger(__name__)
+        self.logger = logger
 
     # ─── Shared pagination helper ──────────────────────────────────────────────
 
@@ -25,7 +27,7 @@ class EventUserRepository:
         """
         Shared keyset cursor pagination for user-scoped event queries.
 
-        sql_template must contain {cursor_clause} and {limit} placeholders
+        sql_template must contain {columns}, {cursor_clause} and {limit} placeholders
         and already include ORDER BY e.start_time ASC, e.event_id ASC.
         """
         page_size = cursor_params.page_size if cursor_params else 20
@@ -42,7 +44,7 @@ class EventUserRepository:
                 params["cursor_time"] = parse_datetime(cursor_info.start_time)
                 params["cursor_id"] = cursor_info.event_id
 
-        sql = sql_template.format(cursor_clause=cursor_clause, limit=":limit")
+        sql = sql_template.format(columns=EVENT_SELECT_COLUMNS, cursor_clause=cursor_clause, limit=":limit")
 
         async with AsyncSessionLocal() as session:
             result = await session.execute(text(sql), params)
@@ -69,8 +71,8 @@ class EventUserRepository:
         """Non-archived events created by email. Replaces Firestore where + Python filter."""
         try:
             async with AsyncSessionLocal() as session:
-                result = await session.execute(text("""
-                    SELECT * FROM events
+                result = await session.execute(text(f"""
+                    SELECT {EVENT_SELECT_COLUMNS} FROM events e
                     WHERE is_archived = FALSE AND created_by_email = :email
                     ORDER BY start_time ASC NULLS LAST, event_id ASC
                 """), {"email": email})
@@ -86,7 +88,7 @@ class EventUserRepository:
     ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
         try:
             sql = """
-                SELECT e.* FROM events e
+                SELECT {columns} FROM events e
                 WHERE e.is_archived = FALSE
                   AND e.created_by_email = :email
                   {cursor_clause}
@@ -96,7 +98,7 @@ class EventUserRepository:
             events, next_cursor = await self._paginate_user_events(
                 sql, {"email": email}, cursor_params
             )
-            self.logger.info(f"Retrieved {len(events)} events by creator {email}")
+            self.logger.debug("Retrieved %d events by creator %s", len(events), email)
             return events, next_cursor
         except Exception as e:
             self.logger.error(f"Error getting paginated events by creator {email}: {e}")
@@ -111,8 +113,8 @@ class EventUserRepository:
         """
         try:
             async with AsyncSessionLocal() as session:
-                result = await session.execute(text("""
-                    SELECT e.*
+                result = await session.execute(text(f"""
+                    SELECT {EVENT_SELECT_COLUMNS}
                     FROM events e
                     JOIN event_organizers o ON o.event_id = e.event_id
                     WHERE o.user_email = :email AND e.is_archived = FALSE
@@ -130,7 +132,7 @@ class EventUserRepository:
     ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
         try:
             sql = """
-                SELECT e.*
+                SELECT {columns}
                 FROM events e
                 JOIN event_organizers o ON o.event_id = e.event_id
                 WHERE o.user_email = :email AND e.is_archived = FALSE
@@ -152,8 +154,8 @@ class EventUserRepository:
         """
         try:
             async with AsyncSessionLocal() as session:
-                result = await session.execute(text("""
-                    SELECT e.*
+                result = await session.execute(text(f"""
+                    SELECT {EVENT_SELECT_COLUMNS}
                     FROM events e
                     JOIN event_moderators m ON m.event_id = e.event_id
                     WHERE m.user_email = :email AND e.is_archived = FALSE
@@ -171,7 +173,7 @@ class EventUserRepository:
     ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
         try:
             sql = """
-                SELECT e.*
+                SELECT {columns}
                 FROM events e
                 JOIN event_moderators m ON m.event_id = e.event_id
                 WHERE m.user_email = :email AND e.is_archived = FALSE
@@ -195,11 +197,13 @@ class EventUserRepository:
                     text(f"DELETE FROM {table} WHERE event_id = :eid"),
                     {"eid": event_id}
                 )
-                for email in emails:
+                if emails:
+                    # One multi-row INSERT rather than a statement per email
                     await session.execute(text(f"""
                         INSERT INTO {table} (event_id, user_email)
-                        VALUES (:eid, :email) ON CONFLICT DO NOTHING
-                    """), {"eid": event_id, "email": email})
+                        SELECT :eid, UNNEST(CAST(:emails AS TEXT[]))
+                        ON CONFLICT DO NOTHING
+                    """), {"eid": event_id, "emails": list(emails)})
                 await session.commit()
             return True
         except Exception as e:
@@ -1,4 +1,3 @@
-from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 import uuid
 
@@ -7,6 +6,8 @@ from sqlalchemy import text
 from app.db.session import AsyncSessionLocal
 from app.utils.logger import get_service_logger
 
+logger = get_service_logger(__name__)
+
 
 def _row_to_dict(row) -> Dict[str, Any]:
     return dict(row._mapping)
@@ -19,7 +20,7 @@ class FriendRepository:
     """
 
     def __init__(self):
-        self.logger = get_service_logger(__name__)
+        self.logger = logger
 
     # ==================== BASIC CRUD OPERATIONS ====================
 
@@ -1,13 +1,52 @@
+import asyncio
 from datetime import date
-from passlib.context import CryptContext
+
+import bcrypt
 from sqlalchemy import text
 from typing import Any, Dict, List, Optional, Tuple
 
+from app import config
 from app.db.session import AsyncSessionLocal
 from app.models.pagination import CursorInfo, CursorPaginationParams, PaginationParams, UserFilters
 from app.utils.logger import get_service_logger
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+logger = get_service_logger(__name__)
+
+# Each extra bcrypt round doubles hashing cost. 10 rounds (~50 ms/verify) is the
+# OWASP baseline; the old passlib default of 12 cost ~4x more per login. Existing
+# hashes keep verifying at whatever cost they were created with.
+BCRYPT_ROUNDS = config.BCRYPT_ROUNDS
+
+# bcrypt only looks at the first 72 bytes. passlib truncated silently, and
+# bcrypt>=4.1 raises instead, so truncate explicitly to keep old hashes valid.
+_BCRYPT_MAX_BYTES = 72
+
+
+def hash_password(password: str) -> str:
+    """Hash a password with the native bcrypt extension ($2b$ ident)."""
+    secret = password.encode("utf-8")[:_BCRYPT_MAX_BYTES]
+    return bcrypt.hashpw(secret, bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode("ascii")
+
+
+def check_password(password: str, password_hash: str) -> bool:
+    """Check a password against a stored bcrypt hash."""
+    secret = password.encode("utf-8")[:_BCRYPT_MAX_BYTES]
+    try:
+        return bcrypt.checkpw(secret, password_hash.encode("ascii"))
+    except ValueError:
+        # Malformed or non-bcrypt hash
+        return False
+
+
+# Every user column except the 1536-dim embedding, which only the semantic
+# recommendation path needs. Used for every user read so lookups and lists
+# don't ship it.
+_USER_COLUMNS = """
+    email, name, password_hash, google_uid, role,
+    bio, profession, phone_number, birthdate, profile_picture, interests,
+    latitude, longitude, city, state, country, formatted_address, location_name,
+    vibe_description, created_at, updated_at
+"""
 
 
 def _row_to_user_dict(row) -> Dict[str, Any]:
@@ -38,7 +77,7 @@ def _row_to_user_dict(row) -> Dict[str, Any]:
 
 class UserRepository:
     def __init__(self):
-        self.logger = get_service_logger(__name__)
+        self.logger = logger
 
     # ─── Helpers ──────────────────────────────────────────────────────────────
 
@@ -59,7 +98,7 @@ class UserRepository:
     async def get_all_users(self) -> List[Dict[str, Any]]:
         try:
             async with AsyncSessionLocal() as session:
-                result = await session.execute(text("SELECT * FROM users LIMIT 1000"))
+                result = await session.execute(text(f"SELECT {_USER_COLUMNS} FROM users LIMIT 1000"))
                 return [_row_to_user_dict(row) for row in result.fetchall()]
         except Exception as e:
             self.logger.error(f"Error retrieving users: {e}")
@@ -100,22 +139,35 @@ class UserRepository:
         self, pagination: PaginationParams, filters: Optional[UserFilters] = None
     ) -> Tuple[List[Dict[str, Any]], int]:
         try:
-            where, count_params = self._build_filter_clause(filters)
-            data_params = {**count_params, "limit": pagination.page_size, "offset": pagination.offset}
+            where, params = self._build_filter_clause(filters)
+            data_params = {**params, "limit": pagination.page_size, "offset": pagination.offset}
             async with AsyncSessionLocal() as session:
-                count_result = await session.execute(
-                    text(f"SELECT COUNT(*) FROM users {where}"), count_params
-                )
-                total = count_result.scalar() or 0
-
+                # The total rides along on every row via a window count, so the
+                # page and its total come from one scan instead of a separate
+                # COUNT(*) pass over the same filter.
                 result = await session.execute(text(f"""
-                    SELECT * FROM users
+                    SELECT {_USER_COLUMNS}, COUNT(*) OVER () AS _total FROM users
                     {where}
                     ORDER BY email
                     LIMIT :limit OFFSET :offset
                 """), data_params)
-                users = [_row_to_user_dict(row) for row in result.fetchall()]
-                return users, total
+                rows = result.fetchall()
+                if rows:
+                    total = rows[0]._total
+                elif pagination.offset:
+                    # Past the last page: no row to carry the total
+                    total = (await session.execute(
+                        text(f"SELECT COUNT(*) FROM users {where}"), params
+                    )).scalar() or 0
+                else:
+                    total = 0
+
+            users = []
+            for row in rows:
+                user = _row_to_user_dict(row)
+                user.pop("_total", None)
+                users.append(user)
+            return users, total
         except Exception as e:
             self.logger.error(f"Error retrieving paginated users: {e}")
             return [], 0
@@ -150,7 +202,7 @@ class UserRepository:
 
             async with AsyncSessionLocal() as session:
                 result = await session.execute(text(f"""
-                    SELECT * FROM users
+                    SELECT {_USER_COLUMNS} FROM users
                     {where}
                     ORDER BY email {order}
                     LIMIT :limit
@@ -189,17 +241,18 @@ class UserRepository:
             self.logger.error(f"Error in users cursor pagination: {e}", exc_info=True)
             return [], None, None, False, False
 
-    async def get_by_email(self, email: str) -> Optional[Dict[str, Any]]:
+    async def get_by_email(self, email: str, include_embedding: bool = False) -> Optional[Dict[str, Any]]:
+        columns = _USER_COLUMNS + ", embedding" if include_embedding else _USER_COLUMNS
         try:
             async with AsyncSessionLocal() as session:
                 result = await session.execute(
-                    text("SELECT * FROM users WHERE email = :email"),
+                    text(f"SELECT {columns} FROM users WHERE email = :email"),
                     {"email": email}
                 )
                 row = result.fetchone()
                 return _row_to_user_dict(row) if row else None
         except Exception as e:
-            self.logger.error(f"Error retrieving user: {e}")
+            self.logger.exception("Error retrieving user: %s", e)
             return None
 
     async def get_by_email_strict(self, email: str) -> Optional[Dict[str, Any]]:
@@ -209,7 +262,7 @@ class UserRepository:
         """
         async with AsyncSessionLocal() as session:
             result = await session.execute(
-                text("SELECT * FROM users WHERE email = :email"),
+                text(f"SELECT {_USER_COLUMNS} FROM users WHERE email = :email"),
                 {"email": email}
             )
             row = result.fetchone()
@@ -222,7 +275,7 @@ class UserRepository:
         try:
             async with AsyncSessionLocal() as session:
                 result = await session.execute(
-                    text("SELECT * FROM users WHERE email = ANY(:emails)"),
+                    text(f"SELECT {_USER_COLUMNS} FROM users WHERE email = ANY(:emails)"),
                     {"emails": list(emails)}
                 )
                 return {row._mapping["email"]: _row_to_user_dict(row) for row in result.fetchall()}
@@ -242,11 +295,13 @@ class UserRepository:
                     {"email": email}
                 )
                 row = result.fetchone()
-                if not row or not row.password_hash:
-                    return False
-                return pwd_context.verify(password, row.password_hash)
+            if not row or not row.password_hash:
+                return False
+            # bcrypt is CPU-bound — run it off the event loop so concurrent
+            # requests keep being served while a login is verified
+            return await asyncio.to_thread(check_password, password, row.password_hash)
         except Exception as e:
-            self.logger.error(f"Error verifying password: {e}")
+            self.logger.exception("Error verifying password: %s", e)
             return False
 
     async def search_users(self, search_term: str, exclude_email: str, limit: int = 20) -> List[Dict[str, Any]]:
@@ -256,8 +311,8 @@ class UserRepository:
         term = search_term.strip().lower()
         try:
             async with AsyncSessionLocal() as session:
-                result = await session.execute(text("""
-                    SELECT *,
+                result = await session.execute(text(f"""
+                    SELECT {_USER_COLUMNS},
                         CASE
                             WHEN lower(name)  = :term              THEN 100
                             WHEN lower(name)  ILIKE :prefix        THEN 90
@@ -318,7 +373,7 @@ class UserRepository:
 
             async with AsyncSessionLocal() as session:
                 result = await session.execute(text(f"""
-                    SELECT u.*,
+                    SELECT {_USER_COLUMNS},
                            1 - (u.embedding <=> CAST(:embedding AS vector)) AS similarity_score
                     FROM users u
                     WHERE u.email != ALL(:excluded)
@@ -343,7 +398,7 @@ class UserRepository:
 
     async def create_with_password(self, email: str, password: str, name: str) -> None:
         try:
-            hashed = pwd_context.hash(password)
+            hashed = await asyncio.to_thread(hash_password, password)
             async with AsyncSessionLocal() as session:
                 await session.execute(text("""
                     INSERT INTO users (email, name, password_hash, role)
@@ -351,37 +406,68 @@ class UserRepository:
                     ON CONFLICT (email) DO NOTHING
                 """), {"email": email, "name": name, "hash": hashed})
                 await session.commit()
-            self.logger.info(f"User {email} created.")
+            self.logger.debug("User created email=%s", email)
         except Exception as e:
-            self.logger.error(f"Error creating user: {e}")
+            self.logger.exception("Error creating user: %s", e)
+
+    async def store_google_user(self, user_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Insert or refresh a Google user in one statement and return the stored row.
 
-    async def store_google_user(self, user_data: Dict[str, Any]) -> None:
+        The ``prev`` CTE reads the row as it was before the upsert, so we can tell
+        whether the user is new or renamed (and needs a fresh embedding) without
+        a separate SELECT.
+        """
         try:
             async with AsyncSessionLocal() as session:
-                await session.execute(text("""
+                result = await session.execute(text(f"""
+                    WITH prev AS (
+                        SELECT name FROM users WHERE email = :email
+                    )
                     INSERT INTO users (email, name, profile_picture, google_uid, role)
                     VALUES (:email, :name, :pic, :uid, 'user')
                     ON CONFLICT (email) DO UPDATE SET
-                        name            = EXCLUDED.name,
-                        profile_picture = EXCLUDED.profile_picture,
-                        google_uid      = EXCLUDED.google_uid,
+                        name            = COALESCE(EXCLUDED.name, users.name),
+                        profile_picture = COALESCE(EXCLUDED.profile_picture, users.profile_picture),
+                        google_uid      = COALESCE(EXCLUDED.google_uid, users.google_uid),
                         updated_at      = NOW()
+                    RETURNING {_USER_COLUMNS},
+                        NOT EXISTS (SELECT 1 FROM prev) AS is_new,
+                        name IS DISTINCT FROM (SELECT name FROM prev) AS name_changed
                 """), {
                     "email": user_data["email"],
-                    "name": user_data["name"],
+                    "name": user_data.get("name"),
                     "pic": user_data.get("profile_picture"),
                     "uid": user_data.get("uid"),
                 })
+                row = result.fetchone()
                 await session.commit()
-            self.logger.info(f"Google user stored: {user_data['email']}")
+            self.logger.debug("Google user stored email=%s", user_data["email"])
         except Exception as e:
-            self.logger.error(f"Error storing Google user: {e}")
+            self.logger.exception("Error storing Google user: %s", e)
+            return None
 
-    async def update_profile_by_email(self, user_data: Dict[str, Any], user_email: str) -> None:
+        user = _row_to_user_dict(row)
+        is_new = user.pop("is_new", False)
+        name_changed = user.pop("name_changed", False)
+        if is_new or name_changed:
+            try:
+                from app.services.embedding_service import generate_and_store_user_embedding
+                await generate_and_store_user_embedding(user)
+            except Exception as emb_err:
+                self.logger.warning(f"Embedding refresh failed for {user_data['email']}: {emb_err}")
+        return user
+
+    async def update_profile_by_email(self, user_data: Dict[str, Any], user_email: str) -> Optional[Dict[str, Any]]:
+        """Patch the fields present in user_data in a single UPDATE.
+
+        Absent fields (including individual location keys) keep their stored
+        value via COALESCE, so callers don't need to read the row first.
+        Returns the updated user, or None when no user has that email.
+        """
         try:
             loc = user_data.get("location") or {}
             async with AsyncSessionLocal() as session:
-                await session.execute(text("""
+                result = await session.execute(text(f"""
                     UPDATE users SET
                         name              = COALESCE(:name, name),
                         profile_picture   = COALESCE(:profile_picture, profile_picture),
@@ -400,6 +486,7 @@ class UserRepository:
                         vibe_description  = COALESCE(:vibe_description, vibe_description),
                         updated_at        = NOW()
                     WHERE email = :email
+                    RETURNING {_USER_COLUMNS}
                 """), {
                     "email": user_email,
                     "name": user_data.get("name"),
@@ -418,19 +505,26 @@ class UserRepository:
                     "location_name": loc.get("name"),
                     "vibe_description": user_data.get("vibe_description"),
                 })
+                updated_row = result.fetchone()
                 await session.commit()
-            self.logger.info(f"Profile updated: {user_email}")
+            if not updated_row:
+                return None
+            self.logger.debug("Profile updated email=%s", user_email)
 
-            # Refresh embedding if any embeddable field changed
+            # Refresh embedding if any embeddable field changed — the RETURNING row
+            # already holds the post-update profile, so no second SELECT is needed
             _embedding_fields = {"name", "profession", "bio", "interests", "vibe_description"}
+            updated_user = _row_to_user_dict(updated_row)
             if any(user_data.get(f) is not None for f in _embedding_fields):
                 try:
                     from app.services.embedding_service import generate_and_store_user_embedding
-                    updated_user = await self.get_by_email(user_email)
-                    if updated_user:
-                        await generate_and_store_user_embedding(updated_user)
+                    await generate_and_store_user_embedding(updated_user)
                 except Exception as emb_err:
                     self.logger.warning(f"Embedding refresh failed for {user_email}: {emb_err}")
+            return updated_user
 
         except Exception as e:
+            # Re-raise: None already means "no such user", and a failed write
+            # must not be reported to the client as a 404
             self.logger.error(f"Error updating user profile: {e}")
+            raise
@@ -1,14 +1,16 @@
 from fastapi import APIRouter, Depends, Body, Query
 from app.services.user_service import (
     get_all_users,
+    get_all_users_cursor_paginated,
     get_all_users_paginated
 )
 
 from app.auth.jwt_utils import get_current_user
 from app.auth.roles import user_only, admin_only
 from app.models.event import event as EventCreateRequest
-from app.models import PaginatedUsersResponse, UserResponse
-from app.models.pagination import PaginationParams, UserFilters
+from app.models import CursorPaginatedUsersResponse, PaginatedUsersResponse, UserResponse
+from app.models.pagination import CursorPaginationParams, PaginationParams, UserFilters
+from app.utils.pagination_helpers import get_cursor_pagination_params
 from app.utils.http_exceptions import HTTPExceptionHelper
 from app.db.session import AsyncSessionLocal
 from sqlalchemy import text
@@ -20,12 +22,15 @@ admin_router = APIRouter()
 @admin_router.get("/stats")
 async def get_admin_stats(current_user: dict = Depends(admin_only)):
     async with AsyncSessionLocal() as session:
+        # One pass over events: the three event counts are FILTERed
+        # aggregates of the same scan rather than three separate subqueries
         result = await session.execute(text("""
             SELECT
                 (SELECT COUNT(*) FROM users) AS total_users,
-                (SELECT COUNT(*) FROM events) AS total_events,
-                (SELECT COUNT(*) FROM events WHERE is_archived = false) AS active_events,
-                (SELECT COUNT(*) FROM events WHERE is_archived = true) AS archived_events
+                COUNT(*) AS total_events,
+                COUNT(*) FILTER (WHERE is_archived = false) AS active_events,
+                COUNT(*) FILTER (WHERE is_archived = true) AS archived_events
+            FROM events
         """))
         row = result.fetchone()
         return {
@@ -39,7 +44,7 @@ async def get_admin_stats(current_user: dict = Depends(admin_only)):
 # Get all users (with optional pagination and filters)
 @admin_router.get("/users", response_model=Union[PaginatedUsersResponse, dict])
 async def fetch_all_users(
-    page: Optional[int] = Query(None, ge=1, description="Page number (enables pagination)"),
+    page: Optional[int] = Query(None, ge=1, description="Page number (enables OFFSET pagination; use /users/cursor for deep paging)"),
     page_size: Optional[int] = Query(None, ge=1, le=100, description="Items per page"),
     role: Optional[str] = Query(None, description="Filter by role"),
     profession: Optional[str] = Query(None, description="Filter by profession"),
@@ -73,4 +78,26 @@ async def fetch_all_users(
         users = await get_all_users()  # capped at 1000 in repo
         if users:
             return {"users": users}
-        raise HTTPExceptionHelper.not_found("No users found")   
\ No newline at end of file
+        raise HTTPExceptionHelper.not_found("No users found")   
+
+
+# Get users with keyset (cursor) pagination — each page costs the same however
+# deep it is, unlike the OFFSET-based ?page= mode above
+@admin_router.get("/users/cursor", response_model=CursorPaginatedUsersResponse)
+async def fetch_all_users_cursor(
+    cursor_params: CursorPaginationParams = Depends(get_cursor_pagination_params),
+    role: Optional[str] = Query(None, description="Filter by role"),
+    profession: Optional[str] = Query(None, description="Filter by profession"),
+    current_user: dict = Depends(admin_only)
+):
+    result = await get_all_users_cursor_paginated(cursor_params, UserFilters(role=role, profession=profession))
+
+    user_responses = []
+    for user_dict in result.items:
+        try:
+            user_responses.append(UserResponse(**user_dict))
+        except Exception:
+            # Skip invalid users, as the paginated listing does
+            continue
+
+    return CursorPaginatedUsersResponse(items=user_responses, pagination=result.pagination)
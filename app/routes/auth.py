@@ -1,3 +1,5 @@
+import asyncio
+import requests
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel
 from typing import List
@@ -28,11 +30,15 @@ from app.auth.jwt_utils import (
 from app.auth.roles import user_only
 from app.utils.http_exceptions import HTTPExceptionHelper
 from app.utils.logger import get_route_logger
-import os
+from app import config
 
 auth_router = APIRouter()
 logger = get_route_logger(__name__)
 
+# Shared transport for Google token verification — reuses one HTTP connection
+# pool for the certificate fetch instead of opening a new session per login
+_google_request = Request(session=requests.Session())
+
 # -------------------- Request Models --------------------
 
 class GoogleLoginRequest(BaseModel):
@@ -48,8 +54,10 @@ class RefreshRequest(BaseModel):
 async def google_login(request: GoogleLoginRequest):
     try:
         token = request.token
-        client_id = os.getenv("GOOGLE_CLIENT_ID")
-        id_info = id_token.verify_oauth2_token(token, Request(), client_id)
+        # Verification fetches Google's certs over blocking HTTP — keep it off the event loop
+        id_info = await asyncio.to_thread(
+            id_token.verify_oauth2_token, token, _google_request, config.GOOGLE_CLIENT_ID
+        )
 
         user_data = {
             "uid": id_info["sub"],
@@ -58,9 +66,7 @@ async def google_login(request: GoogleLoginRequest):
             "profile_picture": id_info.get("picture")
         }
 
-        await store_or_update_user_data(user_data)
-        
-        user = await get_user_by_email(user_data["email"])
+        user = await store_or_update_user_data(user_data)
         if not user:
             raise HTTPExceptionHelper.not_found("User not found")
         role = user.get("role", "user")
@@ -75,7 +81,7 @@ async def google_login(request: GoogleLoginRequest):
             "token_type": "bearer",
         }
     except Exception as e:
-        logger.error(f"Google authentication error: {e}")
+        logger.exception("Google authentication error: %s", e)
         raise HTTPExceptionHelper.bad_request("Google login failed")
 
 # Normal Login
@@ -182,25 +188,13 @@ async def get_profile(current_user: dict = Depends(user_only)):
 # Update user profile
 @auth_router.put("/me", response_model=dict)
 async def update_profile(request: UserUpdate, current_user: dict = Depends(user_only)):
-    user = await get_user_by_email(current_user["email"])
-    if not user:
-        raise HTTPExceptionHelper.not_found("User not found")
+    # Convert UserUpdate model to dict, excluding None values. Location keys the
+    # client leaves out keep their stored value in the UPDATE itself, so there's
+    # no need to read the user first and merge.
+    update_data = request.dict(exclude_none=True)
 
-    # Convert UserUpdate model to dict, excluding None values
-    update_data = {}
-    for field, value in request.dict(exclude_none=True).items():
-        if field == "location" and value:
-            # Merge location data with existing location
-            existing_location = user.get("location") or {}
-            if hasattr(value, 'dict'):
-                new_location = value.dict()
-            else:
-                new_location = value
-            update_data["location"] = {**existing_location, **new_location}
-        else:
-            update_data[field] = value
-
-    await update_user_data(update_data, current_user["email"])
+    if not await update_user_data(update_data, current_user["email"]):
+        raise HTTPExceptionHelper.not_found("User not found")
     return {"message": "Profile updated successfully"}
 
 # Update user interests
@@ -209,10 +203,6 @@ class UpdateInterestsRequest(BaseModel):
 
 @auth_router.put("/me/interests", response_model=dict)
 async def update_interests(request: UpdateInterestsRequest, current_user: dict = Depends(user_only)):
-    user = await get_user_by_email(current_user["email"])
-    if not user:
-        raise HTTPExceptionHelper.not_found("User not found")
-
     # Validate interests using the validator from UserUpdate
     try:
         # Basic validation - ensure it's a list of strings
@@ -227,7 +217,8 @@ async def update_interests(request: UpdateInterestsRequest, current_user: dict =
         # Remove duplicates and trim whitespace
         cleaned_interests = list(set(interest.strip() for interest in request.interests))
         
-        await update_user_data({"interests": cleaned_interests}, current_user["email"])
+        if not await update_user_data({"interests": cleaned_interests}, current_user["email"]):
+            raise HTTPExceptionHelper.not_found("User not found")
         return {"message": "User interests updated successfully"}
     except ValueError as e:
         raise HTTPExceptionHelper.bad_request(f"Invalid interests: {str(e)}")
\ No newline at end of file
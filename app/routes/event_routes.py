@@ -1,9 +1,11 @@
 from fastapi import APIRouter, Depends, Body, Query
+from fastapi.responses import StreamingResponse
 import asyncio
 from app.services.event_service import (
     create_event,
     get_all_events_paginated,
-    get_event_by_id,
+    get_event_by_id_cached,
+    forget_cached_event,
     get_events_moderated_by_user_paginated,
     get_events_organized_by_user_paginated,
     update_event,
@@ -16,14 +18,15 @@ from app.services.event_service import (
     unarchive_event,
     get_archived_events_paginated,
     archive_past_events,
+    purge_archived_events,
     get_rsvp_response_data,
     get_paginated_rsvp_list,
+    get_rsvp_list_cursor_paginated,
     archive_event_with_validation,
-    get_all_events,
-    get_user_interested_events_paginated
+    stream_all_events_json,
+    get_user_interested_events_paginated,
+    event_rsvp_service,
 )
-from app.services.event_rsvp_service import EventRsvpService
-event_rsvp_service = EventRsvpService()
 
 from app.services.event_ingestion_service import (
     fetch_ticketmaster_events,
@@ -33,9 +36,9 @@ from app.services.event_ingestion_service import (
 
 from app.auth.jwt_utils import get_current_user
 from app.auth.roles import user_only, admin_only
-from app.auth.event_roles import require_event_creator, require_event_organizer
+from app.auth.event_roles import get_event_dep, require_event_creator, require_event_creator_for_write, require_event_organizer
 from app.models.event import event as EventCreateRequest
-from app.models.pagination import EventFilters, CursorPaginationParams
+from app.models.pagination import EventFilters, CursorPaginationParams, EventCursorPaginatedResponse
 from app.services.search_service import search_events
 from app.utils.pagination_helpers import get_cursor_pagination_params, get_event_filter_params
 from app.utils.http_exceptions import event_not_found, operation_failed, HTTPExceptionHelper
@@ -43,8 +46,14 @@ from typing import Optional
 
 event_router = APIRouter()
 
+# Paginated event listings declare response_model=EventCursorPaginatedResponse so
+# FastAPI serializes them straight to JSON bytes with Pydantic's Rust encoder,
+# skipping jsonable_encoder + json.dumps (several times faster on a full page).
+# The hot dict-returning routes (event detail, RSVP list and actions) declare
+# response_model=dict for the same fast path.
+
 # ==================== USER EVENT ROUTES ====================
-@event_router.get("/me/interested")
+@event_router.get("/me/interested", response_model=EventCursorPaginatedResponse)
 async def fetch_user_interested_events(
     cursor_params: CursorPaginationParams = Depends(get_cursor_pagination_params),
     current_user: dict = Depends(user_only)
@@ -53,6 +62,8 @@ async def fetch_user_interested_events(
     try:
         email = current_user["email"]
         return await get_user_interested_events_paginated(email, cursor_params)
+    except ValueError as e:
+        raise HTTPExceptionHelper.bad_request(str(e))
     except Exception as e:
         raise HTTPExceptionHelper.server_error(str(e))
 
@@ -67,16 +78,17 @@ async def create_new_event(event: EventCreateRequest , current_user: dict = Depe
 
 
 # Get all events (cursor pagination by default)
-@event_router.get("")
+@event_router.get("", response_model=EventCursorPaginatedResponse)
 async def fetch_all_events(
     cursor_params: CursorPaginationParams = Depends(get_cursor_pagination_params),
-    filter_params: dict = Depends(get_event_filter_params)
+    filter_params: dict = Depends(get_event_filter_params),
+    compact: bool = Query(False, description="Return only the fields an event card shows")
 ):
     filters = EventFilters(**filter_params)
-    return await get_all_events_paginated(cursor_params, filters)
+    return await get_all_events_paginated(cursor_params, filters, compact)
 
 # Natural language event search
-@event_router.get("/search")
+@event_router.get("/search", response_model=EventCursorPaginatedResponse)
 async def search_events_nl(
     q: str = Query(..., description="Natural language search query, e.g. 'rock concerts in tempe'"),
     cursor_params: CursorPaginationParams = Depends(get_cursor_pagination_params),
@@ -89,10 +101,10 @@ async def search_events_nl(
 @event_router.get("/all")
 async def fetch_all_events_non_paginated(current_user: dict = Depends(admin_only)):
     """Return all non-archived events (non-paginated, admin only)"""
-    return await get_all_events()
+    return StreamingResponse(stream_all_events_json(), media_type="application/json")
 
 # Get archived events (creator only) with cursor pagination
-@event_router.get("/me/archived")
+@event_router.get("/me/archived", response_model=EventCursorPaginatedResponse)
 async def get_my_archived_events(
     cursor_params: CursorPaginationParams = Depends(get_cursor_pagination_params),
     current_user: dict = Depends(user_only)
@@ -101,7 +113,7 @@ async def get_my_archived_events(
     return await get_archived_events_paginated(cursor_params, user_email)
 
 # Get all archived events (admin only) with cursor pagination
-@event_router.get("/archived")
+@event_router.get("/archived", response_model=EventCursorPaginatedResponse)
 async def get_all_archived_events(
     cursor: Optional[str] = Query(None, description="Cursor for pagination"),
     page_size: Optional[int] = Query(10, ge=1, le=100, description="Items per page"),
@@ -120,24 +132,27 @@ async def get_all_archived_events(
         raise HTTPExceptionHelper.server_error(f"Failed to retrieve archived events: {str(e)}")
 
 # Get event by ID
-@event_router.get("/{event_id}")
+@event_router.get("/{event_id}", response_model=dict)
 async def fetch_event_by_id(event_id: str):
-    event = await get_event_by_id(event_id)
+    event = await get_event_by_id_cached(event_id)
     if event:
         return event
     raise event_not_found()
 
 # Update event (creator only)
 @event_router.put("/{event_id}")
-async def update_existing_event(event_id: str, update_data: dict = Body(...), current_user: dict = Depends(require_event_creator)):
-    success = await update_event(event_id, update_data)
+async def update_existing_event(event_id: str, update_data: dict = Body(...), current_user: dict = Depends(require_event_creator_for_write)):
+    try:
+        success = await update_event(event_id, update_data)
+    except ValueError as e:
+        raise HTTPExceptionHelper.bad_request(str(e))
     if success:
         return {"message": "Event updated successfully"}
     raise operation_failed("update event")
 
 # Delete event (creator only)
 @event_router.delete("/{event_id}")
-async def delete_existing_event(event_id: str, current_user: dict = Depends(require_event_creator)):
+async def delete_existing_event(event_id: str, current_user: dict = Depends(require_event_creator_for_write)):
     success = await delete_event(event_id)
     if success:
         return {"message": "Event deleted successfully"}
@@ -148,7 +163,7 @@ async def delete_existing_event(event_id: str, current_user: dict = Depends(requ
 async def archive_event_endpoint(
     event_id: str, 
     archive_data: dict = Body({"reason": "Event archived"}),
-    current_user: dict = Depends(require_event_creator)
+    current_user: dict = Depends(require_event_creator_for_write)
 ):
     """Archive an event with validation"""
     reason = archive_data.get("reason", "Event archived")
@@ -171,14 +186,14 @@ async def archive_event_endpoint(
 
 # Unarchive event (creator only)
 @event_router.patch("/{event_id}/unarchive")
-async def unarchive_event_endpoint(event_id: str, current_user: dict = Depends(require_event_creator)):
+async def unarchive_event_endpoint(event_id: str, current_user: dict = Depends(require_event_creator_for_write)):
     success = await unarchive_event(event_id)
     if success:
         return {"message": "Event restored successfully"}
     raise HTTPExceptionHelper.server_error("Failed to restore event")
 
 # Events created by user (cursor pagination)
-@event_router.get("/me/created")
+@event_router.get("/me/created", response_model=EventCursorPaginatedResponse)
 async def fetch_my_created_events(
     cursor_params: CursorPaginationParams = Depends(get_cursor_pagination_params),
     current_user: dict = Depends(user_only)
@@ -187,7 +202,7 @@ async def fetch_my_created_events(
     return await get_my_events_paginated(email, cursor_params)
 
 # Events RSVP'd by user (cursor pagination)
-@event_router.get("/me/rsvped")
+@event_router.get("/me/rsvped", response_model=EventCursorPaginatedResponse)
 async def fetch_user_rsvped_events(
     cursor_params: CursorPaginationParams = Depends(get_cursor_pagination_params),
     current_user: dict = Depends(user_only)
@@ -195,11 +210,13 @@ async def fetch_user_rsvped_events(
     try:
         email = current_user["email"]
         return await get_user_rsvps_paginated(email, cursor_params)
+    except ValueError as e:
+        raise HTTPExceptionHelper.bad_request(str(e))
     except Exception as e:
         raise HTTPExceptionHelper.server_error(str(e))
 
 # Events organized by user (cursor pagination)
-@event_router.get("/me/organized")
+@event_router.get("/me/organized", response_model=EventCursorPaginatedResponse)
 async def fetch_user_organized_events(
     cursor_params: CursorPaginationParams = Depends(get_cursor_pagination_params),
     current_user: dict = Depends(user_only)
@@ -211,7 +228,7 @@ async def fetch_user_organized_events(
         raise HTTPExceptionHelper.server_error(str(e))
 
 # Events moderated by user (cursor pagination)
-@event_router.get("/me/moderated")
+@event_router.get("/me/moderated", response_model=EventCursorPaginatedResponse)
 async def fetch_user_moderated_events(
     cursor_params: CursorPaginationParams = Depends(get_cursor_pagination_params),
     current_user: dict = Depends(user_only)
@@ -240,14 +257,15 @@ async def fetch_and_ingest_ticketmaster(payload: dict = Body(...), current_user:
     }
 
 # Nearby community events by city/state (cursor pagination)
-@event_router.get("/location/nearby")
+@event_router.get("/location/nearby", response_model=EventCursorPaginatedResponse)
 async def list_nearby_events(
     city: str = Query(..., description="City name"),
     state: str = Query(..., description="State name"),
     # Cursor pagination parameters
     cursor: Optional[str] = Query(None, description="Cursor for pagination"),
     page_size: Optional[int] = Query(12, ge=1, le=100, description="Items per page"),
-    direction: Optional[str] = Query("next", pattern="^(next|prev)$", description="Pagination direction")
+    direction: Optional[str] = Query("next", pattern="^(next|prev)$", description="Pagination direction"),
+    compact: bool = Query(False, description="Return only the fields an event card shows")
 ):
     # Use cursor-based pagination
     cursor_params = CursorPaginationParams(
@@ -255,18 +273,15 @@ async def list_nearby_events(
         page_size=page_size or 12,
         direction=direction or "next"
     )
-    return await get_nearby_events_paginated(city, state, cursor_params)
+    return await get_nearby_events_paginated(city, state, cursor_params, compact)
 
 @event_router.patch("/{event_id}/organizers")
 async def update_event_organizers(
     event_id: str,
     payload: dict = Body(...),
-    current_user: dict = Depends(require_event_creator)
+    current_user: dict = Depends(require_event_creator),
+    event: dict = Depends(get_event_dep)
 ):
-    event = await get_event_by_id(event_id)
-    if not event:
-        raise HTTPExceptionHelper.not_found("Event not found")
-
     new_organizers = payload.get("organizerEmails", [])
     creator_email = event.get("createdByEmail")
 
@@ -289,10 +304,6 @@ async def update_event_moderators(
     payload: dict = Body(...),
     current_user: dict = Depends(require_event_organizer)
 ):
-    event = await get_event_by_id(event_id)
-    if not event:
-        raise HTTPExceptionHelper.not_found("Event not found")
-
     new_moderators = payload.get("moderatorEmails", [])
     result = await set_moderators(event_id, new_moderators)
 
@@ -323,9 +334,19 @@ async def bulk_archive_past_events(current_user: dict = Depends(admin_only)):
     except Exception as e:
         raise HTTPExceptionHelper.server_error(f"Failed to archive past events: {str(e)}")
 
+# Purge old archived events now instead of waiting for the nightly DB job (admin only)
+@event_router.post("/archive/purge")
+async def purge_old_archived_events(current_user: dict = Depends(admin_only)):
+    """Delete archived events that started before today (admin only)"""
+    deleted_count = await purge_archived_events()
+    return {
+        "message": f"Purged {deleted_count} archived events",
+        "deleted_count": deleted_count
+    }
+
 # ========== RSVP ENDPOINTS ==========
 
-@event_router.post("/{event_id}/rsvp")
+@event_router.post("/{event_id}/rsvp", response_model=dict)
 async def rsvp_to_event_endpoint(
     event_id: str,
     status: str = Body("joined", embed=True),
@@ -335,6 +356,7 @@ async def rsvp_to_event_endpoint(
     try:
         email = current_user["email"]
         success = await event_rsvp_service.rsvp_to_event(event_id, email, status)
+        forget_cached_event(event_id)
         if success:
             return await get_rsvp_response_data(event_id, email, "created")
         raise HTTPExceptionHelper.server_error("Failed to RSVP to event")
@@ -347,7 +369,7 @@ async def rsvp_to_event_endpoint(
     except Exception as e:
         raise HTTPExceptionHelper.server_error(f"Failed to RSVP to event: {str(e)}")
 
-@event_router.delete("/{event_id}/rsvp")
+@event_router.delete("/{event_id}/rsvp", response_model=dict)
 async def cancel_rsvp_endpoint(
     event_id: str,
     status: str = Query("joined", description="RSVP status to cancel (joined or interested)"),
@@ -357,6 +379,7 @@ async def cancel_rsvp_endpoint(
     try:
         email = current_user["email"]
         success = await event_rsvp_service.cancel_rsvp(event_id, email, status)
+        forget_cached_event(event_id)
         if success:
             return await get_rsvp_response_data(event_id, email, "cancelled")
         raise HTTPExceptionHelper.server_error("Failed to cancel RSVP")
@@ -369,7 +392,7 @@ async def cancel_rsvp_endpoint(
     except Exception as e:
         raise HTTPExceptionHelper.server_error(f"Failed to cancel RSVP: {str(e)}")
     
-@event_router.patch("/{event_id}/rsvp/status")
+@event_router.patch("/{event_id}/rsvp/status", response_model=dict)
 async def update_rsvp_status_endpoint(
     event_id: str,
     status: str = Body(..., embed=True),
@@ -382,6 +405,7 @@ async def update_rsvp_status_endpoint(
     try:
         email = current_user["email"]
         success = await event_rsvp_service.update_rsvp_status(event_id, email, status, rating, review)
+        forget_cached_event(event_id)
         if success:
             return await get_rsvp_response_data(event_id, email, "updated")
         else:
@@ -395,19 +419,32 @@ async def update_rsvp_status_endpoint(
     except Exception as e:
         raise HTTPExceptionHelper.server_error(f"Failed to update RSVP status: {str(e)}")
 
-@event_router.get("/{event_id}/rsvps")
+@event_router.get("/{event_id}/rsvps", response_model=dict)
 async def get_event_rsvps(
     event_id: str,
-    page: Optional[int] = Query(None, ge=1, description="Page number (enables pagination)"),
-    page_size: Optional[int] = Query(None, ge=1, le=100, description="Items per page")
+    page: Optional[int] = Query(None, ge=1, description="Page number (enables OFFSET pagination; use /rsvps/cursor for deep paging)"),
+    page_size: Optional[int] = Query(None, ge=1, le=100, description="Items per page"),
+    include_total: bool = Query(True, description="Count all RSVPs for total/total_pages; pass false when has_next is enough")
 ):
     """Get RSVP list for an event"""
     try:
         page_size = page_size or 10
-        return await get_paginated_rsvp_list(event_id, page, page_size)
+        return await get_paginated_rsvp_list(event_id, page or 1, page_size, include_total)
             
     except Exception as e:
         raise HTTPExceptionHelper.server_error(f"Failed to get RSVP list: {str(e)}")
 
+# RSVP list with keyset (cursor) pagination — each page costs the same however
+# deep it is, unlike the OFFSET-based ?page= mode above
+@event_router.get("/{event_id}/rsvps/cursor", response_model=EventCursorPaginatedResponse)
+async def get_event_rsvps_cursor(
+    event_id: str,
+    cursor_params: CursorPaginationParams = Depends(get_cursor_pagination_params),
+):
+    try:
+        return await get_rsvp_list_cursor_paginated(event_id, cursor_params)
+    except ValueError as e:
+        raise HTTPExceptionHelper.bad_request(str(e))
+
 # Export the router for the application
 router = event_router
\ No newline at end of file
@@ -1,7 +1,6 @@
 import asyncio
 import json
 from urllib.parse import urljoin, urlparse
-from playwright.async_api import async_playwright
 from app.utils.event_parser import parse_eventbrite_jsonld, parse_eventbrite_server_data, is_schema_event
 from app.utils.logger import get_service_logger
 
@@ -161,6 +160,9 @@ async def scrape_eventbrite_async(city="Tempe", state="AZ", max_pages=3, seen_li
     location = f"{state.lower()}--{city.lower()}"
     link_categories: dict[str, list[str]] = {}  # canonical -> [category]
 
+    # Imported here so the API process doesn't load Playwright at startup
+    from playwright.async_api import async_playwright
+
     async with async_playwright() as p:
         browser = await p.chromium.launch(headless=True)
         context = await browser.new_context(user_agent=(
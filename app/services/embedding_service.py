@@ -3,32 +3,24 @@ Embedding generation and storage for users and events.
 Uses OpenAI text-embedding-3-small (1536 dims) to match the embedding columns.
 """
 import logging
-import os
 
 from sqlalchemy import text
 
 from app.db.session import AsyncSessionLocal
 from app.utils.logger import get_service_logger
+from app.utils.openai_client import get_openai_client
 
 logger = get_service_logger(__name__)
 
-_openai_client = None
-
-
 def _get_openai_client():
-    global _openai_client
-    if _openai_client is None:
-        try:
-            from openai import AsyncOpenAI
-            key = os.getenv("OPENAI_API_KEY")
-            if not key:
-                logger.warning("OPENAI_API_KEY not set — embedding generation unavailable")
-                return None
-            _openai_client = AsyncOpenAI(api_key=key)
-        except ImportError:
-            logger.warning("openai package not installed")
-            return None
-    return _openai_client
+    try:
+        client = get_openai_client()
+    except ImportError:
+        logger.warning("openai package not installed")
+        return None
+    if client is None:
+        logger.warning("OPENAI_API_KEY not set — embedding generation unavailable")
+    return client
 
 
 def _build_user_text(user: dict) -> str:
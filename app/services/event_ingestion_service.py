@@ -62,31 +62,37 @@ def fetch_ticketmaster_events(city: str, state: str) -> List[dict]:
 
 # --- Ingestion Logic ---
 
-async def ingest_event(event: dict, redis=None) -> bool:
+async def _apply_geocode_if_needed(event: dict) -> None:
     # Geocoding fallback for scraped events when coordinates are missing/invalid.
     source = (event.get("source") or "").lower()
     location = event.get("location")
     if source in {"eventbrite", "ticketmaster"} and isinstance(location, dict) and not has_valid_coordinates(location):
         event["location"] = await apply_geocode_fallback(location)
 
+
+async def ingest_event(event: dict, redis=None) -> bool:
     original_id = event.get("originalId")
     if not original_id:
+        await _apply_geocode_if_needed(event)
         return await repo.save_event(event)
 
     # Fast dedup via Redis SET
     if redis is not None:
         try:
             if await redis.sismember(INGESTED_IDS_KEY, original_id):
-                logger.debug(f"[Redis] Event originalId={original_id} already ingested, skipping.")
+                logger.debug("[Redis] Event originalId=%s already ingested, skipping.", original_id)
                 return False
         except Exception:
             pass
 
     existing = await repo.get_by_original_id(original_id)
     if existing:
-        logger.debug(f"Event with originalId={original_id} already exists, skipping.")
+        logger.debug("Event with originalId=%s already exists, skipping.", original_id)
         return False
 
+    # Geocode only events that will actually be written — re-scraped
+    # duplicates are the common case and never need coordinates
+    await _apply_geocode_if_needed(event)
     saved = await repo.save_event(event)
 
     if saved and redis is not None:
@@ -99,20 +105,78 @@ async def ingest_event(event: dict, redis=None) -> bool:
     return saved
 
 
+# Rows per INSERT round trip; keeps one bad row from failing a huge batch
+_BULK_INSERT_CHUNK = 500
+
+# Geocoding fallbacks in flight at once during a bulk ingest. Each one is a
+# blocking HTTP call on the default thread pool, so keep it well under the
+# pool size (Nominatim calls are additionally paced by its own lock).
+_GEOCODE_CONCURRENCY = 8
+
+
 async def ingest_bulk_events(events: list[dict], redis=None) -> dict:
+    """
+    Ingest a batch of scraped events with batched dedup and writes.
+    One SMISMEMBER + one ANY(:ids) lookup replace the per-event Redis/DB
+    checks, and new rows go out in multi-row INSERTs of up to 500.
+    """
     total = len(events)
-    saved = skipped = 0
 
+    # Drop in-batch duplicates (same originalId listed twice)
+    candidates, seen = [], set()
     for e in events:
-        if await ingest_event(e, redis=redis):
-            saved += 1
-        else:
-            skipped += 1
+        original_id = e.get("originalId")
+        if original_id:
+            if original_id in seen:
+                continue
+            seen.add(original_id)
+        candidates.append(e)
+
+    original_ids = [e["originalId"] for e in candidates if e.get("originalId")]
+    known: set = set()
+
+    # Fast dedup via Redis SET
+    if redis is not None and original_ids:
+        try:
+            flags = await redis.smismember(INGESTED_IDS_KEY, original_ids)
+            known = {oid for oid, hit in zip(original_ids, flags) if hit}
+        except Exception:
+            pass
+
+    unknown = [oid for oid in original_ids if oid not in known]
+    if unknown:
+        known |= await repo.get_existing_original_ids(unknown)
+
+    to_save = [e for e in candidates if not e.get("originalId") or e["originalId"] not in known]
+
+    # Geocode only the rows about to be written. The lookups are independent
+    # network calls — overlap them rather than paying one round trip per event
+    geocode_slots = asyncio.Semaphore(_GEOCODE_CONCURRENCY)
+
+    async def _geocode(e: dict) -> None:
+        async with geocode_slots:
+            await _apply_geocode_if_needed(e)
+
+    await asyncio.gather(*(_geocode(e) for e in to_save))
+
+    saved = 0
+    for i in range(0, len(to_save), _BULK_INSERT_CHUNK):
+        saved += await repo.save_bulk_events(to_save[i:i + _BULK_INSERT_CHUNK])
+
+    # Only mark as ingested when every row landed — a partial fallback can't tell
+    # us which ones failed, and the DB check catches them next run anyway
+    new_ids = [e["originalId"] for e in to_save if e.get("originalId")]
+    if redis is not None and new_ids and saved == len(to_save):
+        try:
+            await redis.sadd(INGESTED_IDS_KEY, *new_ids)
+            await redis.expire(INGESTED_IDS_KEY, TTL_INGESTED_IDS)
+        except Exception:
+            pass
 
     return {
         "total": total,
         "saved": saved,
-        "skipped": skipped
+        "skipped": total - saved
     }
 
 # ── Ticketmaster pipeline (serialized — 1 request/s to avoid 429) ────────────
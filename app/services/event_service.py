@@ -1,4 +1,4 @@
-import json
+import orjson
 from sqlalchemy import text
 from app.db.session import AsyncSessionLocal
 from app.repositories.events import EventRepositoryManager
@@ -8,29 +8,60 @@ from app.models.pagination import EventFilters, CursorPaginationParams, EventCur
 from app.utils.logger import get_service_logger
 from app.utils.event_validators import EventValidator
 from app.utils.redis_client import get_redis_client
-from app.utils.cache_keys import event_query_cache_key, nearby_events_cache_key, TTL_EVENT_QUERY
-from typing import Optional
-from datetime import datetime, timedelta
+from app.utils.cache_keys import EVENT_QUERY_KEYS_KEY, event_query_cache_key, nearby_events_cache_key, TTL_EVENT_DETAIL_LOCAL, TTL_EVENT_QUERY, TTL_EVENT_QUERY_LOCAL
+from app.utils.cache_utils import LocalTTLCache
+from typing import AsyncIterator, Optional
 
 
 event_rsvp_service = EventRsvpService()
 
-event_repo = EventRepositoryManager()
+event_repo = EventRepositoryManager(rsvp_service=event_rsvp_service)
 logger = get_service_logger(__name__)
 
+# Worker-local copy of the public listing pages, in front of the Redis query
+# cache: a hit skips the Redis round trip and re-validating the JSON. The TTL
+# is short because a flush only clears it on the worker that made the change.
+_local_query_cache = LocalTTLCache(ttl=TTL_EVENT_QUERY_LOCAL, maxsize=512)
+
+# Worker-local event detail pages for GET /events/{event_id}. Writes made through
+# this service drop the entry straight away; the TTL bounds how stale another
+# worker's copy can get. Role checks read the event uncached.
+_event_detail_cache = LocalTTLCache(ttl=TTL_EVENT_DETAIL_LOCAL, maxsize=2048)
+
+def forget_cached_event(event_id: str) -> None:
+    _event_detail_cache.pop(event_id)
+
+async def cache_event_query(redis, cache_key: str, payload: str) -> None:
+    """Store a cached listing/search page and tag it for flush_event_query_cache.
+
+    The SET and the SADD to the tag set go out in one pipelined round trip.
+    The tag set's TTL is refreshed on every add, so it always outlives the
+    keys it names.
+    """
+    async with redis.pipeline(transaction=False) as pipe:
+        pipe.set(cache_key, payload, ex=TTL_EVENT_QUERY)
+        pipe.sadd(EVENT_QUERY_KEYS_KEY, cache_key)
+        pipe.expire(EVENT_QUERY_KEYS_KEY, TTL_EVENT_QUERY)
+        await pipe.execute()
+
 async def flush_event_query_cache() -> None:
+    """Drop every cached listing/search page.
+
+    Reads and clears the tag set in one MULTI, then deletes the keys it named,
+    so a flush costs two round trips however large the keyspace is. Keys
+    tagged after the MULTI belong to the next flush.
+    """
+    _local_query_cache.clear()
     redis = get_redis_client()
     if redis is None:
         return
     try:
-        for pattern in ("sahana:events:q:*", "sahana:events:nearby:*", "sahana:search:*"):
-            cursor = 0
-            while True:
-                cursor, keys = await redis.scan(cursor, match=pattern, count=100)
-                if keys:
-                    await redis.delete(*keys)
-                if cursor == 0:
-                    break
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.smembers(EVENT_QUERY_KEYS_KEY)
+            pipe.delete(EVENT_QUERY_KEYS_KEY)
+            keys, _ = await pipe.execute()
+        if keys:
+            await redis.delete(*keys)
     except Exception as e:
         logger.warning(f"Could not flush event query cache: {e}")
 
@@ -51,6 +82,22 @@ async def get_event_by_id(event_id: str):
         logger.error(f"Error in get_event_by_id: {e}", exc_info=True)
         return None
 
+async def get_event_creator(event_id: str):
+    try:
+        return await event_repo.get_event_creator(event_id)
+    except Exception as e:
+        logger.error(f"Error in get_event_creator: {e}", exc_info=True)
+        return None
+
+async def get_event_by_id_cached(event_id: str):
+    """get_event_by_id behind the worker-local detail cache (public reads only)."""
+    event = _event_detail_cache.get(event_id)
+    if event is None:
+        event = await get_event_by_id(event_id)
+        if event:
+            _event_detail_cache.set(event_id, event)
+    return event
+
 async def get_all_events():
     try:
         return await event_repo.get_all_events()
@@ -58,11 +105,34 @@ async def get_all_events():
         logger.error(f"Error in get_all_events: {e}", exc_info=True)
         return []
 
+async def stream_all_events_json() -> AsyncIterator[bytes]:
+    """All non-archived events as a JSON array, encoded one event at a time.
+
+    Up to 5000 events: streaming keeps the rows, dicts and encoded body from all
+    being in memory together. A failure mid-stream is re-raised rather than
+    closing the array, so the chunked response aborts instead of ending in a
+    valid but truncated list.
+    """
+    yield b"["
+    separator = b""
+    try:
+        async for event in event_repo.iter_all_events():
+            yield separator + orjson.dumps(event)
+            separator = b","
+    except Exception as e:
+        logger.error(f"Error in stream_all_events_json: {e}", exc_info=True)
+        raise
+    yield b"]"
+
 async def update_event(event_id: str, update_data: dict):
     try:
         result = await event_repo.update_event(event_id, update_data)
+        forget_cached_event(event_id)
         await flush_event_query_cache()
         return result
+    except ValueError:
+        # Invalid update payload; the route answers 400
+        raise
     except Exception as e:
         logger.error(f"Error in update_event: {e}", exc_info=True)
         return False
@@ -70,6 +140,7 @@ async def update_event(event_id: str, update_data: dict):
 async def delete_event(event_id: str):
     try:
         result = await event_repo.delete_event(event_id)
+        forget_cached_event(event_id)
         await flush_event_query_cache()
         return result
     except Exception as e:
@@ -85,14 +156,18 @@ async def get_my_events(email: str):
 
 async def rsvp_to_event(event_id: str, email: str):
     try:
-        return await event_rsvp_service.join_event(event_id, email)
+        result = await event_rsvp_service.join_event(event_id, email)
+        forget_cached_event(event_id)
+        return result
     except Exception as e:
         logger.error(f"Error in rsvp_to_event: {e}", exc_info=True)
         return False
 
 async def cancel_user_rsvp(event_id: str, email: str):
     try:
-        return await event_rsvp_service.cancel_joined_rsvp(event_id, email)
+        result = await event_rsvp_service.cancel_joined_rsvp(event_id, email)
+        forget_cached_event(event_id)
+        return result
     except Exception as e:
         logger.error(f"Error in cancel_user_rsvp: {e}", exc_info=True)
         raise Exception(f"Error cancelling RSVP: {e}")
@@ -136,6 +211,7 @@ async def set_organizers(event_id: str, emails: list[str], creator_email: str) -
         valid_emails.append(creator_email)
 
     success = await event_repo.update_event_roles(event_id, "organizers", valid_emails)
+    forget_cached_event(event_id)
     return {
         "success": success,
         "organizers": valid_emails,
@@ -148,6 +224,7 @@ async def set_moderators(event_id: str, emails: list[str]) -> dict:
     invalid_emails = result["invalid"]
 
     success = await event_repo.update_event_roles(event_id, "moderators", valid_emails)
+    forget_cached_event(event_id)
     return {
         "success": success,
         "moderators": valid_emails,
@@ -155,12 +232,16 @@ async def set_moderators(event_id: str, emails: list[str]) -> dict:
     }
     
 
-async def delete_old_events() -> int:
-    return await event_repo.delete_events_before_today()
+async def purge_archived_events() -> int:
+    deleted = await event_repo.purge_archived_events()
+    if deleted:
+        _event_detail_cache.clear()
+    return deleted
 
 async def archive_event(event_id: str, archived_by: str, reason: str = "Event archived") -> bool:
     try:
         result = await event_repo.archive_event(event_id, archived_by, reason)
+        forget_cached_event(event_id)
         await flush_event_query_cache()
         return result
     except Exception as e:
@@ -169,7 +250,10 @@ async def archive_event(event_id: str, archived_by: str, reason: str = "Event ar
 
 async def unarchive_event(event_id: str) -> bool:
     try:
-        return await event_repo.unarchive_event(event_id)
+        result = await event_repo.unarchive_event(event_id)
+        forget_cached_event(event_id)
+        await flush_event_query_cache()
+        return result
     except Exception as e:
         logger.error(f"Error in unarchive_event: {e}", exc_info=True)
         return False
@@ -183,47 +267,40 @@ async def get_archived_events(user_email: Optional[str] = None) -> list[dict]:
 
 async def archive_past_events(archived_by: str = "system") -> int:
     try:
-        return await event_repo.archive_past_events_direct(archived_by)
+        archived = await event_repo.archive_past_events_direct(archived_by)
+        if archived:
+            _event_detail_cache.clear()
+            await flush_event_query_cache()
+        return archived
     except Exception as e:
         logger.error(f"Error in archive_past_events: {e}", exc_info=True)
         return 0
 
-def is_event_past(event: dict) -> bool:
-    try:
-        start_time = event.get("startTime")
-        if not start_time:
-            return False
-        
-        duration = event.get("duration", 0)
-        
-        # Parse start time and calculate end time
-        start_dt = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
-        end_dt = start_dt + timedelta(minutes=duration)
-        
-        # Check if event has ended
-        return end_dt < datetime.utcnow().replace(tzinfo=end_dt.tzinfo)
-    except Exception as e:
-        logger.error(f"Error checking if event is past: {e}", exc_info=True)
-        return False
-
-async def get_all_events_paginated(cursor_params: CursorPaginationParams, filters: Optional[EventFilters] = None) -> EventCursorPaginatedResponse:
+async def get_all_events_paginated(cursor_params: CursorPaginationParams, filters: Optional[EventFilters] = None, compact: bool = False) -> EventCursorPaginatedResponse:
     redis = get_redis_client()
     cache_key = event_query_cache_key(
         cursor_params.model_dump() if hasattr(cursor_params, "model_dump") else vars(cursor_params),
         filters.model_dump() if filters and hasattr(filters, "model_dump") else (vars(filters) if filters else {}),
+        compact,
     )
 
+    local = _local_query_cache.get(cache_key)
+    if local is not None:
+        return local
+
     if redis is not None:
         try:
             cached = await redis.get(cache_key)
             if cached:
-                logger.debug(f"[EventCache] hit {cache_key}")
-                return EventCursorPaginatedResponse(**json.loads(cached))
+                logger.debug("[EventCache] hit %s", cache_key)
+                response = EventCursorPaginatedResponse.model_validate_json(cached)
+                _local_query_cache.set(cache_key, response)
+                return response
         except Exception:
             pass
 
     try:
-        events, next_cursor, prev_cursor, has_next, has_previous = await event_repo.get_all_events_paginated(cursor_params, filters)
+        events, next_cursor, prev_cursor, has_next, has_previous = await event_repo.get_all_events_paginated(cursor_params, filters, compact)
         response = EventCursorPaginatedResponse.create(
             items=events,
             next_cursor=next_cursor,
@@ -232,10 +309,11 @@ async def get_all_events_paginated(cursor_params: CursorPaginationParams, filter
             has_previous=has_previous,
             page_size=cursor_params.page_size
         )
+        _local_query_cache.set(cache_key, response)
 
         if redis is not None:
             try:
-                await redis.set(cache_key, response.model_dump_json(), ex=TTL_EVENT_QUERY)
+                await cache_event_query(redis, cache_key, response.model_dump_json())
             except Exception:
                 pass
 
@@ -244,29 +322,37 @@ async def get_all_events_paginated(cursor_params: CursorPaginationParams, filter
         logger.error(f"Error in get_all_events_paginated: {e}", exc_info=True)
         return EventCursorPaginatedResponse.create([], None, None, False, False, cursor_params.page_size)
 
-async def get_nearby_events_paginated(city: str, state: str, cursor_params: CursorPaginationParams) -> EventCursorPaginatedResponse:
+async def get_nearby_events_paginated(city: str, state: str, cursor_params: CursorPaginationParams, compact: bool = False) -> EventCursorPaginatedResponse:
     redis = get_redis_client()
     cache_key = nearby_events_cache_key(
         city, state,
         cursor_params.model_dump() if hasattr(cursor_params, "model_dump") else vars(cursor_params),
+        compact,
     )
 
+    local = _local_query_cache.get(cache_key)
+    if local is not None:
+        return local
+
     if redis is not None:
         try:
             cached = await redis.get(cache_key)
             if cached:
-                return EventCursorPaginatedResponse(**json.loads(cached))
+                response = EventCursorPaginatedResponse.model_validate_json(cached)
+                _local_query_cache.set(cache_key, response)
+                return response
         except Exception:
             pass
 
     try:
-        events, next_cursor, prev_cursor, has_next, has_previous = await event_repo.get_nearby_events_paginated(city, state, cursor_params)
+        events, next_cursor, prev_cursor, has_next, has_previous = await event_repo.get_nearby_events_paginated(city, state, cursor_params, compact)
         response = EventCursorPaginatedResponse.create(
             events, next_cursor, prev_cursor, has_next, has_previous, cursor_params.page_size
         )
+        _local_query_cache.set(cache_key, response)
         if redis is not None:
             try:
-                await redis.set(cache_key, response.model_dump_json(), ex=TTL_EVENT_QUERY)
+                await cache_event_query(redis, cache_key, response.model_dump_json())
             except Exception:
                 pass
         return response
@@ -297,6 +383,9 @@ async def get_user_rsvps_paginated(email: str, cursor_params: CursorPaginationPa
             has_previous=False,
             page_size=cursor_params.page_size
         )
+    except ValueError:
+        # Undecodable cursor; the route answers 400
+        raise
     except Exception as e:
         logger.error(f"Error in get_user_rsvps_paginated: {e}", exc_info=True)
         return EventCursorPaginatedResponse.create([], None, None, False, False, cursor_params.page_size)
@@ -324,6 +413,9 @@ async def get_user_interested_events_paginated(email: str, cursor_params: Cursor
             has_previous=False,
             page_size=cursor_params.page_size
         )
+    except ValueError:
+        # Undecodable cursor; the route answers 400
+        raise
     except Exception as e:
         logger.error(f"Error in get_user_interested_events_paginated: {e}", exc_info=True)
         return EventCursorPaginatedResponse.create([], None, None, False, False, cursor_params.page_size)
@@ -351,20 +443,8 @@ async def get_archived_events_paginated(cursor_params: CursorPaginationParams, u
         return EventCursorPaginatedResponse.create([], None, None, False, False, cursor_params.page_size)
 
 async def get_rsvp_response_data(event_id: str, user_email: str, action: str) -> dict:
-    """Lightweight RSVP response — fetches only event name + RSVP count."""
-    event_name, rsvp_count = "", 0
-    try:
-        async with AsyncSessionLocal() as session:
-            row = await session.execute(
-                text("SELECT event_name FROM events WHERE event_id = :eid"),
-                {"eid": event_id}
-            )
-            r = row.fetchone()
-            if r:
-                event_name = r.event_name
-        rsvp_count = await event_rsvp_service.repo.get_rsvp_count(event_id)
-    except Exception:
-        pass
+    """Lightweight RSVP response — event name + RSVP count from a single query."""
+    event_name, rsvp_count = await event_rsvp_service.repo.get_rsvp_summary(event_id)
     return {
         "message": f"RSVP {action} successfully",
         "rsvp_status": "going" if action == "created" else None,
@@ -375,57 +455,101 @@ async def get_rsvp_response_data(event_id: str, user_email: str, action: str) ->
         }
     }
 
-async def get_paginated_rsvp_list(event_id: str, page: int = 1, page_size: int = 10) -> dict:
-    """Get paginated RSVP list for an event — count and items fetched separately from DB."""
+async def get_paginated_rsvp_list(event_id: str, page: int = 1, page_size: int = 10, include_total: bool = True) -> dict:
+    """Get paginated RSVP list for an event.
+
+    With include_total the total rides along on each row as a window count,
+    which makes Postgres read every RSVP for the event. Without it the page
+    is fetched with one extra row to tell whether another page exists, and
+    total/total_pages come back as None. user_email breaks updated_at ties
+    so a row can't repeat or go missing between pages.
+    """
     offset = (page - 1) * page_size
+    total_count = None
     try:
         async with AsyncSessionLocal() as session:
-            total_count = int(await session.scalar(
-                text("SELECT COUNT(*) FROM rsvps WHERE event_id = :eid"),
-                {"eid": event_id}
-            ) or 0)
-            result = await session.execute(text("""
-                SELECT user_email, status, rating, review
-                FROM rsvps WHERE event_id = :eid
-                ORDER BY updated_at DESC
-                LIMIT :limit OFFSET :offset
-            """), {"eid": event_id, "limit": page_size, "offset": offset})
+            if include_total:
+                result = await session.execute(text("""
+                    SELECT user_email, status, rating, review, COUNT(*) OVER () AS total
+                    FROM rsvps WHERE event_id = :eid
+                    ORDER BY updated_at DESC, user_email DESC
+                    LIMIT :limit OFFSET :offset
+                """), {"eid": event_id, "limit": page_size, "offset": offset})
+                rows = result.fetchall()
+                if rows:
+                    total_count = int(rows[0].total)
+                elif offset:
+                    # Past the last page: no row to carry the total
+                    total_count = int(await session.scalar(
+                        text("SELECT COUNT(*) FROM rsvps WHERE event_id = :eid"),
+                        {"eid": event_id}
+                    ) or 0)
+                else:
+                    total_count = 0
+                has_next = offset + page_size < total_count
+            else:
+                result = await session.execute(text("""
+                    SELECT user_email, status, rating, review
+                    FROM rsvps WHERE event_id = :eid
+                    ORDER BY updated_at DESC, user_email DESC
+                    LIMIT :limit OFFSET :offset
+                """), {"eid": event_id, "limit": page_size + 1, "offset": offset})
+                rows = result.fetchall()
+                has_next = len(rows) > page_size
+                rows = rows[:page_size]
             items = [
                 {"email": r.user_email, "status": r.status,
                  **({"rating": r.rating} if r.rating is not None else {}),
                  **({"review": r.review} if r.review is not None else {})}
-                for r in result.fetchall()
+                for r in rows
             ]
     except Exception as e:
         logger.error(f"Error in get_paginated_rsvp_list: {e}", exc_info=True)
-        total_count, items = 0, []
+        total_count = 0 if include_total else None
+        items, has_next = [], False
     return {
         "items": items,
         "pagination": {
             "page": page,
             "page_size": page_size,
             "total": total_count,
-            "total_pages": (total_count + page_size - 1) // page_size,
-            "has_next": offset + page_size < total_count,
+            "total_pages": None if total_count is None else (total_count + page_size - 1) // page_size,
+            "has_next": has_next,
             "has_prev": page > 1,
         }
     }
 
+async def get_rsvp_list_cursor_paginated(event_id: str, cursor_params: CursorPaginationParams) -> EventCursorPaginatedResponse:
+    """Keyset-paginated RSVP list for an event — cost is O(page_size) however deep the page"""
+    try:
+        items, next_cursor = await event_rsvp_service.get_rsvp_list_paginated(event_id, cursor_params)
+        return EventCursorPaginatedResponse.create(
+            items=items,
+            next_cursor=next_cursor,
+            prev_cursor=None,
+            has_next=bool(next_cursor),
+            has_previous=False,
+            page_size=cursor_params.page_size
+        )
+    except ValueError:
+        # Undecodable cursor; the route answers 400
+        raise
+    except Exception as e:
+        logger.error(f"Error in get_rsvp_list_cursor_paginated: {e}", exc_info=True)
+        return EventCursorPaginatedResponse.create([], None, None, False, False, cursor_params.page_size)
+
 async def archive_event_with_validation(event_id: str, archived_by: str, reason: str = "Event archived") -> dict:
     """Archive event with business logic validation and response formatting"""
     try:
-        # Business logic: Check if event exists
-        event = await get_event_by_id(event_id)
-        if not event:
+        # Archive first: the UPDATE reports whether the event had ended, and
+        # no row means the event doesn't exist — no separate existence read
+        archived = await event_repo.archive_event_returning(event_id, archived_by, reason)
+        if not archived:
             raise ValueError("Event not found")
+        forget_cached_event(event_id)
+        await flush_event_query_cache()
         
-        # Business logic: Check if event is in the past (optional validation)
-        is_past = is_event_past(event)
-        
-        # Perform archiving
-        success = await archive_event(event_id, archived_by, reason)
-        if not success:
-            raise Exception("Failed to archive event")
+        is_past = archived["wasPast"]
         
         # Format response with business logic
         message = "Event archived successfully"
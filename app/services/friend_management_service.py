@@ -1,27 +1,31 @@
+import asyncio
+
 from app.repositories.friends import FriendRepository
 from app.repositories.users import UserRepository
 from app.models.friend import FriendProfile
 from app.utils.logger import get_service_logger
 from typing import List, Dict, Any, Optional
 
+logger = get_service_logger(__name__)
+
 class FriendManagementService:
     """Service for managing existing friendships (list friends, remove friends)"""
     
     def __init__(self, friend_repo: Optional[FriendRepository] = None, user_repo: Optional[UserRepository] = None):
         self.friend_repo = friend_repo or FriendRepository()
         self.user_repo = user_repo or UserRepository()
-        self.logger = get_service_logger(__name__)
+        self.logger = logger
 
     async def get_friends_list(self, user_email: str) -> List[FriendProfile]:
         """Get the list of friends for a user (without events_created/events_attended for efficiency)"""
         try:
-            # Validate user exists
-            user = await self.user_repo.get_by_email(user_email)
-            if not user:
-                return []
-
-            friend_ids = await self.friend_repo.get_accepted_friendship_ids(user_email)
-            if not friend_ids:
+            # Validating the user and reading their friend ids are independent
+            # reads — fetch them together
+            user, friend_ids = await asyncio.gather(
+                self.user_repo.get_by_email(user_email),
+                self.friend_repo.get_accepted_friendship_ids(user_email),
+            )
+            if not user or not friend_ids:
                 return []
 
             users_by_email = await self.user_repo.get_by_emails(friend_ids)
@@ -54,14 +58,12 @@ class FriendManagementService:
     async def get_friendship_status(self, current_user_email: str, user_id: str) -> Dict[str, Any]:
         """Get the friendship status between current user and another user"""
         try:
-            # Validate current user exists
-            current_user = await self.user_repo.get_by_email(current_user_email)
-            if not current_user:
+            # Validate both users exist (one query)
+            users = await self.user_repo.get_by_emails([current_user_email, user_id])
+            if current_user_email not in users:
                 return {"success": False, "error": "Current user not found"}
             
-            # Validate target user exists
-            target_user = await self.user_repo.get_by_email(user_id)
-            if not target_user:
+            if user_id not in users:
                 return {"success": False, "error": "Target user not found"}
             
             # Get friendship status using existing repository methods
@@ -92,11 +94,10 @@ class FriendManagementService:
     async def remove_friendship(self, user_email: str, friend_email: str) -> Dict[str, Any]:
         """Remove a friendship between two users"""
         try:
-            # Validate both users exist
-            user = await self.user_repo.get_by_email(user_email)
-            friend = await self.user_repo.get_by_email(friend_email)
+            # Validate both users exist (one query)
+            users = await self.user_repo.get_by_emails([user_email, friend_email])
             
-            if not user or not friend:
+            if user_email not in users or friend_email not in users:
                 return {"success": False, "error": "One or both users not found"}
             
             # Get the friendship request using existing method
@@ -118,6 +119,3 @@ class FriendManagementService:
         except Exception as e:
             self.logger.error(f"Error removing friendship: {str(e)}")
             return {"success": False, "error": "Failed to remove friendship"}
-
-# Create service instance
-friend_management_service = FriendManagementService()
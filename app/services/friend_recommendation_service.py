@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from math import radians, sin, cos, asin, sqrt
 from typing import Any, Dict, List, Optional, Set, Tuple
@@ -9,6 +10,8 @@ from app.repositories.users import UserRepository
 from app.repositories.events.event_query_repository import EventQueryRepository
 from app.utils.logger import get_service_logger
 
+logger = get_service_logger(__name__)
+
 
 @dataclass
 class _ScoredCandidate:
@@ -47,7 +50,19 @@ class FriendRecommendationService:
         self.friend_repo = friend_repo or FriendRepository()
         self.user_repo = user_repo or UserRepository()
         self.event_query_repo = event_query_repo or EventQueryRepository()
-        self.logger = get_service_logger(__name__)
+        self.logger = logger
+
+    async def _attended_categories_by_user(self, me_loc: Dict[str, Any]) -> Dict[str, Set[str]]:
+        """Optional: use nearby events to build an "attended categories" signature."""
+        try:
+            rb_city = (me_loc.get("city") or "").strip()
+            rb_state = (me_loc.get("state") or "").strip()
+            if rb_city:
+                return await self.event_query_repo.get_attended_categories_by_user(city=rb_city, state=rb_state)
+        except Exception as e:
+            # This should never break recommendations; it just weakens the score.
+            self.logger.warning(f"Failed to build attended-category signatures: {e}")
+        return {}
 
     async def recommend(
         self,
@@ -62,16 +77,20 @@ class FriendRecommendationService:
         Falls back to rule-based scoring (O(N)) when embedding is NULL.
         """
 
-        me = await self.user_repo.get_by_email(user_email)
+        me = await self.user_repo.get_by_email(user_email, include_embedding=True)
         if not me:
             return []
 
         # ── Semantic path (pgvector) ──────────────────────────────────────────
         # If the current user has an embedding, use ANN similarity search.
         # Excluded set is built the same way for both paths.
+        # Friends and pending requests are independent reads — fetch them together.
         excluded: Set[str] = {user_email}
-        excluded.update(await self.friend_repo.get_accepted_friendship_ids(user_email))
-        pending = await self.friend_repo.get_requests_for_user(user_email, direction="all", status="pending")
+        friend_ids, pending = await asyncio.gather(
+            self.friend_repo.get_accepted_friendship_ids(user_email),
+            self.friend_repo.get_requests_for_user(user_email, direction="all", status="pending"),
+        )
+        excluded.update(friend_ids)
         for r in pending:
             excluded.add(r.get("sender_id", ""))
             excluded.add(r.get("receiver_id", ""))
@@ -120,32 +139,19 @@ class FriendRecommendationService:
             except Exception:
                 me_coords = None
 
-        # Optional: use nearby events to build an "attended categories" signature.
-        attended_cats_by_user: Dict[str, Set[str]] = {}
-        try:
-            rb_city = (me_loc.get("city") or "").strip()
-            rb_state = (me_loc.get("state") or "").strip()
-            if rb_city:
-                nearby_events = await self.event_query_repo.get_external_events(city=rb_city, state=rb_state)
-                for ev in nearby_events:
-                    cats = set((ev.get("categories") or []))
-                    for rsvp in (ev.get("rsvpList") or []):
-                        if rsvp.get("status") == "attended":
-                            ev_email = rsvp.get("email")
-                            if ev_email:
-                                attended_cats_by_user.setdefault(ev_email, set()).update(cats)
-        except Exception as e:
-            # This should never break recommendations; it just weakens the score.
-            self.logger.warning(f"Failed to build attended-category signatures: {e}")
-
-        me_attended = attended_cats_by_user.get(user_email, set())
-
+        # The event signatures and the candidate list don't depend on each
+        # other, so the two queries run concurrently.
         rb_city_filter = me_loc.get("city", "").strip() or None
-        candidates = await self.user_repo.get_recommendation_candidates(
-            city=rb_city_filter,
-            excluded_emails=list(excluded),
+        attended_cats_by_user, candidates = await asyncio.gather(
+            self._attended_categories_by_user(me_loc),
+            self.user_repo.get_recommendation_candidates(
+                city=rb_city_filter,
+                excluded_emails=list(excluded),
+            ),
         )
 
+        me_attended = attended_cats_by_user.get(user_email, set())
+
         scored: List[_ScoredCandidate] = []
         for u in candidates:
             email = u.get("email")
@@ -4,23 +4,25 @@ from app.models.friend import FriendRequestWithProfile, FriendProfile
 from app.utils.logger import get_service_logger
 from typing import List, Dict, Any, Optional
 
+logger = get_service_logger(__name__)
+
 class FriendRequestService:
     """Service for managing friend requests."""
     
     def __init__(self, friend_repo: Optional[FriendRepository] = None, user_repo: Optional[UserRepository] = None):
         self.friend_repo = friend_repo or FriendRepository()
         self.user_repo = user_repo or UserRepository()
-        self.logger = get_service_logger(__name__)
+        self.logger = logger
 
     async def send_friend_request(self, sender_email: str, receiver_id: str) -> Dict[str, Any]:
         """Send a friend request from sender to receiver."""
         try:
-            sender = await self.user_repo.get_by_email(sender_email)
-            if not sender:
+            # Both users in one query rather than a lookup each
+            users = await self.user_repo.get_by_emails([sender_email, receiver_id])
+            if sender_email not in users:
                 return {"success": False, "error": "Sender not found"}
             
-            receiver = await self.user_repo.get_by_email(receiver_id)
-            if not receiver:
+            if receiver_id not in users:
                 return {"success": False, "error": "Receiver not found"}
             
             if sender_email == receiver_id:
@@ -9,6 +9,8 @@ from app.utils.logger import get_service_logger
 from typing import List, Dict, Any, Optional, Literal
 from datetime import datetime
 
+logger = get_service_logger(__name__)
+
 class FriendService:
     """
     Facade service that combines all friend-related functionality.
@@ -18,12 +20,14 @@ class FriendService:
     def __init__(self, friend_repo: Optional[FriendRepository] = None, user_repo: Optional[UserRepository] = None):
         """Initialize service with repository dependencies (supports dependency injection)"""
         # Initialize specialized services with appropriate repositories
+        # One instance of each repository shared by all sub-services
         friend_repo_instance = friend_repo or FriendRepository()
-        self.friend_request_service = FriendRequestService(friend_repo_instance, user_repo)
-        self.friend_management_service = FriendManagementService(friend_repo_instance, user_repo)
-        self.user_discovery_service = UserDiscoveryService(friend_repo_instance, user_repo)
-        self.friend_recommendation_service = FriendRecommendationService(friend_repo_instance, user_repo)
-        self.logger = get_service_logger(__name__)
+        user_repo_instance = user_repo or UserRepository()
+        self.friend_request_service = FriendRequestService(friend_repo_instance, user_repo_instance)
+        self.friend_management_service = FriendManagementService(friend_repo_instance, user_repo_instance)
+        self.user_discovery_service = UserDiscoveryService(friend_repo_instance, user_repo_instance)
+        self.friend_recommendation_service = FriendRecommendationService(friend_repo_instance, user_repo_instance)
+        self.logger = logger
 
     # Friend Request Operations (delegate to FriendRequestService)
     async def send_friend_request(self, sender_email: str, receiver_id: str) -> Dict[str, Any]:
@@ -8,23 +8,25 @@ Phase 2: pgvector ANN search using event embeddings, with hard filters
 (city, state, date) from the LLM parser still applied as WHERE clauses.
 Falls back to Phase 1 SQL path if query embedding is unavailable.
 """
-import base64
 import json
-import os
 from datetime import date, timedelta
-from typing import Optional, Tuple
+from typing import TYPE_CHECKING, Optional, Tuple
 
-from openai import AsyncOpenAI
+import orjson
 
-from app.models.pagination import CursorPaginationParams, EventCursorPaginatedResponse, EventFilters
+from app.models.pagination import CursorPaginationParams, EventCursorPaginatedResponse, EventFilters, decode_cursor, encode_cursor
 from app.models.search import ParsedSearchQuery
 from app.repositories.events.event_query_repository import EventQueryRepository
 from app.services.embedding_service import EmbeddingProviderError, EmbeddingUnavailableError, generate_query_embedding
-from app.services.event_service import get_all_events_paginated
-from app.utils.cache_keys import embedding_cache_key, search_cache_key, TTL_EMBEDDING, TTL_EVENT_QUERY
+from app.services.event_service import cache_event_query, get_all_events_paginated
+from app.utils.cache_keys import embedding_cache_key, search_cache_key, TTL_EMBEDDING
 from app.utils.logger import get_service_logger
+from app.utils.openai_client import get_openai_client
 from app.utils.redis_client import get_redis_client
 
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
 _event_query_repo = EventQueryRepository()
 
 logger = get_service_logger(__name__)
@@ -32,31 +34,21 @@ logger = get_service_logger(__name__)
 
 def _encode_semantic_cursor(offset: int) -> str:
     """Encode an offset as a base64 semantic cursor (distinct from keyset cursors)."""
-    return base64.b64encode(json.dumps({"type": "semantic", "offset": offset}).encode()).decode()
+    return encode_cursor({"type": "semantic", "offset": offset})
 
 
 def _decode_semantic_cursor(cursor: str) -> Optional[int]:
     """Decode a semantic cursor, returning the offset. Returns None if not a semantic cursor."""
-    try:
-        data = json.loads(base64.b64decode(cursor.encode()).decode())
-        if data.get("type") == "semantic":
-            return data["offset"]
-    except Exception:
-        pass
+    data = decode_cursor(cursor)
+    if data and data.get("type") == "semantic":
+        return data.get("offset")
     return None
 
-_openai_client: Optional[AsyncOpenAI] = None
-
-
-def _get_openai_client() -> Optional[AsyncOpenAI]:
-    global _openai_client
-    if _openai_client is None:
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            logger.warning("OPENAI_API_KEY not set — natural language search unavailable")
-            return None
-        _openai_client = AsyncOpenAI(api_key=api_key)
-    return _openai_client
+def _get_openai_client() -> Optional["AsyncOpenAI"]:
+    client = get_openai_client()
+    if client is None:
+        logger.warning("OPENAI_API_KEY not set — natural language search unavailable")
+    return client
 
 
 _SYSTEM_PROMPT = """\
@@ -158,8 +150,8 @@ async def search_events(
         try:
             cached = await redis.get(cache_key)
             if cached:
-                logger.debug(f"[SearchCache] hit {cache_key}")
-                return EventCursorPaginatedResponse(**json.loads(cached))
+                logger.debug("[SearchCache] hit %s", cache_key)
+                return EventCursorPaginatedResponse.model_validate_json(cached)
         except Exception:
             pass
 
@@ -195,7 +187,7 @@ async def search_events(
             try:
                 cached_emb = await redis.get(emb_key)
                 if cached_emb:
-                    query_embedding = json.loads(cached_emb)
+                    query_embedding = orjson.loads(cached_emb)
             except Exception:
                 pass
         if query_embedding is None:
@@ -205,7 +197,7 @@ async def search_events(
                 logger.warning(f"[SearchService] Embedding unavailable, falling back to SQL: {emb_err}")
             if query_embedding is not None and redis is not None:
                 try:
-                    await redis.set(emb_key, json.dumps(query_embedding), ex=TTL_EMBEDDING)
+                    await redis.set(emb_key, orjson.dumps(query_embedding), ex=TTL_EMBEDDING)
                 except Exception:
                     pass
         if query_embedding is not None:
@@ -232,7 +224,7 @@ async def search_events(
             if page:
                 if redis is not None and offset == 0:
                     try:
-                        await redis.set(cache_key, response.model_dump_json(), ex=TTL_EVENT_QUERY)
+                        await cache_event_query(redis, cache_key, response.model_dump_json())
                     except Exception:
                         pass
                 return response
@@ -258,7 +250,7 @@ async def search_events(
     # Cache first-page results
     if redis is not None and cursor_params.cursor is None:
         try:
-            await redis.set(cache_key, response.model_dump_json(), ex=TTL_EVENT_QUERY)
+            await cache_event_query(redis, cache_key, response.model_dump_json())
         except Exception:
             pass
 
@@ -1,12 +1,15 @@
+import asyncio
 import json
-import os
 
 from app.repositories.friends import FriendRepository
 from app.repositories.users import UserRepository
 from app.models.friend import UserSearchResult
 from app.utils.logger import get_service_logger
+from app.utils.openai_client import get_openai_client
 from typing import List, Dict, Any, Optional, Literal, Set
 
+logger = get_service_logger(__name__)
+
 _PERSON_PARSE_PROMPT = """\
 You are a profile trait extractor for a people-matching app.
 Given a natural language description of a person the user wants to meet, extract traits and rewrite them in the same structured format used for user profiles.
@@ -35,11 +38,9 @@ async def _enrich_user_query(description: str) -> str:
     Falls back to the raw description if OpenAI is unavailable.
     """
     try:
-        from openai import AsyncOpenAI
-        key = os.getenv("OPENAI_API_KEY")
-        if not key:
+        client = get_openai_client()
+        if client is None:
             return description
-        client = AsyncOpenAI(api_key=key)
         response = await client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[
@@ -60,7 +61,7 @@ class UserDiscoveryService:
     def __init__(self, friend_repo: Optional[FriendRepository] = None, user_repo: Optional[UserRepository] = None):
         self.friend_repo = friend_repo or FriendRepository()
         self.user_repo = user_repo or UserRepository()
-        self.logger = get_service_logger(__name__)
+        self.logger = logger
 
     async def search_users(self, search_term: str, user_email: str, limit: int = 20) -> List[UserSearchResult]:
         """Search for users and include friendship status"""
@@ -208,30 +209,40 @@ class UserDiscoveryService:
 
         # Permanent misconfiguration → 503, no point attempting the call.
         # Transient provider failure → also 503 (caller should retry, not cache [] as 'no results').
-        enriched = await _enrich_user_query(description)
-        self.logger.info(f"[SemanticSearch] query='{description}' → enriched='{enriched}'")
-        try:
-            query_embedding = await generate_query_embedding(enriched)
-        except EmbeddingUnavailableError as e:
-            self.logger.error(f"[SemanticSearch] Embedding service not configured: {e}")
-            raise HTTPException(status_code=503, detail="Semantic search is not available")
-        except EmbeddingProviderError as e:
-            self.logger.warning(f"[SemanticSearch] Embedding provider error (transient): {e}")
-            raise HTTPException(status_code=503, detail="Semantic search temporarily unavailable")
+        async def embed_query():
+            enriched = await _enrich_user_query(description)
+            self.logger.debug("[SemanticSearch] query=%r → enriched=%r", description, enriched)
+            try:
+                return await generate_query_embedding(enriched)
+            except EmbeddingUnavailableError as e:
+                self.logger.error(f"[SemanticSearch] Embedding service not configured: {e}")
+                raise HTTPException(status_code=503, detail="Semantic search is not available")
+            except EmbeddingProviderError as e:
+                self.logger.warning(f"[SemanticSearch] Embedding provider error (transient): {e}")
+                raise HTTPException(status_code=503, detail="Semantic search temporarily unavailable")
 
         # Build exclusion set using strict queries so a DB failure cannot silently
         # collapse the exclusion set and leak friends/pending users into results.
-        try:
+        async def build_exclusions():
+            try:
+                friend_ids, pending = await asyncio.gather(
+                    self.friend_repo.get_accepted_friendship_ids_strict(user_email),
+                    self.friend_repo.get_requests_for_user_strict(user_email, direction="all", status="pending"),
+                )
+            except Exception as e:
+                self.logger.error(f"[SemanticSearch] DB error building exclusion set: {e}", exc_info=True)
+                raise HTTPException(status_code=503, detail="Service temporarily unavailable")
             excluded: Set[str] = {user_email}
-            excluded.update(await self.friend_repo.get_accepted_friendship_ids_strict(user_email))
-            pending = await self.friend_repo.get_requests_for_user_strict(user_email, direction="all", status="pending")
+            excluded.update(friend_ids)
             for r in pending:
                 excluded.add(r.get("sender_id", ""))
                 excluded.add(r.get("receiver_id", ""))
             excluded.discard("")
-        except Exception as e:
-            self.logger.error(f"[SemanticSearch] DB error building exclusion set: {e}", exc_info=True)
-            raise HTTPException(status_code=503, detail="Service temporarily unavailable")
+            return excluded
+
+        # The LLM rewrite + embedding and the exclusion reads don't depend on
+        # each other, so their round trips overlap instead of adding up
+        query_embedding, excluded = await asyncio.gather(embed_query(), build_exclusions())
 
         users_data = await self.user_repo.get_semantic_matches(
             user_email=user_email,
@@ -256,7 +267,3 @@ class UserDiscoveryService:
                 "friendship_status": "none",
             })
         return results
-
-
-# Create service instance
-user_discovery_service = UserDiscoveryService()
@@ -1,5 +1,5 @@
 from app.repositories.users import UserRepository
-from app.models.pagination import PaginationParams, UserPaginatedResponse, UserFilters
+from app.models.pagination import CursorPaginatedResponse, CursorPaginationParams, PaginationParams, UserPaginatedResponse, UserFilters
 from app.utils.logger import get_service_logger
 from typing import Optional
 
@@ -22,22 +22,16 @@ async def update_user_data(user_data: dict, user_email: str):
     return await repo.update_profile_by_email(user_data, user_email)
 
 async def store_or_update_user_data(user_data: dict):
-    from app.services.embedding_service import generate_and_store_user_embedding
-    existing_user = await repo.get_by_email(user_data["email"])
-    if existing_user:
-        await repo.update_profile_by_email(user_data, user_data["email"])
-    else:
-        await repo.store_google_user(user_data)
-        # Best-effort embedding for new Google users (fires if bio/interests populated later via OAuth profile)
-        full_user = await repo.get_by_email(user_data["email"])
-        if full_user:
-            await generate_and_store_user_embedding(full_user)
+    """Upsert a Google user and return the stored profile (None on failure)."""
+    return await repo.store_google_user(user_data)
 
 # ✅ New function to validate email addresses (used in role assignment)
 async def validate_user_emails(email_list: list[str]) -> dict:
+    # One ANY(:emails) query instead of a round trip per address
+    found = await repo.get_by_emails(list(set(email_list)))
     valid, invalid = [], []
     for email in email_list:
-        if await repo.get_by_email(email):
+        if email in found:
             valid.append(email)
         else:
             invalid.append(email)
@@ -56,4 +50,13 @@ async def get_all_users_paginated(pagination: PaginationParams, filters: Optiona
         return UserPaginatedResponse.create(users, total_count, pagination.page, pagination.page_size)
     except Exception as e:
         logger.error(f"Error in get_all_users_paginated: {e}", exc_info=True)
-        return UserPaginatedResponse.create([], 0, pagination.page, pagination.page_size)
\ No newline at end of file
+        return UserPaginatedResponse.create([], 0, pagination.page, pagination.page_size)
+
+async def get_all_users_cursor_paginated(cursor_params: CursorPaginationParams, filters: Optional[UserFilters] = None) -> CursorPaginatedResponse:
+    """Keyset-paginated users (by email) — cost is O(page_size) however deep the page"""
+    try:
+        users, next_cursor, prev_cursor, has_next, has_previous = await repo.get_all_users_cursor_paginated(cursor_params, filters)
+        return CursorPaginatedResponse.create(users, next_cursor, prev_cursor, has_next, has_previous, cursor_params.page_size)
+    except Exception as e:
+        logger.error(f"Error in get_all_users_cursor_paginated: {e}", exc_info=True)
+        return CursorPaginatedResponse.create([], None, None, False, False, cursor_params.page_size)
@@ -0,0 +1,32 @@
+"""
+Tests for app/utils/asgi_middleware.py
+"""
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.utils.asgi_middleware import ResponseTimeMiddleware
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(ResponseTimeMiddleware)
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    return TestClient(app)
+
+
+class TestResponseTimeMiddleware:
+
+    def test_adds_response_time_header(self):
+        response = _client().get("/ping")
+        assert response.status_code == 200
+        assert response.json() == {"ok": True}
+        assert response.headers["x-response-time"].endswith("ms")
+
+    def test_header_present_on_404(self):
+        response = _client().get("/missing")
+        assert response.status_code == 404
+        assert "x-response-time" in response.headers
@@ -1,12 +1,12 @@
 """
 Tests for app/utils/cache_utils.py
 
-Covers: load_url_cache, save_url_cache — Redis path + file fallback
+Covers: load_url_cache, save_url_cache — Redis path + file fallback; LocalTTLCache
 """
 import pytest
 import json
 from unittest.mock import AsyncMock, patch, mock_open
-from app.utils.cache_utils import load_url_cache, save_url_cache
+from app.utils.cache_utils import LocalTTLCache, load_url_cache, save_url_cache
 
 
 class TestLoadUrlCache:
@@ -103,3 +103,30 @@ class TestSaveUrlCache:
         # All URLs should be passed as positional args after the key
         passed_urls = set(call_args[0][1:])
         assert passed_urls == urls
+
+
+class TestLocalTTLCache:
+
+    def test_entries_expire_after_ttl(self):
+        cache = LocalTTLCache(ttl=10)
+        with patch("app.utils.cache_utils.time.monotonic", return_value=100.0):
+            cache.set("k", "v")
+            assert cache.get("k") == "v"
+        with patch("app.utils.cache_utils.time.monotonic", return_value=111.0):
+            assert cache.get("k") is None
+
+    def test_evicts_oldest_when_full(self):
+        cache = LocalTTLCache(ttl=60, maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+        assert cache.get("a") is None
+        assert (cache.get("b"), cache.get("c")) == (2, 3)
+
+    def test_pop_drops_one_entry(self):
+        cache = LocalTTLCache(ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.pop("a")
+        cache.pop("missing")
+        assert (cache.get("a"), cache.get("b")) == (None, 2)
@@ -0,0 +1,40 @@
+"""
+Unit tests for the settings and Firebase credential handling in app/config.py
+"""
+from unittest.mock import patch
+
+import pytest
+
+from app import config
+
+
+class TestGetFirebaseCredentials:
+
+    def test_cloud_run_uses_secret_in_memory(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("GOOGLE_APPLICATION_CREDENTIALS", raising=False)
+        monkeypatch.chdir(tmp_path)
+        creds = {"type": "service_account"}
+
+        with patch.object(config, "_fetch_firebase_creds", return_value=creds) as fetch:
+            assert config.get_firebase_credentials() is creds
+
+        fetch.assert_called_once()
+        assert list(tmp_path.iterdir()) == []  # nothing written to disk
+
+    def test_local_key_file_skips_secret_manager(self, monkeypatch):
+        monkeypatch.setenv("GOOGLE_APPLICATION_CREDENTIALS", "/keys/firebase.json")
+
+        with patch.object(config, "_fetch_firebase_creds") as fetch:
+            assert config.get_firebase_credentials() == "/keys/firebase.json"
+
+        fetch.assert_not_called()
+
+
+class TestParseLogLevel:
+
+    def test_normalizes_case_and_whitespace(self):
+        assert config._parse_log_level(" warning ") == "WARNING"
+
+    def test_unknown_level_is_a_clear_config_error(self):
+        with pytest.raises(RuntimeError, match="Invalid LOG_LEVEL 'verbose'"):
+            config._parse_log_level("verbose")
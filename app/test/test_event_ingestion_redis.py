@@ -79,6 +79,17 @@ class TestIngestEvent:
                 result = await ingest_event({"originalId": "tm-005"}, redis=mock_redis)
         assert result is True  # fell back to Firestore path and saved
 
+    @pytest.mark.asyncio
+    async def test_duplicate_is_not_geocoded(self):
+        from app.services import event_ingestion_service
+        from app.services.event_ingestion_service import ingest_event, repo
+        event = {"originalId": "tm-007", "source": "ticketmaster", "location": {"city": "Tempe"}}
+        with patch.object(repo, 'get_by_original_id', new_callable=AsyncMock, return_value={"event_id": "evt-1"}), \
+             patch.object(event_ingestion_service, 'apply_geocode_fallback', new_callable=AsyncMock) as mock_geocode:
+            result = await ingest_event(event, redis=None)
+        assert result is False
+        mock_geocode.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_no_redis_uses_firestore_dedup(self):
         from app.services.event_ingestion_service import ingest_event, repo
@@ -87,6 +98,85 @@ class TestIngestEvent:
         assert result is False
 
 
+# ── ingest_bulk_events ────────────────────────────────────────────────────────
+
+class TestIngestBulkEvents:
+
+    @pytest.mark.asyncio
+    async def test_dedup_and_insert_are_batched(self):
+        from app.services.event_ingestion_service import ingest_bulk_events, repo
+        events = [
+            {"originalId": "tm-1"},
+            {"originalId": "tm-2"},
+            {"originalId": "tm-2"},  # in-batch duplicate
+            {"originalId": "tm-3"},
+            {"title": "no original id"},
+        ]
+        mock_redis = AsyncMock()
+        mock_redis.smismember = AsyncMock(return_value=[1, 0, 0])  # tm-1 cached
+        with patch.object(repo, 'get_existing_original_ids', new_callable=AsyncMock, return_value={"tm-2"}) as mock_existing, \
+             patch.object(repo, 'save_bulk_events', new_callable=AsyncMock, return_value=2) as mock_bulk:
+            result = await ingest_bulk_events(events, redis=mock_redis)
+
+        assert result == {"total": 5, "saved": 2, "skipped": 3}
+        mock_redis.smismember.assert_called_once()
+        mock_existing.assert_called_once_with(["tm-2", "tm-3"])
+        mock_bulk.assert_called_once_with([{"originalId": "tm-3"}, {"title": "no original id"}])
+        mock_redis.sadd.assert_called_once()
+        assert mock_redis.sadd.call_args[0][1:] == ("tm-3",)
+
+    @pytest.mark.asyncio
+    async def test_partial_save_does_not_mark_redis(self):
+        from app.services.event_ingestion_service import ingest_bulk_events, repo
+        mock_redis = AsyncMock()
+        mock_redis.smismember = AsyncMock(return_value=[0, 0])
+        with patch.object(repo, 'get_existing_original_ids', new_callable=AsyncMock, return_value=set()), \
+             patch.object(repo, 'save_bulk_events', new_callable=AsyncMock, return_value=1):
+            result = await ingest_bulk_events([{"originalId": "a"}, {"originalId": "b"}], redis=mock_redis)
+
+        assert result["saved"] == 1
+        mock_redis.sadd.assert_not_called()
+
+
+    @pytest.mark.asyncio
+    async def test_geocoding_runs_concurrently_with_cap(self):
+        import asyncio
+        from app.services import event_ingestion_service as svc
+        in_flight = peak = 0
+
+        async def _slow_geocode(event):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        events = [{"originalId": f"tm-{i}"} for i in range(20)]
+        with patch.object(svc, '_apply_geocode_if_needed', _slow_geocode), \
+             patch.object(svc.repo, 'get_existing_original_ids', new_callable=AsyncMock, return_value=set()), \
+             patch.object(svc.repo, 'save_bulk_events', new_callable=AsyncMock, return_value=20):
+            result = await svc.ingest_bulk_events(events)
+
+        assert result["saved"] == 20
+        assert peak == svc._GEOCODE_CONCURRENCY
+
+    @pytest.mark.asyncio
+    async def test_known_events_are_not_geocoded(self):
+        from app.services import event_ingestion_service as svc
+        geocoded = []
+
+        async def _record_geocode(event):
+            geocoded.append(event["originalId"])
+
+        events = [{"originalId": "tm-old"}, {"originalId": "tm-new"}]
+        with patch.object(svc, '_apply_geocode_if_needed', _record_geocode), \
+             patch.object(svc.repo, 'get_existing_original_ids', new_callable=AsyncMock, return_value={"tm-old"}), \
+             patch.object(svc.repo, 'save_bulk_events', new_callable=AsyncMock, return_value=1):
+            await svc.ingest_bulk_events(events)
+
+        assert geocoded == ["tm-new"]
+
+
 # ── Mutex lock ────────────────────────────────────────────────────────────────
 
 class TestIngestionMutex:
@@ -9,6 +9,12 @@ import pytest
 from unittest.mock import MagicMock
 
 from app.repositories.events.event_mapper import (
+    EVENT_CARD_COLUMNS,
+    EVENT_COLUMNS,
+    EVENT_SELECT_COLUMNS,
+    _COLUMN_TO_CAMEL,
+    _LOCATION_COLS,
+    _strptime_fallback,
     parse_datetime,
     row_to_event_dict,
     build_update_params,
@@ -51,6 +57,10 @@ class TestParseDatetime:
         assert isinstance(result, datetime.datetime)
         assert result.microsecond == 123456
 
+    def test_space_separated_naive_string_gets_utc(self):
+        result = parse_datetime("2025-06-01 12:30:00")
+        assert result == datetime.datetime(2025, 6, 1, 12, 30, tzinfo=datetime.timezone.utc)
+
     def test_bare_date_string_returns_none(self):
         # "2025-06-01" alone does not match any format → returns None
         result = parse_datetime("2025-06-01")
@@ -67,6 +77,27 @@ class TestParseDatetime:
         assert isinstance(result, datetime.datetime)
         assert result.tzinfo == datetime.timezone.utc
 
+    def test_offset_without_colon(self):
+        result = parse_datetime("2025-06-01T12:00:00+0000")
+        assert result == datetime.datetime(2025, 6, 1, 12, tzinfo=datetime.timezone.utc)
+
+    def test_single_digit_fraction_with_z(self):
+        result = parse_datetime("2025-06-01T12:00:00.5Z")
+        assert result == datetime.datetime(
+            2025, 6, 1, 12, 0, 0, 500000, tzinfo=datetime.timezone.utc
+        )
+
+    def test_strptime_fallback_covers_shapes_py310_fromisoformat_rejects(self):
+        # The image's Python 3.10 fromisoformat raises on both of these;
+        # the fallback must still parse them.
+        assert _strptime_fallback("2025-06-01T12:00:00+0000") == datetime.datetime(
+            2025, 6, 1, 12, tzinfo=datetime.timezone.utc
+        )
+        assert _strptime_fallback("2025-06-01T12:00:00.5+00:00") == datetime.datetime(
+            2025, 6, 1, 12, 0, 0, 500000, tzinfo=datetime.timezone.utc
+        )
+        assert _strptime_fallback("not-a-date") is None
+
 
 # ── row_to_event_dict ─────────────────────────────────────────────────────────
 
@@ -260,5 +291,38 @@ class TestBuildUpdateParams:
         params = build_update_params({"imageUrl": "https://example.com/img.png"})
         assert params["image_url"] == "https://example.com/img.png"
 
+    def test_is_archived_always_a_bool(self):
+        assert build_update_params({"isArchived": None}) == {"is_archived": False}
+        assert build_update_params({"isArchived": True}) == {"is_archived": True}
+
+    def test_is_archived_string_rejected(self):
+        for value in ("false", "true", 0, 1):
+            with pytest.raises(ValueError):
+                build_update_params({"isArchived": value})
+
     def test_empty_input_returns_empty_dict(self):
         assert build_update_params({}) == {}
+
+
+
+# ── EVENT_COLUMNS ──────────────────────────────────────────────────────────────
+
+class TestEventColumns:
+
+    def test_covers_every_mapped_column(self):
+        assert set(_COLUMN_TO_CAMEL) | _LOCATION_COLS <= set(EVENT_COLUMNS)
+
+    def test_excludes_vector_columns(self):
+        assert "embedding" not in EVENT_COLUMNS
+        assert "search_vector" not in EVENT_COLUMNS
+        assert EVENT_SELECT_COLUMNS.startswith("e.event_id, e.event_name")
+
+    def test_card_columns_rebuild_location_and_cursor_keys(self):
+        assert set(EVENT_CARD_COLUMNS) < set(EVENT_COLUMNS)
+        assert _LOCATION_COLS <= set(EVENT_CARD_COLUMNS)
+        row = MagicMock()
+        row._mapping = {c: None for c in EVENT_CARD_COLUMNS}
+        event = row_to_event_dict(row)
+        # Keyset cursors are built from these two keys
+        assert "eventId" in event and "startTime" in event
+        assert "description" not in event
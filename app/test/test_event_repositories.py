@@ -1,12 +1,15 @@
 """
 Unit tests for event repositories:
+- EventCrudRepository
 - EventRsvpRepository
 - EventArchiveRepository
 - EventIngestionRepository
 - EventUserRepository
+- EventQueryRepository
 
 All DB interactions are mocked — no real PostgreSQL connection.
 """
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -36,6 +39,66 @@ def _make_row(mapping: dict):
     return row
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# EventCrudRepository
+# ═══════════════════════════════════════════════════════════════════════════════
+
+_CRUD_PATCH = 'app.repositories.events.event_crud_repository.AsyncSessionLocal'
+
+
+class TestEventCrudRepository:
+
+    async def test_create_event_writes_roles_in_the_same_statement(self):
+        from app.repositories.events.event_crud_repository import EventCrudRepository
+        session = make_mock_session()
+        session.execute = AsyncMock(return_value=_make_execute_result())
+
+        with patch(_CRUD_PATCH, return_value=session), \
+             patch('app.repositories.events.event_crud_repository._embed_event', new_callable=AsyncMock):
+            result = await EventCrudRepository().create_event({
+                "eventName": "Jam", "startTime": "2026-01-01T00:00:00Z", "duration": 60,
+                "organizers": ["a@example.com"], "createdByEmail": "a@example.com",
+            })
+
+        session.execute.assert_awaited_once()
+        sql, params = session.execute.call_args.args
+        assert "INSERT INTO event_organizers" in str(sql) and "INSERT INTO event_moderators" in str(sql)
+        assert params["event_id"] == result["eventId"]
+        assert (params["organizers"], params["moderators"]) == (["a@example.com"], [])
+        session.commit.assert_awaited_once()
+
+    async def test_update_event_embeds_from_returned_row_in_one_round_trip(self):
+        from app.repositories.events.event_crud_repository import EventCrudRepository
+        session = make_mock_session()
+        row = MagicMock(event_name="New name", description="d", categories=["music"], city="Tempe", state="AZ")
+        session.execute = AsyncMock(return_value=_make_execute_result(fetchone_row=row))
+
+        with patch(_CRUD_PATCH, return_value=session), \
+             patch('app.repositories.events.event_crud_repository._embed_event', new_callable=AsyncMock) as mock_embed:
+            repo = EventCrudRepository()
+            repo.get_event_by_id = AsyncMock()
+            result = await repo.update_event("evt-001", {"eventName": "New name"})
+            await asyncio.sleep(0)  # let the background embedding task run
+
+        assert result is True
+        session.execute.assert_called_once()
+        assert "RETURNING" in str(session.execute.call_args[0][0])
+        repo.get_event_by_id.assert_not_called()
+        assert mock_embed.call_args[0][0]["event_name"] == "New name"
+
+    async def test_update_event_missing_row_returns_false(self):
+        from app.repositories.events.event_crud_repository import EventCrudRepository
+        session = make_mock_session()
+        session.execute = AsyncMock(return_value=_make_execute_result(fetchone_row=None))
+
+        with patch(_CRUD_PATCH, return_value=session), \
+             patch('app.repositories.events.event_crud_repository._embed_event', new_callable=AsyncMock) as mock_embed:
+            result = await EventCrudRepository().update_event("missing", {"eventName": "x"})
+
+        assert result is False
+        mock_embed.assert_not_called()
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # EventRsvpRepository
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -62,23 +125,26 @@ class TestEventRsvpRepository:
     async def test_set_rsvp_status_returns_false_when_event_not_found(self):
         from app.repositories.events.event_rsvp_repository import EventRsvpRepository
         session = make_mock_session()
-        # scalar returns None → event doesn't exist
-        session.scalar = AsyncMock(return_value=None)
+        # The guarded upsert reports the event as unavailable
+        missing = _make_execute_result()
+        missing.scalar.return_value = False
+        session.execute = AsyncMock(return_value=missing)
 
         with patch(_RSVP_PATCH, return_value=session):
             repo = EventRsvpRepository()
             result = await repo._set_rsvp_status("no-such-event", "user@example.com", "joined")
 
         assert result is False
-        # execute (the INSERT) should NOT be called when event doesn't exist
-        session.execute.assert_not_called()
+        # Existence check is folded into the upsert — no separate lookup
+        session.scalar.assert_not_called()
 
     async def test_set_rsvp_status_returns_true_when_event_exists(self):
         from app.repositories.events.event_rsvp_repository import EventRsvpRepository
         session = make_mock_session()
-        # scalar returns 1 → event exists
-        session.scalar = AsyncMock(return_value=1)
-        session.execute = AsyncMock(return_value=MagicMock())
+        # Event exists; a repeated RSVP touches no row but still succeeds
+        available = _make_execute_result(rowcount=0)
+        available.scalar.return_value = True
+        session.execute = AsyncMock(return_value=available)
 
         with patch(_RSVP_PATCH, return_value=session):
             repo = EventRsvpRepository()
@@ -86,7 +152,11 @@ class TestEventRsvpRepository:
 
         assert result is True
         session.execute.assert_called_once()
+        sql = str(session.execute.call_args[0][0])
+        assert "WHERE EXISTS" in sql
+        assert "rsvps.status IS DISTINCT FROM EXCLUDED.status" in sql
         session.commit.assert_called_once()
+        session.scalar.assert_not_called()
 
     async def test_cancel_rsvp_returns_true_on_success(self):
         from app.repositories.events.event_rsvp_repository import EventRsvpRepository
@@ -151,6 +221,94 @@ class TestEventRsvpRepository:
         assert captured_params["rating"] == 4
         assert captured_params["review"] == "Was good"
 
+    async def test_rsvp_list_paginated_uses_keyset_cursor(self):
+        import datetime
+        from app.models.pagination import CursorInfo, CursorPaginationParams
+        from app.repositories.events.event_rsvp_repository import EventRsvpRepository
+        ts = datetime.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc)
+        rows = [
+            MagicMock(user_email=f"u{i}@example.com", status="joined", rating=None, review=None, updated_at=ts)
+            for i in range(3)
+        ]
+        session = make_mock_session()
+        session.execute = AsyncMock(return_value=_make_execute_result(fetchall_rows=rows))
+        cursor = CursorInfo(start_time=ts.isoformat(), event_id="u9@example.com").encode()
+
+        with patch(_RSVP_PATCH, return_value=session):
+            repo = EventRsvpRepository()
+            items, next_cursor = await repo.get_rsvp_list_paginated(
+                "evt-001", CursorPaginationParams(cursor=cursor, page_size=2)
+            )
+
+        stmt, params = session.execute.call_args.args
+        assert "OFFSET" not in str(stmt)
+        assert "(updated_at, user_email) < (:cursor_time, :cursor_email)" in str(stmt)
+        assert params["cursor_email"] == "u9@example.com" and params["limit"] == 3
+        assert [i["email"] for i in items] == ["u0@example.com", "u1@example.com"]
+        assert CursorInfo.decode(next_cursor).event_id == "u1@example.com"
+
+    async def test_rsvp_list_paginated_rejects_undecodable_cursor(self):
+        from app.models.pagination import CursorPaginationParams
+        from app.repositories.events.event_rsvp_repository import EventRsvpRepository
+        session = make_mock_session()
+        repo = EventRsvpRepository()
+
+        with patch(_RSVP_PATCH, return_value=session), patch.object(repo.logger, "error") as log_error:
+            with pytest.raises(ValueError, match="Invalid cursor format"):
+                await repo.get_rsvp_list_paginated(
+                    "evt-001", CursorPaginationParams(cursor="not-a-cursor", page_size=2)
+                )
+
+        session.execute.assert_not_called()
+        log_error.assert_not_called()  # a bad client cursor is not a server error
+
+    async def test_user_rsvps_paginated_rejects_undecodable_cursor(self):
+        from app.models.pagination import CursorPaginationParams
+        from app.repositories.events.event_rsvp_repository import EventRsvpRepository
+        session = make_mock_session()
+        repo = EventRsvpRepository()
+
+        with patch(_RSVP_PATCH, return_value=session), patch.object(repo.logger, "error") as log_error:
+            with pytest.raises(ValueError, match="Invalid cursor format"):
+                await repo.get_user_rsvps_paginated(
+                    "a@example.com", CursorPaginationParams(cursor="not-a-cursor", page_size=2)
+                )
+
+        session.execute.assert_not_called()
+        log_error.assert_not_called()
+
+    async def test_user_rsvps_paginated_resumes_after_start_time_and_event_id(self):
+        from app.models.pagination import CursorInfo, CursorPaginationParams
+        from app.repositories.events.event_rsvp_repository import EventRsvpRepository
+        session = make_mock_session()
+        session.execute = AsyncMock(return_value=_make_execute_result(fetchall_rows=[]))
+        cursor = CursorInfo(start_time="2026-01-01T10:00:00+00:00", event_id="evt-007").encode()
+
+        with patch(_RSVP_PATCH, return_value=session):
+            await EventRsvpRepository().get_user_rsvps_paginated(
+                "a@example.com", CursorPaginationParams(cursor=cursor, page_size=2)
+            )
+
+        stmt, params = session.execute.call_args.args
+        assert "(e.start_time, e.event_id) > (:cursor_time, :cursor_id)" in str(stmt)
+        assert "ORDER BY e.start_time ASC, e.event_id ASC" in str(stmt)
+        assert params["cursor_id"] == "evt-007" and params["limit"] == 3
+
+    async def test_rsvp_summary_reads_name_and_count_together(self):
+        from app.repositories.events.event_rsvp_repository import EventRsvpRepository
+        session = make_mock_session()
+        session.execute = AsyncMock(side_effect=[
+            _make_execute_result(fetchone_row=MagicMock(event_name="Jazz Night", rsvp_count=7)),
+            _make_execute_result(fetchone_row=None),
+        ])
+
+        with patch(_RSVP_PATCH, return_value=session):
+            repo = EventRsvpRepository()
+            assert await repo.get_rsvp_summary("evt-001") == ("Jazz Night", 7)
+            assert await repo.get_rsvp_summary("missing") == ("", 0)
+
+        assert session.execute.await_count == 2
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # EventArchiveRepository
@@ -161,10 +319,11 @@ _ARCHIVE_PATCH = 'app.repositories.events.event_archive_repository.AsyncSessionL
 
 class TestEventArchiveRepository:
 
-    async def test_archive_event_returns_true_when_rowcount_gt_0(self):
+    async def test_archive_event_returns_true_when_row_updated(self):
         from app.repositories.events.event_archive_repository import EventArchiveRepository
         session = make_mock_session()
-        session.execute = AsyncMock(return_value=_make_execute_result(rowcount=1))
+        row = MagicMock(was_past=False)
+        session.execute = AsyncMock(return_value=_make_execute_result(rowcount=1, fetchone_row=row))
 
         with patch(_ARCHIVE_PATCH, return_value=session):
             repo = EventArchiveRepository()
@@ -172,10 +331,10 @@ class TestEventArchiveRepository:
 
         assert result is True
 
-    async def test_archive_event_returns_false_when_rowcount_is_0(self):
+    async def test_archive_event_returns_false_when_no_row_updated(self):
         from app.repositories.events.event_archive_repository import EventArchiveRepository
         session = make_mock_session()
-        session.execute = AsyncMock(return_value=_make_execute_result(rowcount=0))
+        session.execute = AsyncMock(return_value=_make_execute_result(rowcount=0, fetchone_row=None))
 
         with patch(_ARCHIVE_PATCH, return_value=session):
             repo = EventArchiveRepository()
@@ -183,6 +342,83 @@ class TestEventArchiveRepository:
 
         assert result is False
 
+    async def test_archive_event_returning_reports_past_from_sql(self):
+        from app.repositories.events.event_archive_repository import EventArchiveRepository
+        session = make_mock_session()
+        session.execute = AsyncMock(return_value=_make_execute_result(fetchone_row=MagicMock(was_past=True)))
+
+        with patch(_ARCHIVE_PATCH, return_value=session):
+            result = await EventArchiveRepository().archive_event_returning("evt-001", "admin@example.com")
+
+        assert result == {"wasPast": True}
+        session.execute.assert_awaited_once()
+        assert "end_time < NOW()" in str(session.execute.call_args.args[0])
+
+    async def test_archive_past_events_direct_filters_on_stored_end_time(self):
+        from app.repositories.events import event_archive_repository
+        from app.repositories.events.event_archive_repository import EventArchiveRepository
+        session = make_mock_session()
+        session.execute = AsyncMock(return_value=_make_execute_result(rowcount=4))
+
+        with patch(_ARCHIVE_PATCH, return_value=session), \
+             patch.object(event_archive_repository, "_ARCHIVE_WORKERS", 1):
+            repo = EventArchiveRepository()
+            result = await repo.archive_past_events_direct()
+
+        assert result == 4
+        sql = " ".join(str(session.execute.call_args[0][0]).split())
+        assert "end_time < NOW()" in sql
+        assert "duration" not in sql
+
+    async def test_archive_past_events_direct_commits_in_batches(self):
+        from app.repositories.events import event_archive_repository
+        from app.repositories.events.event_archive_repository import EventArchiveRepository
+        session = make_mock_session()
+        session.execute = AsyncMock(side_effect=[
+            _make_execute_result(rowcount=2), _make_execute_result(rowcount=2), _make_execute_result(rowcount=0),
+        ])
+
+        with patch(_ARCHIVE_PATCH, return_value=session), \
+             patch.object(event_archive_repository, "_ARCHIVE_BATCH", 2), \
+             patch.object(event_archive_repository, "_ARCHIVE_WORKERS", 1):
+            archived = await EventArchiveRepository().archive_past_events_direct("admin@example.com")
+
+        assert archived == 4
+        assert session.execute.await_count == 3
+        assert session.commit.await_count == 3
+        assert session.execute.call_args[0][1]["batch"] == 2
+        assert "LIMIT :batch" in str(session.execute.call_args[0][0])
+
+    async def test_archive_past_events_direct_sweeps_concurrently_and_skips_locked_rows(self):
+        from app.repositories.events import event_archive_repository
+        from app.repositories.events.event_archive_repository import EventArchiveRepository
+        both_started = asyncio.Event()
+        started = 0
+
+        def make_session(rowcount):
+            async def execute(*args):
+                nonlocal started
+                started += 1
+                if started == 2:
+                    both_started.set()
+                await asyncio.wait_for(both_started.wait(), timeout=1)
+                return _make_execute_result(rowcount=rowcount)
+            session = make_mock_session()
+            session.execute = AsyncMock(side_effect=execute)
+            return session
+
+        sessions = [make_session(1), make_session(0)]
+        with patch(_ARCHIVE_PATCH, side_effect=sessions), \
+             patch.object(event_archive_repository, "_ARCHIVE_BATCH", 2), \
+             patch.object(event_archive_repository, "_ARCHIVE_WORKERS", 2):
+            archived = await EventArchiveRepository().archive_past_events_direct()
+
+        assert archived == 1
+        for session in sessions:
+            session.execute.assert_awaited_once()
+            session.commit.assert_awaited_once()
+        assert "FOR UPDATE SKIP LOCKED" in str(sessions[0].execute.call_args[0][0])
+
     async def test_archive_events_by_ids_returns_0_for_empty_list(self):
         from app.repositories.events.event_archive_repository import EventArchiveRepository
         session = make_mock_session()
@@ -237,6 +473,64 @@ class TestEventArchiveRepository:
 
         assert result is False
 
+    async def test_archived_page_cursor_carries_archived_at(self):
+        from app.models.pagination import CursorInfo, CursorPaginationParams
+        from app.repositories.events import event_archive_repository
+        from app.repositories.events.event_archive_repository import EventArchiveRepository
+        events = [
+            {"eventId": f"evt-{i}", "startTime": "2020-01-01T00:00:00+00:00",
+             "archivedAt": f"2026-01-0{3 - i}T00:00:00+00:00"}
+            for i in range(3)
+        ]
+        session = make_mock_session()
+        session.execute = AsyncMock(return_value=_make_execute_result(fetchall_rows=events))
+
+        with patch(_ARCHIVE_PATCH, return_value=session), \
+             patch.object(event_archive_repository, "row_to_event_dict", side_effect=lambda row: row):
+            page, next_cursor = await EventArchiveRepository().get_archived_events_paginated(
+                CursorPaginationParams(page_size=2)
+            )
+
+        assert [e["eventId"] for e in page] == ["evt-0", "evt-1"]
+        cursor = CursorInfo.decode(next_cursor)
+        assert (cursor.start_time, cursor.event_id) == ("2026-01-02T00:00:00+00:00", "evt-1")
+        assert "ORDER BY archived_at DESC" in str(session.execute.call_args.args[0])
+
+    async def test_archive_statistics_in_one_statement(self):
+        from app.repositories.events.event_archive_repository import EventArchiveRepository
+        rows = [
+            MagicMock(month="2026-02", cnt=3, total=7),
+            MagicMock(month="2026-01", cnt=2, total=7),
+            MagicMock(month=None, cnt=2, total=7),
+        ]
+        session = make_mock_session()
+        session.execute = AsyncMock(return_value=_make_execute_result(fetchall_rows=rows))
+
+        with patch(_ARCHIVE_PATCH, return_value=session):
+            stats = await EventArchiveRepository().get_archive_statistics()
+
+        assert stats == {"total_archived": 7, "monthly_archived": {"2026-02": 3, "2026-01": 2}}
+        session.execute.assert_awaited_once()
+        session.scalar.assert_not_called()
+
+    async def test_archived_events_for_creator_filter_and_order_in_sql(self):
+        from app.repositories.events.event_archive_repository import EventArchiveRepository
+        session = make_mock_session()
+        session.execute = AsyncMock(return_value=_make_execute_result(fetchall_rows=[]))
+
+        with patch(_ARCHIVE_PATCH, return_value=session):
+            repo = EventArchiveRepository()
+            await repo.get_archived_events("creator@example.com")
+            await repo.get_archived_events("other@example.com")
+
+        first, second = (call.args for call in session.execute.call_args_list)
+        # One prebuilt statement per shape; only the bind params differ
+        assert first[0] is second[0]
+        sql = " ".join(str(first[0]).split())
+        assert "WHERE is_archived = TRUE AND created_by_email = :email" in sql
+        assert "ORDER BY archived_at DESC NULLS LAST, event_id ASC" in sql
+        assert first[1] == {"email": "creator@example.com"}
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # EventIngestionRepository
@@ -292,11 +586,34 @@ class TestEventIngestionRepository:
 
         assert result is False
 
+    async def test_save_bulk_events_single_statement_counts_returned_rows(self):
+        from app.repositories.events.event_ingestion_repository import EventIngestionRepository
+        session = make_mock_session()
+        mock_result = MagicMock()
+        mock_result.fetchall.return_value = [MagicMock()]  # one of two rows was new
+        session.execute = AsyncMock(return_value=mock_result)
+        second = {**self._sample_event(), "eventId": "tm-2", "originalId": "tm-2"}
+
+        with patch(_INGESTION_PATCH, return_value=session):
+            repo = EventIngestionRepository()
+            result = await repo.save_bulk_events([self._sample_event(), second])
+
+        assert result == 1
+        session.execute.assert_called_once()
+        params = session.execute.call_args[0][1]
+        assert params["original_id_0"] == "tm-12345"
+        assert params["original_id_1"] == "tm-2"
+        # Statement is cached per batch size and its binds line up with params
+        stmt = session.execute.call_args[0][0]
+        assert set(stmt._bindparams) == set(params)
+        from app.repositories.events.event_ingestion_repository import _bulk_insert_sql
+        assert _bulk_insert_sql(2) is stmt
+
     async def test_get_by_original_id_returns_none_when_no_row(self):
         from app.repositories.events.event_ingestion_repository import EventIngestionRepository
         session = make_mock_session()
         mock_result = MagicMock()
-        mock_result.fetchone.return_value = None
+        mock_result.scalar.return_value = None
         session.execute = AsyncMock(return_value=mock_result)
 
         with patch(_INGESTION_PATCH, return_value=session):
@@ -308,10 +625,8 @@ class TestEventIngestionRepository:
     async def test_get_by_original_id_returns_dict_with_event_id(self):
         from app.repositories.events.event_ingestion_repository import EventIngestionRepository
         session = make_mock_session()
-        row = MagicMock()
-        row.event_id = "evt-001"
         mock_result = MagicMock()
-        mock_result.fetchone.return_value = row
+        mock_result.scalar.return_value = "evt-001"
         session.execute = AsyncMock(return_value=mock_result)
 
         with patch(_INGESTION_PATCH, return_value=session):
@@ -394,10 +709,12 @@ class TestEventUserRepository:
 
         assert result is True
         session.commit.assert_called_once()
-        # First call should be DELETE
-        assert len(execute_calls) >= 3  # 1 DELETE + 2 INSERTs
+        # First call should be DELETE, then one INSERT covering every email
+        assert len(execute_calls) == 2
         first_sql = execute_calls[0][0].upper()
         assert "DELETE" in first_sql
+        assert "INSERT" in execute_calls[1][0].upper()
+        assert execute_calls[1][1]["emails"] == ["alice@example.com", "bob@example.com"]
 
     async def test_update_event_roles_uses_correct_table_for_organizers(self):
         from app.repositories.events.event_user_repository import EventUserRepository
@@ -445,3 +762,111 @@ class TestEventUserRepository:
             result = await repo.update_event_roles("evt-001", "organizers", [])
 
         assert result is True
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# EventQueryRepository
+# ═══════════════════════════════════════════════════════════════════════════════
+
+_QUERY_PATCH = 'app.repositories.events.event_query_repository.AsyncSessionLocal'
+
+
+class TestEventQueryRepository:
+
+    async def test_paginate_reuses_statement_per_filter_shape(self):
+        from app.models.pagination import CursorInfo, CursorPaginationParams, EventFilters
+        from app.repositories.events.event_query_repository import EventQueryRepository
+        session = make_mock_session()
+        session.execute = AsyncMock(return_value=_make_execute_result(fetchall_rows=[]))
+        cursor = CursorInfo(event_id="evt-001", start_time="2026-01-01T00:00:00+00:00").encode()
+
+        with patch(_QUERY_PATCH, return_value=session):
+            repo = EventQueryRepository()
+            await repo.get_all_events_paginated(CursorPaginationParams(), EventFilters(city="Tempe"))
+            await repo.get_all_events_paginated(CursorPaginationParams(), EventFilters(city="Phoenix"))
+            await repo.get_all_events_paginated(CursorPaginationParams(cursor=cursor), EventFilters(city="Tempe"))
+
+        (first, first_params), (second, second_params), (third, third_params) = [
+            c.args for c in session.execute.call_args_list
+        ]
+        assert first is second
+        assert (first_params["city"], second_params["city"]) == ("Tempe", "Phoenix")
+        assert third is not first
+        assert ":cursor_id" in str(third) and third_params["cursor_id"] == "evt-001"
+
+    async def test_compact_page_selects_only_card_columns(self):
+        from app.models.pagination import CursorPaginationParams
+        from app.repositories.events.event_query_repository import EventQueryRepository
+        session = make_mock_session()
+        session.execute = AsyncMock(return_value=_make_execute_result(fetchall_rows=[]))
+
+        with patch(_QUERY_PATCH, return_value=session):
+            await EventQueryRepository().get_nearby_events_paginated(
+                "Tempe", "AZ", CursorPaginationParams(), compact=True
+            )
+
+        sql = str(session.execute.call_args[0][0])
+        assert "e.image_url" in sql and "e.start_time" in sql
+        assert "e.description" not in sql
+        assert "e.ticket_price" not in sql
+
+    def test_filter_clause_skips_unset_fields_but_keeps_false(self):
+        from app.models.pagination import EventFilters
+        from app.repositories.events.event_query_repository import EventQueryRepository
+        repo = EventQueryRepository()
+
+        clause, params = repo._build_filter_clause(
+            EventFilters(city="", state="az", is_online=False, keywords="jazz live")
+        )
+
+        assert ":city" not in clause
+        assert "e.is_online = :is_online" in clause
+        assert params == {"state": "az", "state_full": "Arizona", "is_online": False, "keywords": "jazz OR live"}
+        assert repo._build_filter_clause(EventFilters()) == ("", {})
+
+    async def test_purge_archived_events_drains_backlog_in_batches(self):
+        from app.repositories.events import event_query_repository
+        from app.repositories.events.event_query_repository import EventQueryRepository
+        session = make_mock_session()
+        batches = [MagicMock(), MagicMock(), MagicMock()]
+        for batch, count in zip(batches, (2, 2, 1)):
+            batch.scalar.return_value = count
+        session.execute = AsyncMock(side_effect=batches)
+
+        with patch(_QUERY_PATCH, return_value=session), \
+             patch.object(event_query_repository, "_PURGE_BATCH", 2):
+            deleted = await EventQueryRepository().purge_archived_events()
+
+        assert deleted == 5
+        assert session.execute.await_count == 3
+        assert session.commit.await_count == 3
+        assert "purge_archived_events(:batch)" in str(session.execute.call_args[0][0])
+        assert session.execute.call_args[0][1] == {"batch": 2}
+
+    async def test_external_events_reuse_one_prebuilt_statement(self):
+        from app.repositories.events import event_query_repository
+        from app.repositories.events.event_query_repository import EventQueryRepository
+        session = make_mock_session()
+        session.execute = AsyncMock(return_value=_make_execute_result(fetchall_rows=[]))
+
+        with patch(_QUERY_PATCH, return_value=session):
+            repo = EventQueryRepository()
+            await repo.get_external_events("Tempe", "AZ")
+            await repo.get_external_events("Austin", "TX")
+
+        first, second = session.execute.call_args_list
+        assert first.args[0] is second.args[0] is event_query_repository._EXTERNAL_EVENTS_SQL
+        assert second.args[1] == {"city": "Austin", "state": "TX"}
+
+    async def test_attended_categories_reads_only_emails_and_categories(self):
+        from app.repositories.events.event_query_repository import EventQueryRepository
+        session = make_mock_session()
+        rows = [MagicMock(user_email="a@example.com", categories=["Music", "Sports"])]
+        session.execute = AsyncMock(return_value=_make_execute_result(fetchall_rows=rows))
+
+        with patch(_QUERY_PATCH, return_value=session):
+            result = await EventQueryRepository().get_attended_categories_by_user("Tempe", "AZ")
+
+        assert result == {"a@example.com": {"Music", "Sports"}}
+        sql = str(session.execute.call_args.args[0])
+        assert "e.event_name" not in sql and "r.status = 'attended'" in sql
@@ -0,0 +1,113 @@
+"""
+Tests for app/auth/event_roles.py
+
+The role dependencies are mounted on a throwaway FastAPI app; the event lookup
+and the current user are patched so no database or JWT is involved.
+"""
+import pytest
+from unittest.mock import AsyncMock, patch
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.auth import event_roles
+from app.auth.jwt_utils import get_current_user
+
+EVENT = {
+    "eventId": "evt-1",
+    "createdByEmail": "creator@example.com",
+    "organizers": ["creator@example.com", "org@example.com"],
+    "moderators": ["mod@example.com"],
+}
+
+
+def _make_client(user: dict) -> TestClient:
+    app = FastAPI()
+    app.dependency_overrides[get_current_user] = lambda: user
+
+    @app.get("/events/{event_id}/creator-and-organizer")
+    async def creator_and_organizer(
+        event_id: str,
+        _creator=Depends(event_roles.require_event_creator),
+        _organizer=Depends(event_roles.require_event_organizer),
+        event: dict = Depends(event_roles.get_event_dep),
+    ):
+        return {"eventId": event["eventId"]}
+
+    @app.get("/events/{event_id}/moderate")
+    async def moderate(event_id: str, _mod=Depends(event_roles.require_event_moderator)):
+        return {"ok": True}
+
+    @app.delete("/events/{event_id}")
+    async def delete(event_id: str, _creator=Depends(event_roles.require_event_creator_for_write)):
+        return {"ok": True}
+
+    return TestClient(app)
+
+
+class TestEventRoleDependencies:
+
+    def test_event_fetched_once_for_stacked_role_checks(self):
+        fetch = AsyncMock(return_value=dict(EVENT))
+        with patch("app.auth.event_roles.get_event_by_id", fetch):
+            client = _make_client({"email": "creator@example.com", "role": "user"})
+            response = client.get("/events/evt-1/creator-and-organizer")
+
+        assert response.status_code == 200
+        assert response.json() == {"eventId": "evt-1"}
+        fetch.assert_awaited_once_with("evt-1")
+
+    def test_missing_event_returns_404(self):
+        with patch("app.auth.event_roles.get_event_by_id", AsyncMock(return_value=None)):
+            client = _make_client({"email": "creator@example.com", "role": "user"})
+            response = client.get("/events/missing/creator-and-organizer")
+
+        assert response.status_code == 404
+
+    def test_non_creator_forbidden(self):
+        with patch("app.auth.event_roles.get_event_by_id", AsyncMock(return_value=dict(EVENT))):
+            client = _make_client({"email": "org@example.com", "role": "user"})
+            response = client.get("/events/evt-1/creator-and-organizer")
+
+        assert response.status_code == 403
+
+    def test_super_admin_bypasses_checks(self):
+        with patch("app.auth.event_roles.get_event_by_id", AsyncMock(return_value=dict(EVENT))):
+            client = _make_client({"email": "root@example.com", "role": "super_admin"})
+            response = client.get("/events/evt-1/creator-and-organizer")
+
+        assert response.status_code == 200
+
+    @pytest.mark.parametrize("email,expected", [
+        ("mod@example.com", 200),
+        ("org@example.com", 200),
+        ("stranger@example.com", 403),
+    ])
+    def test_moderator_check(self, email, expected):
+        with patch("app.auth.event_roles.get_event_by_id", AsyncMock(return_value=dict(EVENT))):
+            client = _make_client({"email": email, "role": "user"})
+            response = client.get("/events/evt-1/moderate")
+
+        assert response.status_code == expected
+
+    @pytest.mark.parametrize("email,expected", [
+        ("creator@example.com", 200),
+        ("org@example.com", 403),
+    ])
+    def test_write_check_reads_only_the_creator(self, email, expected):
+        full_fetch = AsyncMock(return_value=dict(EVENT))
+        creator = AsyncMock(return_value={"createdByEmail": "creator@example.com"})
+        with patch("app.auth.event_roles.get_event_by_id", full_fetch), \
+             patch("app.auth.event_roles.get_event_creator", creator):
+            client = _make_client({"email": email, "role": "user"})
+            response = client.delete("/events/evt-1")
+
+        assert response.status_code == expected
+        creator.assert_awaited_once_with("evt-1")
+        full_fetch.assert_not_awaited()
+
+    def test_write_check_missing_event_returns_404(self):
+        with patch("app.auth.event_roles.get_event_creator", AsyncMock(return_value=None)):
+            client = _make_client({"email": "creator@example.com", "role": "user"})
+            response = client.delete("/events/missing")
+
+        assert response.status_code == 404
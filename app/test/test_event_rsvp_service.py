@@ -0,0 +1,46 @@
+"""
+Unit tests for app/services/event_rsvp_service.py
+"""
+import pytest
+from unittest.mock import AsyncMock
+
+pytestmark = pytest.mark.asyncio
+
+
+def _service(**repo_methods):
+    from app.services.event_rsvp_service import EventRsvpService
+    service = EventRsvpService()
+    for name, mock in repo_methods.items():
+        setattr(service.repo, name, mock)
+    return service
+
+
+class TestRsvpToEvent:
+
+    async def test_success_is_a_single_write(self):
+        archived_flag = AsyncMock()
+        service = _service(join_rsvp=AsyncMock(return_value=True), get_event_archived_flag=archived_flag)
+
+        assert await service.rsvp_to_event("evt-1", "a@example.com", "joined") is True
+        archived_flag.assert_not_awaited()
+
+    @pytest.mark.parametrize("archived,message", [(None, "not found"), (True, "archived")])
+    async def test_rejected_write_explains_why(self, archived, message):
+        service = _service(
+            interested_rsvp=AsyncMock(return_value=False),
+            get_event_archived_flag=AsyncMock(return_value=archived),
+        )
+
+        with pytest.raises(ValueError, match=message):
+            await service.rsvp_to_event("evt-1", "a@example.com", "interested")
+
+
+class TestUpdateRsvpStatus:
+
+    async def test_archived_event_still_allows_updates(self):
+        service = _service(
+            update_rsvp_status=AsyncMock(return_value=False),
+            get_event_archived_flag=AsyncMock(return_value=True),
+        )
+
+        assert await service.update_rsvp_status("evt-1", "a@example.com", "attended", 5, "Great") is False
@@ -0,0 +1,156 @@
+"""
+Unit tests for app/services/event_service.py (non-cache paths)
+"""
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _collect(stream):
+    return b"".join([chunk async for chunk in stream])
+
+
+class TestStreamAllEventsJson:
+
+    async def test_streams_a_json_array(self):
+        from app.services import event_service
+
+        async def events():
+            yield {"eventId": "evt-1", "location": {"city": "Tempe"}}
+            yield {"eventId": "evt-2", "location": {"city": "Mesa"}}
+
+        with patch.object(event_service.event_repo, "iter_all_events", MagicMock(return_value=events())):
+            body = await _collect(event_service.stream_all_events_json())
+
+        assert [e["eventId"] for e in json.loads(body)] == ["evt-1", "evt-2"]
+
+    async def test_empty_result_is_empty_array(self):
+        from app.services import event_service
+
+        async def events():
+            return
+            yield
+
+        with patch.object(event_service.event_repo, "iter_all_events", MagicMock(return_value=events())):
+            assert await _collect(event_service.stream_all_events_json()) == b"[]"
+
+    async def test_failure_mid_stream_aborts_without_closing_array(self):
+        from app.services import event_service
+
+        async def events():
+            yield {"eventId": "evt-1"}
+            raise RuntimeError("connection lost")
+
+        chunks = []
+        with patch.object(event_service.event_repo, "iter_all_events", MagicMock(return_value=events())):
+            with pytest.raises(RuntimeError, match="connection lost"):
+                async for chunk in event_service.stream_all_events_json():
+                    chunks.append(chunk)
+
+        assert b"".join(chunks) == b'[{"eventId":"evt-1"}'
+
+
+class TestGetRsvpResponseData:
+
+    async def test_name_and_count_from_one_summary_query(self):
+        from app.services import event_service
+        summary = AsyncMock(return_value=("Jazz Night", 7))
+
+        with patch.object(event_service.event_rsvp_service.repo, "get_rsvp_summary", summary):
+            data = await event_service.get_rsvp_response_data("evt-1", "a@example.com", "created")
+
+        assert data["event"] == {"id": "evt-1", "title": "Jazz Night", "current_attendees": 7}
+        assert data["rsvp_status"] == "going"
+        summary.assert_awaited_once_with("evt-1")
+
+
+class TestUpdateEvent:
+
+    async def test_invalid_archived_flag_raises_for_400(self):
+        from app.repositories.events import event_crud_repository
+        from app.services import event_service
+
+        with patch.object(event_crud_repository, "AsyncSessionLocal") as session_factory:
+            with pytest.raises(ValueError):
+                await event_service.update_event("evt-1", {"isArchived": "false"})
+
+        session_factory.assert_not_called()
+
+
+class TestArchiveEventWithValidation:
+
+    async def test_single_update_reports_past_event(self):
+        from app.services import event_service
+
+        with patch.object(event_service.event_repo, "archive_event_returning", AsyncMock(return_value={"wasPast": False})), \
+             patch.object(event_service, "flush_event_query_cache", AsyncMock()), \
+             patch.object(event_service.event_repo, "get_event_by_id", AsyncMock()) as get_event:
+            result = await event_service.archive_event_with_validation("evt-1", "a@example.com")
+
+        assert result["success"] is True
+        assert result["was_past_event"] is False
+        assert result["message"].endswith("(Note: This event has not ended yet)")
+        get_event.assert_not_awaited()
+
+    async def test_missing_event_is_not_found(self):
+        from app.services import event_service
+
+        with patch.object(event_service.event_repo, "archive_event_returning", AsyncMock(return_value=None)):
+            result = await event_service.archive_event_with_validation("nope", "a@example.com")
+
+        assert result["error_type"] == "not_found"
+
+
+class TestGetPaginatedRsvpList:
+
+    async def test_without_total_skips_window_count_and_probes_one_extra_row(self):
+        from app.services import event_service
+        rows = [MagicMock(user_email=f"u{i}@example.com", status="joined", rating=None, review=None) for i in range(3)]
+        result = MagicMock()
+        result.fetchall.return_value = rows
+        session = AsyncMock()
+        session.__aenter__ = AsyncMock(return_value=session)
+        session.__aexit__ = AsyncMock(return_value=None)
+        session.execute = AsyncMock(return_value=result)
+
+        with patch.object(event_service, "AsyncSessionLocal", return_value=session):
+            data = await event_service.get_paginated_rsvp_list("evt-1", page=2, page_size=2, include_total=False)
+
+        stmt, params = session.execute.call_args.args
+        assert "OVER ()" not in str(stmt)
+        assert "ORDER BY updated_at DESC, user_email DESC" in str(stmt)
+        assert params == {"eid": "evt-1", "limit": 3, "offset": 2}
+        assert [i["email"] for i in data["items"]] == ["u0@example.com", "u1@example.com"]
+        assert data["pagination"]["has_next"] is True
+        assert data["pagination"]["total"] is None and data["pagination"]["total_pages"] is None
+        session.scalar.assert_not_called()
+
+
+class TestGetRsvpListCursorPaginated:
+
+    async def test_invalid_cursor_raises_for_400(self):
+        from app.models.pagination import CursorPaginationParams
+        from app.repositories.events import event_rsvp_repository
+        from app.services import event_service
+
+        with patch.object(event_rsvp_repository, "AsyncSessionLocal") as session_factory:
+            with pytest.raises(ValueError, match="Invalid cursor format"):
+                await event_service.get_rsvp_list_cursor_paginated(
+                    "evt-1", CursorPaginationParams(cursor="not-a-cursor", page_size=10)
+                )
+
+        session_factory.assert_not_called()
+
+    async def test_invalid_user_rsvps_cursor_raises_for_400(self):
+        from app.models.pagination import CursorPaginationParams
+        from app.repositories.events import event_rsvp_repository
+        from app.services import event_service
+
+        with patch.object(event_rsvp_repository, "AsyncSessionLocal") as session_factory:
+            for fetch in (event_service.get_user_rsvps_paginated, event_service.get_user_interested_events_paginated):
+                with pytest.raises(ValueError, match="Invalid cursor format"):
+                    await fetch("a@example.com", CursorPaginationParams(cursor="not-a-cursor", page_size=10))
+
+        session_factory.assert_not_called()
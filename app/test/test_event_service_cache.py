@@ -2,13 +2,14 @@
 Tests for Redis integration in app/services/event_service.py
 
 Covers:
-- get_all_events_paginated: cache hit / miss / no-Redis
-- flush_event_query_cache: scan + delete, multi-page scan, empty result
-- create/update/delete/archive_event: all call flush after mutation
+- get_all_events_paginated: cache hit / miss / no-Redis, worker-local cache
+- cache_event_query / flush_event_query_cache: tagged keys, pipelined writes
+- create/update/delete/archive/unarchive_event, archive_past_events: flush after mutation
+- get_event_by_id_cached: worker-local event detail cache + invalidation
 """
 import json
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from app.models.pagination import CursorPaginationParams, EventFilters, EventCursorPaginatedResponse
 
 
@@ -23,6 +24,28 @@ def _make_paginated_response(items=None):
     )
 
 
+def _make_redis(get=None, pipeline_results=None):
+    """AsyncMock Redis client whose pipeline() is a sync call yielding an async context manager."""
+    redis = AsyncMock()
+    redis.get = AsyncMock(return_value=get)
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=pipeline_results or [])
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=False)
+    redis.pipeline = MagicMock(return_value=pipe)
+    return redis, pipe
+
+
+@pytest.fixture(autouse=True)
+def _clear_local_query_cache():
+    from app.services.event_service import _event_detail_cache, _local_query_cache
+    _local_query_cache.clear()
+    _event_detail_cache.clear()
+    yield
+    _local_query_cache.clear()
+    _event_detail_cache.clear()
+
+
 # ── get_all_events_paginated ──────────────────────────────────────────────────
 
 class TestGetAllEventsPaginated:
@@ -45,9 +68,7 @@ class TestGetAllEventsPaginated:
     async def test_cache_miss_queries_firestore_and_stores_in_redis(self):
         from app.services.event_service import get_all_events_paginated
         events = [{"id": "evt-2", "title": "From Firestore"}]
-        mock_redis = AsyncMock()
-        mock_redis.get = AsyncMock(return_value=None)
-        mock_redis.set = AsyncMock()
+        mock_redis, pipe = _make_redis()
 
         with patch('app.services.event_service.get_redis_client', return_value=mock_redis):
             with patch('app.services.event_service.event_repo') as mock_repo:
@@ -57,11 +78,12 @@ class TestGetAllEventsPaginated:
                 result = await get_all_events_paginated(CursorPaginationParams())
 
         assert result.items == events
-        mock_redis.set.assert_called_once()
-        # Verify stored JSON is deserializable
-        stored_json = mock_redis.set.call_args[0][1]
+        pipe.set.assert_called_once()
+        # Verify stored JSON is deserializable and the key is tagged for flushing
+        key, stored_json = pipe.set.call_args[0]
         parsed = json.loads(stored_json)
         assert parsed["items"] == events
+        pipe.sadd.assert_called_once_with("sahana:events:cached_keys", key)
 
     @pytest.mark.asyncio
     async def test_no_redis_queries_firestore_without_caching(self):
@@ -82,12 +104,11 @@ class TestGetAllEventsPaginated:
         from app.services.event_service import get_all_events_paginated
         stored_keys = []
 
-        async def capture_set(key, value, **kwargs):
+        def capture_set(key, value, **kwargs):
             stored_keys.append(key)
 
-        mock_redis = AsyncMock()
-        mock_redis.get = AsyncMock(return_value=None)
-        mock_redis.set = AsyncMock(side_effect=capture_set)
+        mock_redis, pipe = _make_redis()
+        pipe.set = MagicMock(side_effect=capture_set)
 
         with patch('app.services.event_service.get_redis_client', return_value=mock_redis):
             with patch('app.services.event_service.event_repo') as mock_repo:
@@ -105,7 +126,7 @@ class TestGetAllEventsPaginated:
     async def test_redis_failure_falls_back_to_firestore(self):
         from app.services.event_service import get_all_events_paginated
         events = [{"id": "evt-4"}]
-        mock_redis = AsyncMock()
+        mock_redis, pipe = _make_redis()
         mock_redis.get = AsyncMock(side_effect=Exception("Redis timeout"))
 
         with patch('app.services.event_service.get_redis_client', return_value=mock_redis):
@@ -116,6 +137,9 @@ class TestGetAllEventsPaginated:
                 result = await get_all_events_paginated(CursorPaginationParams())
 
         assert result.items == events
+        pipe.set.assert_called_once()
+        pipe.sadd.assert_called_once()
+        pipe.execute.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_cache_hit_with_filters(self):
@@ -135,6 +159,31 @@ class TestGetAllEventsPaginated:
         assert result.items == cached.items
 
 
+# ── local query cache ─────────────────────────────────────────────────────────
+
+class TestLocalQueryCache:
+
+    @pytest.mark.asyncio
+    async def test_repeat_request_served_locally_until_flush(self):
+        from app.services.event_service import flush_event_query_cache, get_all_events_paginated
+        mock_redis, _ = _make_redis(pipeline_results=[set(), 0])
+
+        with patch('app.services.event_service.get_redis_client', return_value=mock_redis):
+            with patch('app.services.event_service.event_repo') as mock_repo:
+                mock_repo.get_all_events_paginated = AsyncMock(
+                    return_value=([{"id": "evt-1"}], None, None, False, False)
+                )
+                first = await get_all_events_paginated(CursorPaginationParams())
+                second = await get_all_events_paginated(CursorPaginationParams())
+                assert second is first
+                assert mock_redis.get.await_count == 1
+                assert mock_repo.get_all_events_paginated.await_count == 1
+
+                await flush_event_query_cache()
+                await get_all_events_paginated(CursorPaginationParams())
+                assert mock_repo.get_all_events_paginated.await_count == 2
+
+
 # ── flush_event_query_cache ───────────────────────────────────────────────────
 
 class TestFlushEventQueryCache:
@@ -146,26 +195,26 @@ class TestFlushEventQueryCache:
             await flush_event_query_cache()  # Must not raise
 
     @pytest.mark.asyncio
-    async def test_scan_and_delete_matching_keys(self):
+    async def test_deletes_tagged_keys_after_clearing_tag_set(self):
         from app.services.event_service import flush_event_query_cache
-        q_keys = ["sahana:events:q:abc123", "sahana:events:q:def456"]
-        nearby_keys = ["sahana:events:nearby:xyz789"]
-        mock_redis = AsyncMock()
-        mock_redis.scan = AsyncMock(side_effect=[(0, q_keys), (0, nearby_keys)])
+        keys = {"sahana:events:q:abc123", "sahana:events:nearby:xyz789", "sahana:search:def456"}
+        mock_redis, pipe = _make_redis(pipeline_results=[keys, 1])
         mock_redis.delete = AsyncMock()
 
         with patch('app.services.event_service.get_redis_client', return_value=mock_redis):
             await flush_event_query_cache()
 
-        assert mock_redis.delete.call_count == 2
-        mock_redis.delete.assert_any_call(*q_keys)
-        mock_redis.delete.assert_any_call(*nearby_keys)
+        mock_redis.pipeline.assert_called_once_with(transaction=True)
+        pipe.smembers.assert_called_once_with("sahana:events:cached_keys")
+        pipe.delete.assert_called_once_with("sahana:events:cached_keys")
+        mock_redis.delete.assert_awaited_once()
+        assert set(mock_redis.delete.call_args[0]) == keys
+        mock_redis.scan.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_scan_empty_result_skips_delete(self):
+    async def test_empty_tag_set_skips_delete(self):
         from app.services.event_service import flush_event_query_cache
-        mock_redis = AsyncMock()
-        mock_redis.scan = AsyncMock(return_value=(0, []))
+        mock_redis, _ = _make_redis(pipeline_results=[set(), 0])
         mock_redis.delete = AsyncMock()
 
         with patch('app.services.event_service.get_redis_client', return_value=mock_redis):
@@ -174,31 +223,60 @@ class TestFlushEventQueryCache:
         mock_redis.delete.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_scan_multiple_pages_deletes_all_batches(self):
+    async def test_redis_failure_does_not_raise(self):
         from app.services.event_service import flush_event_query_cache
-        mock_redis = AsyncMock()
-        # Two pages for sahana:events:q:*, one page for sahana:events:nearby:*
-        mock_redis.scan = AsyncMock(side_effect=[
-            (42, ["sahana:events:q:page1a", "sahana:events:q:page1b"]),
-            (0,  ["sahana:events:q:page2a"]),
-            (0,  []),
-        ])
-        mock_redis.delete = AsyncMock()
+        mock_redis, pipe = _make_redis()
+        pipe.execute = AsyncMock(side_effect=Exception("Redis error"))
 
         with patch('app.services.event_service.get_redis_client', return_value=mock_redis):
-            await flush_event_query_cache()
+            await flush_event_query_cache()  # Must not raise
+
 
-        assert mock_redis.scan.call_count == 3
-        assert mock_redis.delete.call_count == 2  # two q batches deleted; nearby was empty
+class TestCacheEventQuery:
 
     @pytest.mark.asyncio
-    async def test_redis_scan_failure_does_not_raise(self):
-        from app.services.event_service import flush_event_query_cache
-        mock_redis = AsyncMock()
-        mock_redis.scan = AsyncMock(side_effect=Exception("Redis error"))
+    async def test_set_and_tag_in_one_pipeline(self):
+        from app.services.event_service import cache_event_query
+        from app.utils.cache_keys import TTL_EVENT_QUERY
+        mock_redis, pipe = _make_redis()
 
-        with patch('app.services.event_service.get_redis_client', return_value=mock_redis):
-            await flush_event_query_cache()  # Must not raise
+        await cache_event_query(mock_redis, "sahana:events:q:abc", "{}")
+
+        mock_redis.pipeline.assert_called_once_with(transaction=False)
+        pipe.set.assert_called_once_with("sahana:events:q:abc", "{}", ex=TTL_EVENT_QUERY)
+        pipe.sadd.assert_called_once_with("sahana:events:cached_keys", "sahana:events:q:abc")
+        pipe.expire.assert_called_once_with("sahana:events:cached_keys", TTL_EVENT_QUERY)
+        pipe.execute.assert_awaited_once()
+
+
+# ── get_event_by_id_cached ────────────────────────────────────────────────────
+
+class TestEventDetailCache:
+
+    @pytest.mark.asyncio
+    async def test_repeat_read_served_locally_until_update(self):
+        from app.services.event_service import get_event_by_id_cached, update_event
+        with patch('app.services.event_service.event_repo') as mock_repo, \
+             patch('app.services.event_service.flush_event_query_cache', new_callable=AsyncMock):
+            mock_repo.get_event_by_id = AsyncMock(return_value={"eventId": "evt-1"})
+            mock_repo.update_event = AsyncMock(return_value=True)
+
+            first = await get_event_by_id_cached("evt-1")
+            assert await get_event_by_id_cached("evt-1") is first
+            assert mock_repo.get_event_by_id.await_count == 1
+
+            await update_event("evt-1", {"eventName": "Renamed"})
+            await get_event_by_id_cached("evt-1")
+            assert mock_repo.get_event_by_id.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_missing_event_not_cached(self):
+        from app.services.event_service import get_event_by_id_cached
+        with patch('app.services.event_service.event_repo') as mock_repo:
+            mock_repo.get_event_by_id = AsyncMock(return_value=None)
+            assert await get_event_by_id_cached("nope") is None
+            assert await get_event_by_id_cached("nope") is None
+        assert mock_repo.get_event_by_id.await_count == 2
 
 
 # ── Mutations flush cache ─────────────────────────────────────────────────────
@@ -245,6 +323,27 @@ class TestMutationsClearCache:
         mock_flush.assert_called_once()
         assert result is True
 
+    @pytest.mark.asyncio
+    async def test_unarchive_event_flushes_cache(self):
+        from app.services.event_service import unarchive_event
+        with patch('app.services.event_service.event_repo') as mock_repo:
+            mock_repo.unarchive_event = AsyncMock(return_value=True)
+            with patch('app.services.event_service.flush_event_query_cache', new_callable=AsyncMock) as mock_flush:
+                result = await unarchive_event("evt-id")
+        mock_flush.assert_called_once()
+        assert result is True
+
+    @pytest.mark.asyncio
+    async def test_archive_past_events_flushes_cache_only_when_rows_archived(self):
+        from app.services.event_service import archive_past_events
+        with patch('app.services.event_service.event_repo') as mock_repo:
+            mock_repo.archive_past_events_direct = AsyncMock(side_effect=[0, 3])
+            with patch('app.services.event_service.flush_event_query_cache', new_callable=AsyncMock) as mock_flush:
+                assert await archive_past_events() == 0
+                mock_flush.assert_not_called()
+                assert await archive_past_events() == 3
+        mock_flush.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_flush_called_even_when_repo_raises(self):
         """Flush should NOT be called if the repo call itself raises (exception propagates out)."""
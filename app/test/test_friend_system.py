@@ -32,16 +32,17 @@ class TestFriendService:
             "location": None,
             "interests": ["testing"]
         }
+        self.both_users = {self.sender_email: self.mock_sender, self.receiver_email: self.mock_receiver}
 
     @patch.object(FriendRepository, 'create_friend_request', new_callable=AsyncMock)
     @patch.object(FriendRepository, 'find_request_between_users', new_callable=AsyncMock)
-    @patch.object(UserRepository, 'get_by_email', new_callable=AsyncMock)
+    @patch.object(UserRepository, 'get_by_emails', new_callable=AsyncMock)
     @pytest.mark.asyncio
-    async def test_send_friend_request_success(self, mock_get_by_email, 
+    async def test_send_friend_request_success(self, mock_get_by_emails, 
                                        mock_find_request, mock_create_request):
         """Test successful friend request sending"""
-        # Setup mocks - now both calls are to get_by_email
-        mock_get_by_email.side_effect = [self.mock_sender, self.mock_receiver]
+        # Setup mocks - both users come back from one get_by_emails call
+        mock_get_by_emails.return_value = self.both_users
         mock_find_request.return_value = None  # No existing request
         mock_create_request.return_value = self.test_request_id
         
@@ -53,19 +54,17 @@ class TestFriendService:
         assert result["message"] == "Friend request sent"
         assert result["request_id"] == self.test_request_id
         
-        # Verify mock calls - both should be get_by_email calls
-        assert mock_get_by_email.call_count == 2
-        mock_get_by_email.assert_any_call(self.sender_email)
-        mock_get_by_email.assert_any_call(self.receiver_email)
+        # Verify mock calls - both users fetched in a single lookup
+        mock_get_by_emails.assert_called_once_with([self.sender_email, self.receiver_email])
         mock_find_request.assert_called_once_with(self.sender_email, self.receiver_email)
         mock_create_request.assert_called_once_with(self.sender_email, self.receiver_email)
 
-    @patch.object(UserRepository, 'get_by_email', new_callable=AsyncMock)
+    @patch.object(UserRepository, 'get_by_emails', new_callable=AsyncMock)
     @pytest.mark.asyncio
-    async def test_send_friend_request_sender_not_found(self, mock_get_by_email):
+    async def test_send_friend_request_sender_not_found(self, mock_get_by_emails):
         """Test friend request when sender doesn't exist"""
         # Setup mocks
-        mock_get_by_email.return_value = None
+        mock_get_by_emails.return_value = {}
         
         # Test
         result = await friend_service.send_friend_request(self.sender_email, self.receiver_email)
@@ -74,12 +73,12 @@ class TestFriendService:
         assert result["success"] is False
         assert result["error"] == "Sender not found"
 
-    @patch.object(UserRepository, 'get_by_email', new_callable=AsyncMock)
+    @patch.object(UserRepository, 'get_by_emails', new_callable=AsyncMock)
     @pytest.mark.asyncio
-    async def test_send_friend_request_receiver_not_found(self, mock_get_by_email):
+    async def test_send_friend_request_receiver_not_found(self, mock_get_by_emails):
         """Test friend request when receiver doesn't exist"""
         # Setup mocks - sender exists, receiver doesn't
-        mock_get_by_email.side_effect = [self.mock_sender, None]
+        mock_get_by_emails.return_value = {self.sender_email: self.mock_sender}
         
         # Test
         result = await friend_service.send_friend_request(self.sender_email, self.receiver_email)
@@ -89,13 +88,13 @@ class TestFriendService:
         assert result["error"] == "Receiver not found"
 
     @patch.object(FriendRepository, 'find_request_between_users', new_callable=AsyncMock)
-    @patch.object(UserRepository, 'get_by_email', new_callable=AsyncMock)
+    @patch.object(UserRepository, 'get_by_emails', new_callable=AsyncMock)
     @pytest.mark.asyncio
-    async def test_send_friend_request_already_friends(self, mock_get_by_email, 
+    async def test_send_friend_request_already_friends(self, mock_get_by_emails, 
                                                 mock_find_request):
         """Test friend request when users are already friends"""
         # Setup mocks
-        mock_get_by_email.side_effect = [self.mock_sender, self.mock_receiver]
+        mock_get_by_emails.return_value = self.both_users
         mock_find_request.return_value = {"status": "accepted"}
         
         # Test
@@ -106,13 +105,13 @@ class TestFriendService:
         assert result["error"] == "Already friends"
 
     @patch.object(FriendRepository, 'find_request_between_users', new_callable=AsyncMock)
-    @patch.object(UserRepository, 'get_by_email', new_callable=AsyncMock)
+    @patch.object(UserRepository, 'get_by_emails', new_callable=AsyncMock)
     @pytest.mark.asyncio
-    async def test_send_friend_request_already_pending(self, mock_get_by_email, 
+    async def test_send_friend_request_already_pending(self, mock_get_by_emails, 
                                                 mock_find_request):
         """Test friend request when request is already pending"""
         # Setup mocks
-        mock_get_by_email.side_effect = [self.mock_sender, self.mock_receiver]
+        mock_get_by_emails.return_value = self.both_users
         mock_find_request.return_value = {"status": "pending"}
         
         # Test
@@ -290,5 +289,93 @@ class TestFriendService:
         # find_request_between_users is called twice: once for accepted, once for pending
         assert mock_find_request.call_count == 2
 
+
+class TestFriendRecommendationService:
+
+    @pytest.mark.asyncio
+    async def test_rule_based_fallback_survives_event_signature_failure(self):
+        """Candidates are still scored when the concurrent event lookup fails"""
+        from app.services.friend_recommendation_service import FriendRecommendationService
+
+        friend_repo = Mock()
+        friend_repo.get_accepted_friendship_ids = AsyncMock(return_value=["friend@example.com"])
+        friend_repo.get_requests_for_user = AsyncMock(return_value=[])
+        user_repo = Mock()
+        user_repo.get_by_email = AsyncMock(return_value={
+            "email": "me@example.com", "interests": ["music"], "location": {"city": "Tempe", "state": "AZ"},
+        })
+        user_repo.get_recommendation_candidates = AsyncMock(return_value=[
+            {"email": "friend@example.com", "interests": ["music"], "location": {"city": "Tempe"}},
+            {"email": "new@example.com", "interests": ["music"], "location": {"city": "Tempe"}},
+        ])
+        event_query_repo = Mock()
+        event_query_repo.get_attended_categories_by_user = AsyncMock(side_effect=RuntimeError("db down"))
+
+        service = FriendRecommendationService(friend_repo, user_repo, event_query_repo)
+        result = await service.recommend("me@example.com")
+
+        assert [r["email"] for r in result] == ["new@example.com"]
+        event_query_repo.get_attended_categories_by_user.assert_awaited_once_with(city="Tempe", state="AZ")
+
+
+class TestUserDiscoveryService:
+
+    @pytest.mark.asyncio
+    async def test_semantic_search_embeds_while_building_exclusions(self):
+        """The exclusion reads run while the query is being embedded"""
+        import asyncio
+        from app.services import user_discovery_service
+        from app.services.user_discovery_service import UserDiscoveryService
+
+        exclusions_started = asyncio.Event()
+
+        async def embed(_text):
+            # Only finishes if the exclusion reads started concurrently
+            await asyncio.wait_for(exclusions_started.wait(), timeout=1)
+            return [0.1, 0.2]
+
+        async def friend_ids(_email):
+            exclusions_started.set()
+            return ["friend@example.com"]
+
+        friend_repo = Mock()
+        friend_repo.get_accepted_friendship_ids_strict = friend_ids
+        friend_repo.get_requests_for_user_strict = AsyncMock(return_value=[
+            {"sender_id": "me@example.com", "receiver_id": "pending@example.com"},
+        ])
+        user_repo = Mock()
+        user_repo.get_by_email_strict = AsyncMock(return_value={"email": "me@example.com"})
+        user_repo.get_semantic_matches = AsyncMock(return_value=[])
+
+        with patch.object(user_discovery_service, "_enrich_user_query", AsyncMock(return_value="Interests: jazz")), \
+             patch("app.services.embedding_service.generate_query_embedding", embed):
+            result = await UserDiscoveryService(friend_repo, user_repo).search_users_semantic("jazz fans", "me@example.com")
+
+        assert result == []
+        kwargs = user_repo.get_semantic_matches.call_args.kwargs
+        assert kwargs["embedding"] == [0.1, 0.2]
+        assert sorted(kwargs["excluded_emails"]) == ["friend@example.com", "me@example.com", "pending@example.com"]
+
+    @pytest.mark.asyncio
+    async def test_semantic_search_exclusion_failure_is_503(self):
+        from fastapi import HTTPException
+        from app.services import user_discovery_service
+        from app.services.user_discovery_service import UserDiscoveryService
+
+        friend_repo = Mock()
+        friend_repo.get_accepted_friendship_ids_strict = AsyncMock(side_effect=RuntimeError("db down"))
+        friend_repo.get_requests_for_user_strict = AsyncMock(return_value=[])
+        user_repo = Mock()
+        user_repo.get_by_email_strict = AsyncMock(return_value={"email": "me@example.com"})
+        user_repo.get_semantic_matches = AsyncMock()
+
+        with patch.object(user_discovery_service, "_enrich_user_query", AsyncMock(return_value="Interests: jazz")), \
+             patch("app.services.embedding_service.generate_query_embedding", AsyncMock(return_value=[0.1])):
+            with pytest.raises(HTTPException) as exc:
+                await UserDiscoveryService(friend_repo, user_repo).search_users_semantic("jazz fans", "me@example.com")
+
+        assert exc.value.status_code == 503
+        user_repo.get_semantic_matches.assert_not_called()
+
 if __name__ == "__main__":
     pytest.main([__file__])
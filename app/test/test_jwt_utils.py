@@ -0,0 +1,127 @@
+"""
+Unit tests for app/auth/jwt_utils.py
+
+Covers token round-trips, expiry handling and the FastAPI auth dependencies.
+"""
+import pytest
+
+from app.auth import jwt_utils
+
+TEST_SECRET = "test-access-secret-key-0123456789abcdef"
+TEST_REFRESH_SECRET = "test-refresh-secret-key-0123456789abcdef"
+
+
+@pytest.fixture(autouse=True)
+def _secrets(monkeypatch):
+    monkeypatch.setattr(jwt_utils, "SECRET_KEY", TEST_SECRET.encode())
+    monkeypatch.setattr(jwt_utils, "REFRESH_SECRET_KEY", TEST_REFRESH_SECRET.encode())
+
+
+class TestAccessToken:
+
+    def test_round_trip_returns_payload(self):
+        token = jwt_utils.create_access_token({"email": "a@example.com", "role": "user"})
+        payload = jwt_utils.verify_access_token(token)
+        assert payload["data"] == {"email": "a@example.com", "role": "user"}
+        assert isinstance(payload["exp"], int)
+
+    def test_expired_token_returns_none(self):
+        token = jwt_utils.create_access_token({"email": "a@example.com"}, expires_in_minutes=-1)
+        assert jwt_utils.verify_access_token(token) is None
+
+    def test_tampered_token_returns_none(self):
+        token = jwt_utils.create_access_token({"email": "a@example.com"})
+        assert jwt_utils.verify_access_token(token[:-2] + "xx") is None
+
+    def test_tokens_interoperate_with_plain_pyjwt(self):
+        import jwt
+        token = jwt_utils.create_access_token({"email": "a@example.com"})
+        assert jwt.decode(token, TEST_SECRET, algorithms=["HS256"])["data"]["email"] == "a@example.com"
+
+        foreign = jwt.encode({"data": {"email": "b@example.com"}, "exp": 2**31 - 1}, TEST_SECRET, algorithm="HS256")
+        assert jwt_utils.verify_access_token(foreign)["data"]["email"] == "b@example.com"
+
+    def test_non_object_payload_rejected(self):
+        import jwt
+        token = jwt.api_jws.encode(b"[1, 2]", TEST_SECRET, algorithm="HS256")
+        assert jwt_utils.verify_access_token(token) is None
+
+    def test_none_algorithm_rejected(self):
+        import jwt
+        token = jwt.encode({"data": {"email": "a@example.com"}, "exp": 2**31 - 1}, None, algorithm="none")
+        assert jwt_utils.verify_access_token(token) is None
+
+    def test_refresh_token_not_accepted_as_access_token(self):
+        token = jwt_utils.create_refresh_token({"email": "a@example.com"})
+        assert jwt_utils.verify_access_token(token) is None
+
+
+class TestRefreshToken:
+
+    def test_round_trip_returns_payload(self):
+        token = jwt_utils.create_refresh_token({"email": "a@example.com", "role": "admin"})
+        payload = jwt_utils.verify_refresh_token(token)
+        assert payload["data"]["role"] == "admin"
+
+    def test_expired_token_returns_none(self):
+        token = jwt_utils.create_refresh_token({"email": "a@example.com"}, expires_in_days=-1)
+        assert jwt_utils.verify_refresh_token(token) is None
+
+
+class TestRequireJwtSecrets:
+
+    def test_missing_secret_raises(self, monkeypatch):
+        from app import config
+        monkeypatch.setattr(config, "JWT_SECRET_KEY", "")
+        monkeypatch.setattr(config, "JWT_REFRESH_SECRET_KEY", TEST_REFRESH_SECRET)
+        with pytest.raises(RuntimeError, match="JWT_SECRET_KEY"):
+            config.require_jwt_secrets()
+
+    def test_present_secrets_pass(self, monkeypatch):
+        from app import config
+        monkeypatch.setattr(config, "JWT_SECRET_KEY", TEST_SECRET)
+        monkeypatch.setattr(config, "JWT_REFRESH_SECRET_KEY", TEST_REFRESH_SECRET)
+        config.require_jwt_secrets()
+
+
+class TestAuthDependencies:
+
+    def _client(self, counter):
+        from fastapi import Depends, FastAPI
+        from fastapi.testclient import TestClient
+
+        original = jwt_utils.verify_access_token
+
+        def counting_verify(token):
+            counter.append(token)
+            return original(token)
+
+        app = FastAPI()
+
+        @app.get("/both")
+        def both(payload=Depends(jwt_utils.validate_token),
+                 user=Depends(jwt_utils.get_current_user)):
+            return {"user": user, "exp": payload["exp"]}
+
+        return TestClient(app), counting_verify
+
+    def test_token_verified_once_per_request(self, monkeypatch):
+        calls = []
+        client, counting_verify = self._client(calls)
+        monkeypatch.setattr(jwt_utils, "verify_access_token", counting_verify)
+        token = jwt_utils.create_access_token({"email": "a@example.com", "role": "user"})
+
+        response = client.get("/both", headers={"Authorization": f"Bearer {token}"})
+
+        assert response.status_code == 200
+        assert response.json()["user"]["email"] == "a@example.com"
+        assert len(calls) == 1
+
+    def test_invalid_token_returns_401(self, monkeypatch):
+        calls = []
+        client, counting_verify = self._client(calls)
+        monkeypatch.setattr(jwt_utils, "verify_access_token", counting_verify)
+
+        response = client.get("/both", headers={"Authorization": "Bearer not-a-token"})
+
+        assert response.status_code == 401
@@ -0,0 +1,29 @@
+"""
+Unit tests for app/utils/openai_client.py
+"""
+import pytest
+
+from app.utils import openai_client
+
+
+@pytest.fixture(autouse=True)
+def reset_client(monkeypatch):
+    monkeypatch.setattr(openai_client, "_client", None)
+
+
+class TestGetOpenAIClient:
+
+    def test_none_without_api_key(self, monkeypatch):
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        assert openai_client.get_openai_client() is None
+
+    def test_services_share_one_client(self, monkeypatch):
+        pytest.importorskip("openai")
+        from app.services import embedding_service, search_service
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+
+        client = openai_client.get_openai_client()
+
+        assert client is not None
+        assert search_service._get_openai_client() is client
+        assert embedding_service._get_openai_client() is client
@@ -95,6 +95,64 @@ def test_paginated_response_creation():
     assert response.has_next is False
     assert response.total_pages == 1
 
+    # Empty result set
+    response = PaginatedResponse.create([], 0, 1, 10)
+    assert response.total_pages == 0
+    assert response.has_next is False
+
+
+def test_cursor_paginated_response_create_serializes():
+    """create() skips validation but the model still dumps normally"""
+    from app.models.pagination import EventCursorPaginatedResponse
+    response = EventCursorPaginatedResponse.create([{"id": "e1"}], "abc", None, True, False, 12)
+    assert response.model_dump() == {
+        "items": [{"id": "e1"}],
+        "pagination": {
+            "next_cursor": "abc",
+            "prev_cursor": None,
+            "has_next": True,
+            "has_previous": False,
+            "page_size": 12,
+        },
+    }
+
+
+def test_cursor_info_round_trip_is_url_safe():
+    """CursorInfo tokens round-trip and need no URL escaping"""
+    from app.models.pagination import CursorInfo
+    info = CursorInfo(start_time="2025-08-01T20:00:00+00:00", event_id="evt/+?~1")
+    token = info.encode()
+
+    assert "=" not in token and "+" not in token and "/" not in token
+    assert CursorInfo.decode(token) == info
+
+
+def test_cursor_info_decodes_legacy_padded_cursor():
+    """Cursors issued before the URL-safe encoding still decode"""
+    import base64
+    import json
+    from app.models.pagination import CursorInfo
+    legacy = base64.b64encode(json.dumps({"startTime": None, "eventId": "e1"}).encode()).decode()
+
+    assert CursorInfo.decode(legacy) == CursorInfo(start_time=None, event_id="e1")
+
+
+@pytest.mark.parametrize("bad", ["", "not-a-cursor", "bm90IGpzb24", "WzEsMl0", "eyJzdGFydFRpbWUiOm51bGx9"])
+def test_cursor_info_decode_rejects_garbage(bad):
+    """Malformed, non-object or incomplete cursors decode to None"""
+    from app.models.pagination import CursorInfo
+    assert CursorInfo.decode(bad) is None
+
+
+def test_cursor_info_is_slotted_and_immutable():
+    """CursorInfo carries no per-instance __dict__ and can't be mutated"""
+    import dataclasses
+    from app.models.pagination import CursorInfo
+    info = CursorInfo(start_time=None, event_id="e1")
+    assert not hasattr(info, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        info.event_id = "e2"
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -125,3 +125,25 @@ def test_nearby_events_missing_city_returns_422():
 def test_nearby_events_missing_state_returns_422():
     response = client.get("/api/events/location/nearby?city=Austin&page_size=5")
     assert response.status_code == 422
+
+
+# ── /api/events/{event_id}/rsvps ───────────────────────────────────────────────
+
+def test_rsvp_list_offset_page_serialized_through_response_model():
+    """The dict-returning RSVP list keeps its shape on the response_model=dict fast path."""
+    page = {
+        "rsvps": [{"email": "a@example.com", "status": "joined"}],
+        "total_count": 1,
+        "page": 1,
+        "page_size": 10,
+    }
+    with patch(
+        "app.routes.event_routes.get_paginated_rsvp_list",
+        new_callable=AsyncMock,
+        return_value=page,
+    ):
+        response = client.get("/api/events/evt-1/rsvps?page=1")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == page
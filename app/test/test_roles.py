@@ -0,0 +1,38 @@
+"""
+Unit tests for app/auth/roles.py
+"""
+import pytest
+from fastapi import HTTPException
+
+from app.auth.roles import RoleName, admin_only, require_min_role, super_admin_only, user_only
+
+
+class TestRequireMinRole:
+
+    @pytest.mark.parametrize("dependency,role", [
+        (user_only, RoleName.USER),
+        (user_only, RoleName.SUPER_ADMIN),
+        (admin_only, RoleName.ADMIN),
+        (super_admin_only, RoleName.SUPER_ADMIN),
+    ])
+    def test_sufficient_role_passes(self, dependency, role):
+        user = {"email": "a@example.com", "role": role}
+        assert dependency(current_user=user) is user
+
+    def test_insufficient_role_forbidden_with_message(self):
+        with pytest.raises(HTTPException) as exc:
+            admin_only(current_user={"email": "a@example.com", "role": RoleName.USER})
+        assert exc.value.status_code == 403
+        assert exc.value.detail == "Admin access required"
+
+    def test_unknown_or_missing_role_treated_as_anonymous(self):
+        dependency = require_min_role(RoleName.USER)
+        for user in ({"email": "a@example.com", "role": "wizard"}, {"email": "a@example.com"}):
+            with pytest.raises(HTTPException) as exc:
+                dependency(current_user=user)
+            assert exc.value.detail == "User access required"
+
+    def test_super_admin_message(self):
+        with pytest.raises(HTTPException) as exc:
+            super_admin_only(current_user={"email": "a@example.com", "role": RoleName.ADMIN})
+        assert exc.value.detail == "Super Admin access required"
@@ -0,0 +1,50 @@
+"""
+Unit tests for the shared validators in app/models/user.py
+"""
+import pytest
+from pydantic import ValidationError
+
+from app.models.user import UserCreate, UserUpdate, _validate_birthdate, _validate_interests
+
+
+class TestValidateBirthdate:
+
+    @pytest.mark.parametrize("value", ["1990-01-31", "2000-02-29", "", None])
+    def test_accepts_valid_or_empty(self, value):
+        assert _validate_birthdate(value) == value
+
+    @pytest.mark.parametrize("value", ["2023-02-30", "1990-13-01", "1990-1-5", "19900105", "1990-01-01T00:00"])
+    def test_rejects_malformed_or_impossible_dates(self, value):
+        with pytest.raises(ValueError, match="YYYY-MM-DD"):
+            _validate_birthdate(value)
+
+    def test_model_surfaces_validation_error(self):
+        with pytest.raises(ValidationError):
+            UserUpdate(birthdate="31/01/1990")
+
+
+class TestValidateInterests:
+
+    def test_strips_and_dedupes_preserving_order(self):
+        assert _validate_interests([" music", "art", "music ", "tech", "art"]) == ["music", "art", "tech"]
+
+    def test_none_handling(self):
+        assert _validate_interests(None) == []
+        assert _validate_interests(None, allow_none=True) is None
+
+    @pytest.mark.parametrize("value", [["music", "  "], ["music", 3], "music"])
+    def test_rejects_invalid(self, value):
+        with pytest.raises(ValueError):
+            _validate_interests(value)
+
+
+class TestSharedProfileValidators:
+
+    def test_update_keeps_unset_interests_as_none(self):
+        assert UserUpdate(interests=None).interests is None
+
+    def test_create_normalises_interests_and_checks_birthdate(self):
+        user = UserCreate(name="A", email="a@example.com", password="secret1", interests=None)
+        assert user.interests == []
+        with pytest.raises(ValidationError):
+            UserCreate(name="A", email="a@example.com", password="secret1", birthdate="1990-1-1")
@@ -179,6 +179,24 @@ class TestGetByEmail:
         assert result["email"] == "alice@example.com"
         assert result["id"] == "alice@example.com"
 
+    async def test_embedding_column_only_selected_on_request(self):
+        from app.repositories.users.user_repository import UserRepository
+        session = make_mock_session()
+        mock_result = MagicMock()
+        mock_result.fetchone.return_value = None
+        session.execute = AsyncMock(return_value=mock_result)
+
+        with patch('app.repositories.users.user_repository.AsyncSessionLocal', return_value=session):
+            repo = UserRepository()
+            await repo.get_by_email("alice@example.com")
+            await repo.get_by_email("alice@example.com", include_embedding=True)
+
+        plain_sql = str(session.execute.call_args_list[0][0][0])
+        with_embedding_sql = str(session.execute.call_args_list[1][0][0])
+        assert "SELECT *" not in plain_sql
+        assert "embedding" not in plain_sql
+        assert "embedding" in with_embedding_sql
+
 
 # ─── UserRepository.update_profile_by_email ───────────────────────────────────
 
@@ -188,6 +206,7 @@ class TestUpdateProfileByEmail:
         from app.repositories.users.user_repository import UserRepository
         session = make_mock_session()
         mock_result = MagicMock()
+        mock_result.fetchone.return_value = None
         session.execute = AsyncMock(return_value=mock_result)
 
         with patch('app.repositories.users.user_repository.AsyncSessionLocal', return_value=session):
@@ -208,7 +227,9 @@ class TestUpdateProfileByEmail:
         async def capture_execute(query, params=None):
             if params:
                 captured_params.update(params)
-            return MagicMock()
+            result = MagicMock()
+            result.fetchone.return_value = None
+            return result
 
         session.execute = capture_execute
 
@@ -231,7 +252,9 @@ class TestUpdateProfileByEmail:
         async def capture_execute(query, params=None):
             if params:
                 captured_params.update(params)
-            return MagicMock()
+            result = MagicMock()
+            result.fetchone.return_value = None
+            return result
 
         session.execute = capture_execute
 
@@ -241,6 +264,29 @@ class TestUpdateProfileByEmail:
 
         assert captured_params.get("birthdate") is None
 
+    async def test_returns_none_when_user_missing(self):
+        from app.repositories.users.user_repository import UserRepository
+        session = make_mock_session()
+        mock_result = MagicMock()
+        mock_result.fetchone.return_value = None
+        session.execute = AsyncMock(return_value=mock_result)
+
+        with patch('app.repositories.users.user_repository.AsyncSessionLocal', return_value=session):
+            repo = UserRepository()
+            result = await repo.update_profile_by_email({"name": "Ghost"}, "ghost@example.com")
+
+        assert result is None
+        session.execute.assert_called_once()
+
+    async def test_database_error_propagates(self):
+        from app.repositories.users.user_repository import UserRepository
+        session = make_mock_session()
+        session.execute = AsyncMock(side_effect=RuntimeError("connection lost"))
+
+        with patch('app.repositories.users.user_repository.AsyncSessionLocal', return_value=session):
+            with pytest.raises(RuntimeError):
+                await UserRepository().update_profile_by_email({"name": "Bob"}, "bob@example.com")
+
 
 # ─── UserRepository.create_with_password ──────────────────────────────────────
 
@@ -283,6 +329,75 @@ class TestCreateWithPassword:
         session.commit.assert_called_once()
 
 
+# ─── UserRepository.store_google_user ─────────────────────────────────────────
+
+class TestStoreGoogleUser:
+
+    def _row(self, is_new: bool, name_changed: bool):
+        return _make_row({
+            "email": "g@example.com",
+            "name": "G User",
+            "birthdate": None,
+            "phone_number": None,
+            "password_hash": None,
+            "latitude": None, "longitude": None,
+            "city": None, "state": None, "country": None,
+            "formatted_address": None, "location_name": None,
+            "is_new": is_new,
+            "name_changed": name_changed,
+        })
+
+    async def _store(self, row, embed):
+        from app.repositories.users.user_repository import UserRepository
+        session = make_mock_session()
+        mock_result = MagicMock()
+        mock_result.fetchone.return_value = row
+        session.execute = AsyncMock(return_value=mock_result)
+
+        with patch('app.repositories.users.user_repository.AsyncSessionLocal', return_value=session), \
+             patch('app.services.embedding_service.generate_and_store_user_embedding', embed):
+            result = await UserRepository().store_google_user(
+                {"email": "g@example.com", "name": "G User", "uid": "sub-1"}
+            )
+        session.execute.assert_called_once()
+        return result
+
+    async def test_returns_stored_user_without_flags(self):
+        embed = AsyncMock()
+        result = await self._store(self._row(is_new=False, name_changed=False), embed)
+
+        assert result["email"] == "g@example.com"
+        assert "is_new" not in result and "name_changed" not in result
+        embed.assert_not_awaited()
+
+    async def test_new_user_gets_embedding(self):
+        embed = AsyncMock()
+        await self._store(self._row(is_new=True, name_changed=True), embed)
+        embed.assert_awaited_once()
+
+
+# ─── hash_password / check_password ───────────────────────────────────────────
+
+class TestPasswordHashing:
+
+    def test_hash_round_trips(self):
+        from app.repositories.users.user_repository import check_password, hash_password
+        hashed = hash_password("s3cret-pass")
+        assert hashed.startswith("$2b$")
+        assert check_password("s3cret-pass", hashed)
+        assert not check_password("wrong-pass", hashed)
+
+    def test_passwords_longer_than_72_bytes_are_accepted(self):
+        from app.repositories.users.user_repository import check_password, hash_password
+        long_password = "x" * 100
+        hashed = hash_password(long_password)
+        assert check_password(long_password, hashed)
+
+    def test_malformed_hash_does_not_verify(self):
+        from app.repositories.users.user_repository import check_password
+        assert check_password("anything", "$bcrypt$hash") is False
+
+
 # ─── UserRepository.search_users ──────────────────────────────────────────────
 
 class TestSearchUsers:
@@ -334,3 +449,35 @@ class TestSearchUsers:
 
         assert len(result) == 1
         assert result[0]["email"] == "alice@example.com"
+
+
+class TestGetAllUsersPaginated:
+
+    async def test_total_comes_from_window_count_in_one_query(self):
+        from app.models.pagination import PaginationParams
+        from app.repositories.users.user_repository import UserRepository
+        session = make_mock_session()
+        row = _make_row({
+            "email": "alice@example.com",
+            "name": "Alice",
+            "birthdate": None,
+            "phone_number": None,
+            "password_hash": None,
+            "latitude": None, "longitude": None,
+            "city": None, "state": None, "country": None,
+            "formatted_address": None, "location_name": None,
+            "_total": 42,
+        })
+        row._total = 42
+        mock_result = MagicMock()
+        mock_result.fetchall.return_value = [row]
+        session.execute = AsyncMock(return_value=mock_result)
+
+        with patch('app.repositories.users.user_repository.AsyncSessionLocal', return_value=session):
+            repo = UserRepository()
+            users, total = await repo.get_all_users_paginated(PaginationParams(page=2, page_size=1))
+
+        assert total == 42
+        assert "_total" not in users[0]
+        session.execute.assert_awaited_once()
+        assert "COUNT(*) OVER ()" in str(session.execute.call_args[0][0])
@@ -0,0 +1,46 @@
+"""
+Unit tests for app/services/user_service.py
+"""
+import pytest
+from unittest.mock import AsyncMock, patch
+
+pytestmark = pytest.mark.asyncio
+
+
+class TestValidateUserEmails:
+
+    async def test_single_bulk_lookup_preserves_order(self):
+        from app.services import user_service
+        found = {"a@example.com": {"email": "a@example.com"}, "c@example.com": {"email": "c@example.com"}}
+        get_by_emails = AsyncMock(return_value=found)
+        get_by_email = AsyncMock()
+
+        with patch.object(user_service.repo, "get_by_emails", get_by_emails), \
+             patch.object(user_service.repo, "get_by_email", get_by_email):
+            result = await user_service.validate_user_emails(
+                ["c@example.com", "b@example.com", "a@example.com", "c@example.com"]
+            )
+
+        assert result == {
+            "valid": ["c@example.com", "a@example.com", "c@example.com"],
+            "invalid": ["b@example.com"],
+        }
+        get_by_emails.assert_awaited_once()
+        assert sorted(get_by_emails.call_args[0][0]) == ["a@example.com", "b@example.com", "c@example.com"]
+        get_by_email.assert_not_awaited()
+
+
+class TestGetAllUsersCursorPaginated:
+
+    async def test_wraps_repo_page_in_cursor_response(self):
+        from app.models.pagination import CursorPaginationParams
+        from app.services import user_service
+        page = ([{"email": "a@example.com"}], "next-token", None, True, False)
+
+        with patch.object(user_service.repo, "get_all_users_cursor_paginated", AsyncMock(return_value=page)):
+            result = await user_service.get_all_users_cursor_paginated(CursorPaginationParams(page_size=1))
+
+        assert result.items == [{"email": "a@example.com"}]
+        assert result.pagination["next_cursor"] == "next-token"
+        assert result.pagination["has_next"] is True
+        assert result.pagination["page_size"] == 1
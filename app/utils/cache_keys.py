@@ -7,6 +7,8 @@ TTL_INGESTED_IDS = 30 * 24 * 3600    # 30 days
 TTL_INGESTION_LOCK = 3600            # 1 hour
 TTL_TM_API = 8 * 3600                # 8 hours
 TTL_EVENT_QUERY = 600                # 10 minutes
+TTL_EVENT_QUERY_LOCAL = 15           # 15 seconds (per-worker copy)
+TTL_EVENT_DETAIL_LOCAL = 30          # 30 seconds (per-worker event detail)
 TTL_EMBEDDING = 3600                 # 1 hour
 TTL_USER_LOCATIONS = 1800            # 30 minutes
 
@@ -15,6 +17,7 @@ URL_CACHE_KEY = "sahana:url_cache"
 INGESTED_IDS_KEY = "sahana:ingested_ids"
 INGESTION_LOCK_KEY = "sahana:ingestion:lock"
 USER_LOCATIONS_KEY = "sahana:user_locations"
+EVENT_QUERY_KEYS_KEY = "sahana:events:cached_keys"  # tag set of cached listing/search keys
 
 
 def _slug(value: str) -> str:
@@ -25,8 +28,11 @@ def tm_cache_key(city: str, state: str) -> str:
     return f"sahana:tm:{_slug(city)}:{_slug(state)}"
 
 
-def event_query_cache_key(cursor_params: dict, filters: dict) -> str:
-    payload = json.dumps({"cursor": cursor_params, "filters": filters}, sort_keys=True)
+def event_query_cache_key(cursor_params: dict, filters: dict, compact: bool = False) -> str:
+    key = {"cursor": cursor_params, "filters": filters}
+    if compact:
+        key["compact"] = True
+    payload = json.dumps(key, sort_keys=True)
     digest = hashlib.sha256(payload.encode()).hexdigest()[:16]
     return f"sahana:events:q:{digest}"
 
@@ -41,7 +47,10 @@ def embedding_cache_key(text: str) -> str:
     return f"sahana:emb:{digest}"
 
 
-def nearby_events_cache_key(city: str, state: str, cursor_params: dict) -> str:
-    payload = json.dumps({"city": _slug(city), "state": _slug(state), "cursor": cursor_params}, sort_keys=True)
+def nearby_events_cache_key(city: str, state: str, cursor_params: dict, compact: bool = False) -> str:
+    key = {"city": _slug(city), "state": _slug(state), "cursor": cursor_params}
+    if compact:
+        key["compact"] = True
+    payload = json.dumps(key, sort_keys=True)
     digest = hashlib.sha256(payload.encode()).hexdigest()[:16]
     return f"sahana:events:nearby:{digest}"
@@ -1,6 +1,7 @@
 import os
 import json
-from typing import Optional
+import time
+from typing import Any, Hashable, Optional
 from app.utils.cache_keys import URL_CACHE_KEY, TTL_URL_CACHE
 
 # Detect Cloud Run for file fallback path
@@ -39,3 +40,38 @@ async def save_url_cache(cache: set, redis=None) -> None:
     # File fallback
     with open(CACHE_FILE, "w", encoding="utf-8") as f:
         json.dump(list(cache), f, indent=2)
+
+
+class LocalTTLCache:
+    """Small per-process cache with a fixed TTL and size cap.
+
+    Only touched from the event loop, so it needs no locking. When full, the
+    oldest entry is evicted.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 256):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: dict = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._data.pop(key, None)
+        if len(self._data) >= self.maxsize:
+            del self._data[next(iter(self._data))]
+        self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def pop(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
@@ -1,4 +1,4 @@
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Dict, Optional
 from urllib.parse import urlparse
 from uuid import uuid4
@@ -63,7 +63,6 @@ def ticketmaster_to_sahana_format(event: Dict) -> Dict:
         "imageUrl": event.get("images", [{}])[0].get("url"),
         "createdBy": "Ticketmaster",
         "createdByEmail": "scraper@ticketmaster.com",
-        "createdAt": datetime.utcnow().isoformat(),
         "description": event.get("info") or event.get("pleaseNote") or "No description available",
         "rsvpList": [],
         "origin": "external",
@@ -201,7 +200,6 @@ def parse_eventbrite_server_data(data: dict, url: str) -> Optional[dict]:
         "imageUrl": image_url,
         "createdBy": organizer_name,
         "createdByEmail": "scraper@eventbrite.com",
-        "createdAt": datetime.now(timezone.utc).isoformat(),
         "description": description,
         "rsvpList": [],
         "origin": "external",
@@ -345,7 +343,6 @@ def parse_eventbrite_jsonld(jsonld: dict, url: str, extra_categories: list[str]
         "imageUrl": image,
         "createdBy": organizer_name,
         "createdByEmail": "scraper@eventbrite.com",
-        "createdAt": datetime.now(timezone.utc).isoformat(),
         "description": jsonld.get("description", "No description available"),
         "price": price_text,
         "rsvpList": [],
@@ -269,7 +269,7 @@ def _geocode_google_sync(address: str, api_key: str) -> Optional[Tuple[float, fl
         )
         response.raise_for_status()
         payload = response.json()
-        logger.info(f"[Geocoding][google] OK address='{address}' status={payload.get('status')}")
+        logger.debug("[Geocoding][google] OK address='%s' status=%s", address, payload.get('status'))
     except Exception as e:
         logger.warning(f"Geocoding request failed for '{address}': {e}")
         _geocode_stats["provider_failures"] += 1
@@ -338,7 +338,7 @@ def _geocode_geoapify_sync(address: str, api_key: str) -> Optional[Tuple[float,
 
     results = payload.get("results") or []
     if not results:
-        logger.info(f"[Geocoding][geoapify] no results for '{address}'")
+        logger.debug("[Geocoding][geoapify] no results for '%s'", address)
         _geocode_stats["provider_failures"] += 1
         _geocode_cache[address] = None
         return None
@@ -354,7 +354,7 @@ def _geocode_geoapify_sync(address: str, api_key: str) -> Optional[Tuple[float,
         return None
 
     _geocode_stats["provider_successes"] += 1
-    logger.info(f"[Geocoding][geoapify] success for '{address}' -> {coords}")
+    logger.debug("[Geocoding][geoapify] success for '%s' -> %s", address, coords)
     _geocode_cache[address] = coords
     return coords
 
@@ -434,7 +434,7 @@ def _geocode_nominatim_sync(address: str) -> Optional[Tuple[float, float]]:
         return None
 
     if not payload:
-        logger.info(f"[Geocoding][nominatim] no results for '{address}'")
+        logger.debug("[Geocoding][nominatim] no results for '%s'", address)
         _geocode_stats["provider_failures"] += 1
         _geocode_cache[address] = None
         return None
@@ -450,7 +450,7 @@ def _geocode_nominatim_sync(address: str) -> Optional[Tuple[float, float]]:
         return None
 
     _geocode_stats["provider_successes"] += 1
-    logger.info(f"[Geocoding][nominatim] success for '{address}' -> {coords}")
+    logger.debug("[Geocoding][nominatim] success for '%s' -> %s", address, coords)
     _geocode_cache[address] = coords
     return coords
 
@@ -7,6 +7,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from app.config import LOG_LEVEL
+
 class SahanaLogFilter(logging.Filter):
     """Filter to add default values for custom log record attributes"""
     
@@ -138,19 +140,24 @@ def log_request(logger: logging.Logger, method: str, path: str, user_id: Optiona
     if request_id:
         extra['request_id'] = request_id
     
-    logger.info(f"API Request: {method} {path}", extra=extra)
+    logger.info("API Request: %s %s", method, path, extra=extra)
 
 def log_database_operation(logger: logging.Logger, operation: str, collection: str, doc_id: Optional[str] = None, user_email: Optional[str] = None):
     """Log database operations with context"""
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     extra = {}
     if user_email:
         extra['user_email'] = user_email
     
     doc_info = f" (doc: {doc_id})" if doc_id else ""
-    logger.debug(f"DB Operation: {operation} on {collection}{doc_info}", extra=extra)
+    logger.debug("DB Operation: %s on %s%s", operation, collection, doc_info, extra=extra)
 
 def log_service_call(logger: logging.Logger, service_method: str, args: Optional[dict] = None, user_email: Optional[str] = None):
     """Log service method calls with parameters"""
+    # Redacting the args costs a dict walk — skip it unless DEBUG is on
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     extra = {}
     if user_email:
         extra['user_email'] = user_email
@@ -165,7 +172,7 @@ def log_service_call(logger: logging.Logger, service_method: str, args: Optional
                 safe_args[key] = value
     
     args_info = f" with args: {safe_args}" if safe_args else ""
-    logger.debug(f"Service call: {service_method}{args_info}", extra=extra)
+    logger.debug("Service call: %s%s", service_method, args_info, extra=extra)
 
 def log_error_with_context(logger: logging.Logger, error: Exception, context: dict, user_email: Optional[str] = None):
     """Log errors with additional context and user information"""
@@ -190,7 +197,7 @@ def log_auth_event(logger: logging.Logger, event_type: str, user_email: Optional
         extra['user_email'] = user_email
     
     detail_str = f" | Details: {details}" if details else ""
-    logger.info(f"Auth Event: {event_type}{detail_str}", extra=extra)
+    logger.info("Auth Event: %s%s", event_type, detail_str, extra=extra)
 
 def log_performance(logger: logging.Logger, operation: str, duration_ms: float, user_email: Optional[str] = None):
     """Log performance metrics"""
@@ -198,21 +205,22 @@ def log_performance(logger: logging.Logger, operation: str, duration_ms: float,
     if user_email:
         extra['user_email'] = user_email
     
-    logger.info(f"Performance: {operation} took {duration_ms:.2f}ms", extra=extra)
+    logger.info("Performance: %s took %.2fms", operation, duration_ms, extra=extra)
 
 def log_jwt_payload(logger: logging.Logger, payload: dict, action: str = "JWT_DECODED"):
     """Log JWT payload information safely"""
-    # Create a safe version of the payload for logging
-    safe_payload = {
-        'email': payload.get('data', {}).get('email', 'unknown'),
-        'role': payload.get('data', {}).get('role', 'unknown'),
-        'exp': payload.get('exp', 'unknown'),
-        'action': action
-    }
-    
-    extra = {'user_email': safe_payload['email']}
-    logger.debug(f"JWT {action}: user={safe_payload['email']}, role={safe_payload['role']}, exp={safe_payload['exp']}", extra=extra)
+    # Runs on every authenticated request — skip building the record unless DEBUG is on
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    data = payload.get('data', {})
+    email = data.get('email', 'unknown')
+    logger.debug(
+        "JWT %s: user=%s, role=%s, exp=%s",
+        action, email, data.get('role', 'unknown'), payload.get('exp', 'unknown'),
+        extra={'user_email': email},
+    )
 
-# Initialize default logging on import (for development)
+# Initialize default logging on import; LOG_LEVEL=WARNING in production drops
+# the per-request debug/info records before they are formatted
 if __name__ != "__main__":
-    setup_logging(level="INFO", console=True)
+    setup_logging(level=LOG_LEVEL, console=True)
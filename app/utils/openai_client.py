@@ -0,0 +1,31 @@
+"""
+Process-wide AsyncOpenAI client.
+
+Search, embeddings and user discovery all talk to OpenAI; sharing one client
+means one HTTP connection pool (and warm TLS sessions) for the whole worker
+instead of one per service module.
+"""
+import os
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
+_client: Optional["AsyncOpenAI"] = None
+
+
+def get_openai_client() -> Optional["AsyncOpenAI"]:
+    """Return the shared client, or None when OPENAI_API_KEY is not set.
+
+    openai is by far the heaviest import in the app (~0.5s), so it is imported
+    on first use rather than at startup. Raises ImportError if the package
+    is missing.
+    """
+    global _client
+    if _client is None:
+        key = os.getenv("OPENAI_API_KEY")
+        if not key:
+            return None
+        from openai import AsyncOpenAI
+        _client = AsyncOpenAI(api_key=key)
+    return _client
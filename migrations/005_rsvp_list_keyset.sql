@@ -0,0 +1,8 @@
+-- Migration: 005_rsvp_list_keyset
+-- Backs the keyset-paginated RSVP list (GET /events/{event_id}/rsvps/cursor):
+--   WHERE event_id = ? AND (updated_at, user_email) < (?, ?)
+--   ORDER BY updated_at DESC, user_email DESC
+-- so every page is a short index range scan instead of an OFFSET skip.
+
+CREATE INDEX IF NOT EXISTS idx_rsvps_event_updated
+ON rsvps (event_id, updated_at DESC, user_email DESC);
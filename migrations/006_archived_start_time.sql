@@ -0,0 +1,8 @@
+-- Migration: 006_archived_start_time
+-- Backs the old-event cleanup (purge_archived_events(), see 008):
+--   WHERE is_archived = TRUE AND start_time < ?
+-- Without it each batch scans every archived event to find the stale ones.
+
+CREATE INDEX IF NOT EXISTS idx_events_archived_start_time
+ON events (start_time)
+WHERE is_archived = TRUE;
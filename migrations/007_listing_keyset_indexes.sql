@@ -0,0 +1,31 @@
+-- Migration: 007_listing_keyset_indexes
+-- Composite indexes matching each keyset-paginated listing exactly:
+-- equality columns first, then the ORDER BY (start_time, event_id) pair, so a
+-- page is one ordered index range scan with no sort and no tie-break step.
+
+-- 1. get_all_events_paginated / stream of all events:
+--    WHERE is_archived = FALSE ORDER BY start_time, event_id
+CREATE INDEX IF NOT EXISTS idx_events_active_start_event
+ON events (start_time ASC NULLS LAST, event_id ASC)
+WHERE is_archived = FALSE;
+
+-- 2. get_nearby_events_paginated, get_external_events(_paginated):
+--    WHERE is_archived = FALSE AND LOWER(city) = ? AND LOWER(state) = ?
+--    ORDER BY start_time, event_id
+CREATE INDEX IF NOT EXISTS idx_events_active_city_state_start
+ON events (LOWER(city), LOWER(state), start_time ASC NULLS LAST, event_id ASC)
+WHERE is_archived = FALSE;
+
+-- 3. get_events_by_creator(_paginated):
+--    WHERE is_archived = FALSE AND created_by_email = ? ORDER BY start_time, event_id
+CREATE INDEX IF NOT EXISTS idx_events_creator_start_event
+ON events (created_by_email, start_time ASC NULLS LAST, event_id ASC)
+WHERE is_archived = FALSE;
+
+-- 4. get_events_organized_by_user / get_events_moderated_by_user join from the
+--    user's email; the (event_id, user_email) primary keys can't serve that.
+CREATE INDEX IF NOT EXISTS idx_event_organizers_user
+ON event_organizers (user_email, event_id);
+
+CREATE INDEX IF NOT EXISTS idx_event_moderators_user
+ON event_moderators (user_email, event_id);
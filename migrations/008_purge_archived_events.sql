@@ -0,0 +1,36 @@
+-- Migration: 008_purge_archived_events
+-- Old archived events expire inside the database instead of via an app-side
+-- cron. Postgres has no TTL policy, so the expiry rule lives in one function:
+-- archived events that started before today (UTC) are deleted, at most
+-- batch_size rows per call (NULL = no limit). It is served by
+-- idx_events_archived_start_time from 006.
+--
+-- The nightly run is scheduled with pg_cron where that extension is
+-- installed. The admin purge endpoint calls the same function in batches.
+
+CREATE OR REPLACE FUNCTION purge_archived_events(batch_size INT DEFAULT NULL)
+RETURNS INT
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    deleted INT;
+BEGIN
+    DELETE FROM events
+    WHERE event_id IN (
+        SELECT event_id FROM events
+        WHERE is_archived = TRUE
+          AND start_time < date_trunc('day', NOW() AT TIME ZONE 'UTC') AT TIME ZONE 'UTC'
+        LIMIT batch_size
+    );
+    GET DIAGNOSTICS deleted = ROW_COUNT;
+    RETURN deleted;
+END;
+$$;
+
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+        PERFORM cron.schedule('purge-archived-events', '15 3 * * *', 'SELECT purge_archived_events()');
+    END IF;
+END;
+$$;
@@ -0,0 +1,14 @@
+-- Migration: 009_archived_keyset
+-- Keyset indexes for the archived listings (get_archived_events_paginated):
+--   WHERE is_archived = TRUE [AND created_by_email = ?]
+--   ORDER BY archived_at DESC NULLS LAST, event_id ASC
+-- idx_events_archived_at (003) has no event_id tie-break and no creator
+-- column, so a page under either filter still needed a sort.
+
+CREATE INDEX IF NOT EXISTS idx_events_archived_at_event
+ON events (archived_at DESC NULLS LAST, event_id ASC)
+WHERE is_archived = TRUE;
+
+CREATE INDEX IF NOT EXISTS idx_events_creator_archived_at_event
+ON events (created_by_email, archived_at DESC NULLS LAST, event_id ASC)
+WHERE is_archived = TRUE;
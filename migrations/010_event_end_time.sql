@@ -0,0 +1,30 @@
+-- Migration: 010_event_end_time
+-- Store each event's end time so "has it ended?" is an indexed range scan
+-- instead of start_time + duration evaluated row by row. Duration is in
+-- minutes (app/utils/event_parser.py).
+--
+-- timestamptz + interval isn't immutable, so like search_vector (003) this is
+-- a regular column kept current by a BEFORE INSERT OR UPDATE trigger rather
+-- than a generated column.
+
+ALTER TABLE events ADD COLUMN IF NOT EXISTS end_time TIMESTAMPTZ;
+
+CREATE OR REPLACE FUNCTION events_end_time_update() RETURNS TRIGGER AS $$
+BEGIN
+    NEW.end_time := NEW.start_time + COALESCE(NEW.duration, 0) * interval '1 minute';
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS events_end_time_trigger ON events;
+CREATE TRIGGER events_end_time_trigger
+BEFORE INSERT OR UPDATE OF start_time, duration ON events
+FOR EACH ROW EXECUTE FUNCTION events_end_time_update();
+
+-- Backfill existing rows
+UPDATE events SET end_time = start_time + COALESCE(duration, 0) * interval '1 minute';
+
+-- Past-event archiving: WHERE is_archived = FALSE AND end_time < NOW()
+CREATE INDEX IF NOT EXISTS idx_events_active_end_time
+ON events (end_time)
+WHERE is_archived = FALSE;
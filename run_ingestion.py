@@ -1,18 +1,20 @@
 import asyncio
-from dotenv import load_dotenv
 
 # Load local env vars (ignored on Cloud Run if using Secret Manager)
-load_dotenv()
+from app import config  # noqa: F401 -- imported for its load_dotenv() side effect
 
+from app.utils.logger import get_logger
 from app.utils.redis_client import init_redis, close_redis
 from app.services.event_ingestion_service import ingest_ticketmaster_events_for_all_cities
 
+logger = get_logger("run_ingestion")
+
 
 async def main():
     await init_redis()
     try:
         result = await ingest_ticketmaster_events_for_all_cities()
-        print(result)
+        logger.info("Ingestion finished: %s", result)
     finally:
         await close_redis()
 
@@ -1,23 +1,32 @@
 """
 Script to find and delete all non-archived events with startTime == None (null) for data sanitization.
+
+One DELETE ... RETURNING does the whole job: no loading every event to filter
+in Python, and no per-event delete that looks the row up again by eventId.
 """
 import asyncio
-from app.repositories.events.event_repository_manager import EventRepositoryManager
+import sys
+import os
+
+# Allow running from repo root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.db.session import AsyncSessionLocal
 
 
 async def main():
-    repo = EventRepositoryManager()
-    all_events = await repo.get_all_events()
-    to_delete = [e for e in all_events if e.get('startTime') is None]
-    print(f"Found {len(to_delete)} non-archived events with startTime=None.")
-    for e in to_delete:
-        event_id = e.get('eventId')
-        if event_id is not None:
-            print(f"Deleting eventId: {event_id} | title: {e.get('title')}")
-            await repo.delete_event(event_id)
-        else:
-            print(f"Skipping event with missing eventId | title: {e.get('title')}")
-    print("Done deleting events with null startTime.")
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(text("""
+            DELETE FROM events
+            WHERE is_archived = FALSE AND start_time IS NULL
+            RETURNING event_id, event_name
+        """))
+        deleted = result.fetchall()
+        await session.commit()
+    for row in deleted:
+        print(f"Deleted eventId: {row.event_id} | title: {row.event_name}")
+    print(f"Done deleting {len(deleted)} non-archived events with null startTime.")
 
 
 if __name__ == "__main__":
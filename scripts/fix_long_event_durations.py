@@ -1,28 +1,40 @@
 """
 Script to find and fix events with abnormally long durations (> 14 days / 20160 minutes).
 Sets duration to 120 minutes if it is negative or > 20160.
+
+One UPDATE ... RETURNING fixes every affected row in place, instead of
+loading every event and re-resolving each one by eventId to update it.
 """
 import asyncio
-from app.repositories.events.event_repository_manager import EventRepositoryManager
+import sys
+import os
+
+# Allow running from repo root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.db.session import AsyncSessionLocal
 
 MAX_DURATION = 20160  # 14 days in minutes
 DEFAULT_DURATION = 120
 
 
 async def main():
-    repo = EventRepositoryManager()
-    all_events = await repo.get_all_events()
-    to_fix = [e for e in all_events if e.get('duration', 0) > MAX_DURATION or e.get('duration', 0) <= 0]
-    print(f"Found {len(to_fix)} events with abnormal duration.")
-    for e in to_fix:
-        event_id = e.get('eventId')
-        old_duration = e.get('duration')
-        if event_id is not None:
-            print(f"Fixing eventId: {event_id} | title: {e.get('title')} | old duration: {old_duration}")
-            await repo.update_event(event_id, {"duration": DEFAULT_DURATION})
-        else:
-            print(f"Skipping event with missing eventId | title: {e.get('title')}")
-    print("Done fixing event durations.")
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(text("""
+            UPDATE events AS e
+            SET duration = :default_duration, updated_at = NOW()
+            FROM events AS old
+            WHERE e.event_id = old.event_id
+              AND e.is_archived = FALSE
+              AND (e.duration > :max_duration OR e.duration <= 0)
+            RETURNING e.event_id, e.event_name, old.duration AS old_duration
+        """), {"default_duration": DEFAULT_DURATION, "max_duration": MAX_DURATION})
+        fixed = result.fetchall()
+        await session.commit()
+    for row in fixed:
+        print(f"Fixed eventId: {row.event_id} | title: {row.event_name} | old duration: {row.old_duration}")
+    print(f"Done fixing {len(fixed)} event durations.")
 
 
 if __name__ == "__main__":